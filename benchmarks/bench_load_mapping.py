@@ -0,0 +1,110 @@
+'''
+This module benchmarks the mapping of point and distributed loads onto
+the nodes and elements of a BeamModel against the original loop-based
+implementation.
+
+Run from the repository root:
+
+    python benchmarks/bench_load_mapping.py
+'''
+import os
+import sys
+import time
+
+import numpy as np
+from steelpy import aisc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from pondpy import (
+    Beam,
+    BeamModel,
+    DistLoad,
+    PointLoad,
+    SteelBeamSize,
+)
+
+def loop_set_dload_elems(model):
+    '''
+    Loop-based mapping of distributed loads onto model elements, as
+    implemented prior to the array-backed mapping.
+    '''
+    elem_dload = [[[0, 0], [0, 0], [0, 0]] for _ in range(len(model.elem_nodes))]
+    for idx, elem in enumerate(model.elem_nodes):
+        for dload in model.beam.dloads:
+            m = []
+            b = []
+            for dir in dload.magnitude:
+                m.append((dir[1]-dir[0])/(dload.location[1]-dload.location[0]))
+                b.append(dir[0])
+            if (dload.location[0] <= model.model_nodes[elem[0]]+model.node_tolerance and
+                    dload.location[1] >= model.model_nodes[elem[1]]-model.node_tolerance):
+                for idx2, _ in enumerate(elem_dload[idx]):
+                    elem_dload[idx][idx2][0] += m[idx2]*(model.model_nodes[elem[0]]-dload.location[0])+b[idx2]
+                    elem_dload[idx][idx2][1] += m[idx2]*(model.model_nodes[elem[1]]-dload.location[0])+b[idx2]
+
+    return elem_dload
+
+def loop_set_pload_nodes(model):
+    '''
+    Loop-based mapping of point loads onto model nodes, as implemented
+    prior to the array-backed mapping.
+    '''
+    node_pload = [[0, 0, 0] for _ in range(len(model.model_nodes))]
+    for idx, node in enumerate(model.model_nodes):
+        for pload in model.beam.ploads:
+            if pload.location == node:
+                for idx2, _ in enumerate(node_pload[idx]):
+                    node_pload[idx][idx2] += pload.magnitude[idx2]
+
+    return node_pload
+
+def time_call(func, n_repeat=3):
+    '''
+    Returns the best wall time of n_repeat calls to func.
+    '''
+    best = np.inf
+    for _ in range(n_repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter()-start)
+
+    return best
+
+def run_benchmark(n_elem):
+    '''
+    Builds a beam with one trapezoidal load per element (as created by the
+    ponding analysis) plus a point load at every tenth node and compares
+    the loop-based and array-backed load mapping.
+    '''
+    length = 60*12
+    spacing = length/n_elem
+    beam = Beam(
+        length=length,
+        size=SteelBeamSize('W16X26', aisc.W_shapes.W16X26),
+        supports=[(0, (1, 1, 0)), (length, (1, 1, 0))],
+        ploads=[],
+        dloads=[],
+    )
+    model = BeamModel(beam, max_node_spacing=spacing)
+
+    nodes = model.model_nodes
+    dloads = [DistLoad(location=(nodes[i], nodes[i+1]), magnitude=((0, 0), (-0.01*i, -0.01*(i+1)), (0, 0))) for i in range(len(nodes)-1)]
+    dloads.append(DistLoad(location=(0, length), magnitude=((0, 0), (-0.1, -0.1), (0, 0))))
+    ploads = [PointLoad(location=nodes[i], magnitude=(0, -1.0, 0)) for i in range(0, len(nodes), 10)]
+    model.update_loads(ploads=ploads, dloads=dloads)
+
+    t_loop = time_call(lambda: (loop_set_dload_elems(model), loop_set_pload_nodes(model)), n_repeat=1)
+    t_array = time_call(lambda: (model._set_dload_elems(), model._set_pload_nodes()))
+
+    max_diff = max(
+        np.max(np.abs(np.array(loop_set_dload_elems(model)) - model.elem_dload)),
+        np.max(np.abs(np.array(loop_set_pload_nodes(model)) - model.node_pload)),
+    )
+
+    print(f'{len(model.elem_nodes):>8d} | {t_loop:>10.4f} | {t_array:>10.5f} | {t_loop/t_array:>8.0f}x | {max_diff:.1e}')
+
+if __name__ == '__main__':
+    print('Elements |   Loop (s) |  Array (s) |  Speedup | Max diff')
+    for n_elem in [250, 1000, 2000]:
+        run_benchmark(n_elem)
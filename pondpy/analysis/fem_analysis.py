@@ -1,14 +1,29 @@
 import joistpy
-import math
 import matplotlib
 import matplotlib.pyplot as plt
 import numpy as np
 import steelpy
+from scipy import linalg, sparse
+from scipy.sparse import linalg as sparse_linalg
 
 from pondpy import SteelBeamDesign, SteelJoistDesign
+from .helpers.banded_matrix import get_half_bandwidth, sparse_to_banded
+from .helpers.element_stiffness import get_element_stiffness
+from .helpers.kernels import NUMBA_AVAILABLE, bmd_values, node_fef, sfd_values, stiffness_triplets
+from .helpers.fixed_end_forces import fixed_end_deflection, linear_load_moment, partial_trapezoidal_fef, trapezoidal_fef
+from .helpers.mesh_generation import find_nodes, subdivide_segments, unique_with_tolerance
+from .helpers.simply_supported import simply_supported_displacements
 
 beam_section_types = ['AISC']
 joist_section_types = ['SJI']
+backend_types = ['auto', 'numpy', 'numba']
+element_types = ['standard', 'exact']
+precision_types = ['float64', 'float32']
+solver_types = ['auto', 'dense', 'banded', 'analytical']
+
+BANDED_DOF_THRESHOLD = 150 # Number of dof above which the 'auto' solver uses banded storage
+REFINEMENT_MAX_ITER = 100 # Maximum number of iterative refinement steps for reduced precision solutions
+REFINEMENT_TOL = 1e-10 # Relative residual at which iterative refinement stops
 
 class AnalysisError(Exception):
     pass
@@ -125,16 +140,16 @@ class Beam:
 
     Attributes
     ----------
-    dloads : list
-        list of dist load objects
+    dloads : list or numpy array
+        list of dist load objects or structured array with dtype DistLoad.array_dtype
     length : float
         length of the beam
     size : steel beam size object
         steel beam size object for the beam
     supports : list
         list of tuples indicating location and type of beam supports
-    ploads : list
-        list of point load objects
+    ploads : list or numpy array
+        list of point load objects or structured array with dtype PointLoad.array_dtype
     '''
     def __init__(self, length, size, supports, ploads=[], dloads=[]):
         '''
@@ -142,25 +157,25 @@ class Beam:
 
         Parameters
         ----------
-        dloads : list, optional
-            list of dist load objects
+        dloads : list or numpy array, optional
+            list of dist load objects or structured array with dtype DistLoad.array_dtype
         length : float
             length of the beam
         size : steel beam size object
             steel beam size object for the beam
         supports : list
             list of tuples indicating location and type of beam supports
-        ploads : list, optional
-            list of point load objects
+        ploads : list or numpy array, optional
+            list of point load objects or structured array with dtype PointLoad.array_dtype
         '''
         if not isinstance(length, (int, float)):
             raise TypeError('length must be int or float.')
         if not isinstance(size, (SteelBeamSize, SteelJoistSize)):
             raise TypeError('size must be a valid SteelBeamSize or SteelJoistSize object.')
-        if not isinstance(ploads, list):
-            raise TypeError('ploads must be a list of DistLoad objects or empty list.')
-        if not isinstance(dloads, list):
-            raise TypeError('dloads must be a list of PointLoad objects or empty list.')
+        if not isinstance(ploads, list) and not _is_load_array(ploads, PointLoad.array_dtype):
+            raise TypeError('ploads must be a list of PointLoad objects, a PointLoad structured array, or empty list.')
+        if not isinstance(dloads, list) and not _is_load_array(dloads, DistLoad.array_dtype):
+            raise TypeError('dloads must be a list of DistLoad objects, a DistLoad structured array, or empty list.')
         if not isinstance(supports, list):
             raise TypeError('supports must be a list of tuples of tuples indicating location and type of support.')
         
@@ -193,50 +208,94 @@ class BeamModel:
         bool indicating whether the analysis has been performed and is complete
     analysis_ready : bool
         bool indicating whether the analysis has been initialized and is ready to be performed
+    axial_dofs : numpy array
+        numpy array of the (zero-based) global dof numbers of the axial dof in the model
+    axial_factor : tuple
+        tuple containing the solver type and the factorization of the axial block of the global stiffness
+        matrix in planar bending mode (None until axial loads are applied)
+    backend : str
+        implementation of the fixed end force, assembly, and diagram kernels ('auto', 'numpy', or 'numba')
     beam : beam object
         beam object to be analyzed
+    bending_dofs : numpy array
+        numpy array of the (zero-based) global dof numbers of the transverse and rotational dof in the model
+    dload_segments : numpy array
+        numpy array of shape (n_segments, 5) representing each part of a transverse distributed load acting on an element,
+        as [element, start, end, load at start, load at end] with start and end measured from end i of the element
     dof_num : list
         list of lists representing the degrees of freedom for each node in the model
-    elem_dload : list
-        list of lists representing the distributed load acting on each element in the model
-    elem_loads : list
-        list of lists representing the fixed end forces in each direction at each end of each element
-    elem_nodes : list
-        list of lists representing the node number at each end of each element in the model
+    elem_dload : numpy array
+        numpy array of shape (n_elem, 3, 2) representing the distributed load in each direction at each end of each element
+        (standard elements only)
+    element_type : str
+        formulation of the distributed loads on the elements ('standard' or 'exact')
+    elem_dofs : numpy array
+        numpy array representing the global dof number of each local dof for each element (0 = restrained)
+    elem_loads : numpy array
+        numpy array of shape (n_elem, 6) representing the fixed end forces in each direction at each end of each element
+    elem_stiffness_index : numpy array
+        numpy array of the index into unique_stiffness_matrices for each element in the model
+    elem_nodes : numpy array
+        numpy array of shape (n_elem, 2) representing the node number at each end of each element in the model
     element_forces : numpy array
-        numpy array representing the forces at each end of each element
+        numpy array representing the forces at each end of each element (None in low memory mode, see get_element_forces())
         * analysis must be performed to access this attribute
     fef_load_vector : numpy array
         numpy array represengting the fixed end forces calculated from the dist loads at each node in the model
     global_displacement : numpy array
         numpy array representing the global displacement at each global degree of freedom
+    global_stiffness : numpy array
+        dense copy of global_stiffness_csr, built only when accessed (None when global_stiffness_csr is None)
     global_stiffness_matrix : numpy array
         numpy array representing the global stiffness matrix for the model
+    global_stiffness_csr : scipy sparse matrix
+        global stiffness matrix for the model stored in compressed sparse row format (None when the analytical
+        solver is used, until axial loads are applied)
     ini_analysis : bool
         indicates whether or not to initialize analysis upon instantiation
+    low_memory : bool
+        indicates whether only the stiffness factorization and the support node reactions are kept
     local_stiffness_matrices : list
-        list of numpy arrays representing the local stiffness matrix for each element in the model
+        list of read-only numpy arrays representing the local stiffness matrix for each element in the model;
+        identical elements (and identical elements of other models) share the same cached array
     max_node_spacing : float
         maximum node spacing along the length of the beam model
-    model_nodes : list
-        list of locations of the nodes along the length of the beam model
+    model_nodes : numpy array
+        sorted numpy array of locations of the nodes along the length of the beam model
     n_dof : int
         number of degrees of freedom in the model
+    solver : str
+        linear solver used to compute the global displacements ('auto', 'dense', 'banded', or 'analytical')
+    stiffness_factor : tuple
+        tuple containing the solver type and the cached factorization of the global stiffness matrix (of its
+        bending block only in planar bending mode), reused for every solve until the mesh, section, or supports change
     nodal_load_vector : numpy array
         numpy array containing the applied nodal loads at each node in the model
-    node_elem_fef : list
-        list of lists representing the fixed end forces at each node in the model
-    node_pload : list
-        list of lists representing the point loads at each node in the model
+    node_tolerance : float
+        distance within which points along the beam are treated as the same node
+    node_elem_fef : numpy array
+        numpy array of shape (n_nodes, 3) representing the fixed end forces at each node in the model
+    node_pload : numpy array
+        numpy array of shape (n_nodes, 3) representing the point loads at each node in the model
     node_support : list
         list of lists representing the support type at each node in the model
+    planar_bending : bool
+        indicates whether the uncoupled axial dof are solved separately from the bending dof
     points_of_interest : list
         list representing points of interest along the length of the beam for use in creating nodes
+    precision : str
+        floating point precision of the stiffness matrices, factorizations, displacements, and forces ('float64' or 'float32')
+    refined_node_spacing : float
+        maximum node spacing within the mesh refinement zones (None if the mesh is not refined)
+    refinement_zones : list
+        list of tuples indicating the start and end of each mesh refinement zone
     support_nodes : list
         list containing the node number of all support nodes in the model
     support_reactions : numpy array
-        numpy array representing the support reaction at each node in the model
+        numpy array representing the support reaction at each node in the model (at each support node only in low memory mode)
         * analysis must be performed to access this attribute
+    unique_stiffness_matrices : numpy array
+        numpy array of shape (n_unique, 6, 6) representing the local stiffness matrix of each unique element in the model
 
     Methods
     -------
@@ -244,9 +303,21 @@ class BeamModel:
         Adds a distributed load to the Beam object referenced by the BeamModel object.
     add_beam_pload(pload, add_type='add')
         Adds a point load to the Beam object referenced by the BeamModel object.
+    get_deflection(location):
+        Returns the vertical deflection of the analyzed beam at the specified location(s).
+    get_element_forces():
+        Returns the forces at each end of each element of the analyzed beam.
+    get_load_case(ploads=None, dloads=None):
+        Builds the global load vector and element fixed end forces for a set of loads on the current mesh.
+    get_moment(location):
+        Returns the bending moment in the analyzed beam at the specified location(s).
+    get_node_index(location):
+        Returns the number of the model node at the specified location.
+    get_support_reactions():
+        Returns the support reaction at each support node of the analyzed beam.
     initialize_analysis():
         Prepares the model for analysis. To be called at instantiation and when the user specifies.
-    perform_analysis():
+    perform_analysis(refine=False):
         Computes the displacement vector, element force matrix, and support reaction vector.
     plot_bmd():
         Plots the bending moment diagram of the analyzed beam.
@@ -254,47 +325,122 @@ class BeamModel:
         Plots the deflected shape of the analyzed beam.
     plot_sfd():
         Plots the shear force diagram of the analyzed beam.
+    set_mesh_refinement(zones, node_spacing):
+        Refines the mesh within the specified zones and re-meshes the model.
+    solve_load_cases(load_vectors, elem_loads=None):
+        Solves several load cases against a single factorization of the global stiffness matrix.
+    update_loads(ploads=None, dloads=None):
+        Replaces the loads on the beam and updates the analysis without re-meshing when possible.
     '''
-    def __init__(self, beam, max_node_spacing=6, ini_analysis=True):
+    def __init__(self, beam, max_node_spacing=6, ini_analysis=True, solver='auto', node_tolerance=1e-6, low_memory=False, element_type='standard', planar_bending=True, backend='auto', precision='float64'):
         '''
         Constructs all the necessary attributes for the beam model object.
 
         Parameters
         ----------
+        backend : str, optional
+            implementation of the fixed end force, assembly, and diagram kernels. 'numpy' uses
+            vectorized NumPy, 'numba' uses compiled loops (requires numba), and 'auto' uses numba
+            when it is installed
         beam : beam object
             beam object to be analyzed
+        element_type : str, optional
+            formulation of the distributed loads on the elements. 'standard' places a node at the
+            ends of each distributed load and treats the load as linear within each element, while
+            'exact' integrates each distributed load exactly within the elements it overlaps, so
+            distributed loads do not add nodes and coarser meshes can be used
         ini_analysis : bool, optional
             indicates whether or not to initialize analysis upon instantiation
+        low_memory : bool, optional
+            indicates whether to keep only the factorization of the global stiffness matrix and
+            the reactions at the support nodes, computing element forces on request
         max_node_spacing : int or float, optional
             maximum node spacing along the length of the beam model
+        node_tolerance : int or float, optional
+            distance within which points along the beam are treated as the same node
+        planar_bending : bool, optional
+            indicates whether to solve the uncoupled axial dof separately from the bending dof,
+            skipping them entirely when there are no axial loads
+        precision : str, optional
+            floating point precision of the stiffness matrices, factorizations, displacements, and
+            forces. 'float32' halves their memory use at reduced accuracy; perform_analysis(refine=True)
+            recovers float64 accuracy
+        solver : str, optional
+            linear solver used to compute the global displacements. 'dense' uses a
+            general dense solve, 'banded' uses a banded Cholesky solve, and 'analytical'
+            uses a closed-form solution for simply supported beams without assembling the
+            global stiffness matrix. 'auto' uses the analytical solution for simply supported
+            beams and otherwise the banded solve when the model has more than
+            BANDED_DOF_THRESHOLD dof
         '''
         if not isinstance(beam, Beam):
             raise TypeError('beam must be a valid Beam object.')
+        if not isinstance(backend, str) or backend not in backend_types:
+            raise TypeError('backend must be a string. Options are: auto, numpy, numba.')
+        if backend == 'numba' and not NUMBA_AVAILABLE:
+            raise ImportError('numba must be installed to use the numba backend.')
+        if not isinstance(element_type, str) or element_type not in element_types:
+            raise TypeError('element_type must be a string. Options are: standard, exact.')
         if not isinstance(ini_analysis, bool):
             raise TypeError('ini_analysis must be either True or False')
+        if not isinstance(low_memory, bool):
+            raise TypeError('low_memory must be either True or False')
         if not isinstance(max_node_spacing, (int, float)):
             raise TypeError('max_node_spacing must be int or float')
-
+        if not isinstance(solver, str) or solver not in solver_types:
+            raise TypeError('solver must be a string. Options are: auto, dense, banded, analytical.')
+        if not isinstance(node_tolerance, (int, float)) or node_tolerance < 0:
+            raise TypeError('node_tolerance must be a non-negative int or float')
+        if not isinstance(planar_bending, bool):
+            raise TypeError('planar_bending must be either True or False')
+        if not isinstance(precision, str) or precision not in precision_types:
+            raise TypeError('precision must be a string. Options are: float64, float32.')
+
+        self.backend = backend
         self.beam = beam
+        self.element_type = element_type
         self.ini_analysis = ini_analysis
+        self.low_memory = low_memory
         self.max_node_spacing = max_node_spacing
+        self.node_tolerance = node_tolerance
+        self.planar_bending = planar_bending
+        self.precision = precision
+        self.refined_node_spacing = None
+        self.refinement_zones = []
+        self.solver = solver
+        self.axial_factor = None
+        self.stiffness_factor = None
+        self._dense_stiffness = (None, None)
+        self._stiffness_key = None
+        self._support_key = None
 
         if self.ini_analysis:
             self.initialize_analysis()
-            self.global_displacement = np.zeros((self.n_dof, 1))
-            self.global_stiffness_matrix = np.zeros((self.n_dof, self.n_dof))
-            self.element_forces = np.zeros((len(self.elem_nodes), 6))
-            self.support_reactions = np.zeros((len(self.model_nodes), 3))
+            self.global_displacement = np.zeros((self.n_dof, 1), dtype=self.precision)
+            if self.low_memory:
+                self.global_stiffness_matrix = np.empty([0, 0])
+                self.element_forces = None
+                self.support_reactions = np.zeros((len(self.support_nodes), 3), dtype=self.precision)
+            else:
+                self.global_stiffness_matrix = np.zeros((self.n_dof, self.n_dof))
+                self.element_forces = np.zeros((len(self.elem_nodes), 6), dtype=self.precision)
+                self.support_reactions = np.zeros((len(self.model_nodes), 3), dtype=self.precision)
         else:
             self.analysis_complete = False
             self.analysis_ready = False
+            self.axial_dofs = np.empty([0], dtype=int)
+            self.bending_dofs = np.empty([0], dtype=int)
+            self.dload_segments = np.empty([0, 5])
             self.dof_num = []
             self.elem_dload = []
+            self.elem_dofs = np.empty([0, 6], dtype=int)
             self.elem_loads = []
             self.elem_nodes = []
+            self.elem_stiffness_index = np.empty([0], dtype=int)
             self.element_forces = np.empty([0, 0])
             self.fef_load_vector = np.empty([0, 0])
             self.global_displacement = np.empty([0, 0])
+            self.global_stiffness_csr = sparse.csr_matrix((0, 0))
             self.global_stiffness_matrix = np.empty([0, 0])
             self.local_stiffness_matrices = []
             self.model_nodes = []
@@ -306,11 +452,41 @@ class BeamModel:
             self.points_of_interest = []
             self.support_nodes = []
             self.support_reactions = np.empty([0, 0])
+            self.unique_stiffness_matrices = np.empty([0, 6, 6])
+
+    @property
+    def global_stiffness(self):
+        '''
+        Returns a dense copy of the global stiffness matrix. The copy is built from global_stiffness_csr
+        on first access and kept until the stiffness matrix is re-assembled.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        global_stiffness : numpy array
+            numpy array of shape (n_dof, n_dof) representing the global stiffness matrix (None if the
+            global stiffness matrix has not been assembled)
+        '''
+        if self.global_stiffness_csr is None:
+            return None
+
+        csr, dense = self._dense_stiffness
+        if csr is not self.global_stiffness_csr:
+            dense = self.global_stiffness_csr.toarray()
+            self._dense_stiffness = (self.global_stiffness_csr, dense)
+
+        return dense
 
     def _assemble_global_stiffness(self):
         '''
         Assembles the global stiffness matrix for the model.
 
+        The element matrices are scattered into the global matrix in one step
+        using the global dof numbers of each element.
+
         Parameters
         ----------
         None
@@ -319,70 +495,60 @@ class BeamModel:
         -------
         None
         '''
-        # Initialize numpy matrix with n_dof x n_dof dimensions
-        local_stiffness_matrices = []
-        S = np.zeros((self.n_dof, self.n_dof))
-
-        # Loop over all model elements
-        for i_elem in range(len(self.elem_nodes)):
-            # Get the local element stiffness matrix, K
-            node_i = self.elem_nodes[i_elem][0]
-            node_j = self.elem_nodes[i_elem][1]
-            L = self.model_nodes[node_j] - self.model_nodes[node_i]
-            E = self.beam.e_mod
-            A = self.beam.area
-            I = self.beam.mom_inertia
-
-            K = np.zeros((6, 6))
-            K[0][0] = (E*A)/L
-            K[0][3] = -K[1][1]
-            K[1][1] = (12*E*I)/(L**3)
-            K[1][2] = (6*E*I)/(L**2)
-            K[1][4] = -K[1][1]
-            K[1][5] = K[1][2]
-            K[2][2] = (4*E*I)/(L)
-            K[2][4] = -K[1][2]
-            K[2][5] = 0.5*K[2][2]
-            K[3][3] = K[0][0]
-            K[4][4] = K[1][1]
-            K[4][5] = -K[1][2]
-            K[5][5] = K[2][2]
-
-            # Fill in symmetric terms of K
-            K = K + K.T - np.diag(K.diagonal())
-
-            local_stiffness_matrices.append(K)
-
-            l_dof1 = -1
-            #Fill in the upper triangle terms of [K] into [S]
-            for i_node1 in range(2):
-                # Get end node number for element #i_elem
-                node_num1 = self.elem_nodes[i_elem][i_node1]
-                for i_dof1 in range(3):
-                    l_dof2 = l_dof1
-                    l_dof1 += 1
-                    G_dof1 = self.dof_num[node_num1][i_dof1]
-                    for i_node2 in range(i_node1, 2):
-                        node_num2 = self.elem_nodes[i_elem][i_node2]
-                        B_dof2 = 0
-                        if i_node2 == i_node1:
-                            B_dof2 = i_dof1
-                        for i_dof2 in range(B_dof2, 3):
-                            l_dof2 += 1
-                            G_dof2 = self.dof_num[node_num2][i_dof2]
-                            if G_dof1 != 0 and G_dof2 != 0:
-                                S[G_dof1-1][G_dof2-1] += K[l_dof1][l_dof2]
-
-        # Fill in symmetric terms of S
-        S = S + S.T - np.diag(S.diagonal())
-
-        self.global_stiffness = S
-        self.local_stiffness_matrices = local_stiffness_matrices
+        self._set_element_stiffness()
+
+        # Scatter the element terms between unrestrained dof into S
+        rows, cols, data = stiffness_triplets(
+            self.elem_dofs,
+            self.unique_stiffness_matrices,
+            self.elem_stiffness_index,
+            jit=self._use_jit(),
+        )
+        S = sparse.coo_matrix((data.astype(self.precision), (rows, cols)), shape=(self.n_dof, self.n_dof)).tocsr()
+
+        self.global_stiffness_csr = S
+
+    def _set_element_stiffness(self):
+        '''
+        Sets the local stiffness matrix and global dof numbers of each element.
+
+        Elements with the same section properties and length share a single
+        cached stiffness matrix.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        '''
+        elem_nodes = np.asarray(self.elem_nodes, dtype=int).reshape(-1, 2)
+        model_nodes = np.asarray(self.model_nodes, dtype=float)
+
+        # Get the local element stiffness matrices, sharing one cached matrix
+        # between all elements with the same section properties and length
+        L = model_nodes[elem_nodes[:, 1]] - model_nodes[elem_nodes[:, 0]]
+        stiffness_matrices, elem_stiffness_index = get_element_stiffness(
+            self.beam.e_mod,
+            self.beam.area,
+            self.beam.mom_inertia,
+            L,
+            self.node_tolerance,
+        )
+        unique_stiffness = np.array(stiffness_matrices).reshape(-1, 6, 6)
+
+        # Global dof number of each local dof for each element (0 = restrained)
+        self.elem_dofs = self._get_elem_dofs()
+        self.elem_stiffness_index = elem_stiffness_index
+        self.local_stiffness_matrices = [stiffness_matrices[i] for i in elem_stiffness_index]
+        self.unique_stiffness_matrices = unique_stiffness
 
     def _create_model_nodes_and_elems(self):
         '''
         Defines the model nodes based on the points of interest
-        and maximum node spacing defined by the user.
+        and maximum node spacing defined by the user, using the refined
+        node spacing within any mesh refinement zones.
 
         Parameters
         ----------
@@ -392,29 +558,26 @@ class BeamModel:
         -------
         None
         '''
-        model_segments = []
-        for idx, poi in enumerate(self.points_of_interest[:-1]):
-            segment = (self.points_of_interest[idx], self.points_of_interest[idx+1])
+        points = np.asarray(self.points_of_interest, dtype=float)
+        spacing = self.max_node_spacing
 
-            model_segments.append(segment)
+        if len(self.refinement_zones) > 0:
+            # Add the zone boundaries to the segment end points and use the
+            # refined spacing for segments lying within a refinement zone
+            zones = np.clip(np.asarray(self.refinement_zones, dtype=float).reshape(-1, 2), 0, self.beam.length)
+            priority = np.concatenate((np.ones(len(points)), np.zeros(zones.size)))
+            points = unique_with_tolerance(np.concatenate((points, zones.ravel())), self.node_tolerance, priority=priority)
 
-        nodes = []
-        for pair in model_segments:
-            # Determine number of sub-segments
-            n_sub = math.ceil((pair[1]-pair[0])/self.max_node_spacing)
-            # Subdivide segments and add the nodes to the model_nodes list
-            nodes.extend([((pair[1]-pair[0])/n_sub)*i+pair[0] for i in range(n_sub+1)])
+            mid = (points[:-1] + points[1:])/2
+            in_zone = np.any((mid[:, None] >= zones[:, 0]) & (mid[:, None] <= zones[:, 1]), axis=1)
+            spacing = np.where(in_zone, self.refined_node_spacing, self.max_node_spacing)
 
-        # Remove duplicate nodes
-        model_nodes = []
-        for node in nodes:
-            if node not in model_nodes:
-                model_nodes.append(node)
+        # Subdivide the segments between points of interest
+        model_nodes = subdivide_segments(points, spacing)
 
         # Store end nodes for each element
-        elem_nodes = []
-        for idx, node in enumerate(model_nodes[:-1]):
-            elem_nodes.append([idx, idx+1])
+        n_elem = max(len(model_nodes)-1, 0)
+        elem_nodes = np.column_stack((np.arange(n_elem), np.arange(1, n_elem+1)))
 
         self.model_nodes = model_nodes
         self.elem_nodes = elem_nodes
@@ -432,27 +595,117 @@ class BeamModel:
         -------
         None
         '''
-        # Initialize list with n_nodes rows and 3 columns in each row
-        dof_num = [[0, 0, 0] for _ in range(len(self.model_nodes))]
+        # Number the unrestrained dof node by node (0 = restrained)
+        free = np.asarray(self.node_support, dtype=int).reshape(-1, 3) == 0
+        dof_count = int(np.count_nonzero(free))
+        dof_num = np.zeros(free.shape, dtype=int)
+        dof_num[free] = np.arange(1, dof_count+1)
+
+        # Split the dof into axial and bending blocks (zero-based)
+        axial_dofs = dof_num[:, 0]
+        bending_dofs = dof_num[:, 1:].ravel()
+
+        self.axial_dofs = axial_dofs[axial_dofs != 0] - 1
+        self.bending_dofs = np.sort(bending_dofs[bending_dofs != 0]) - 1
+        self.dof_num = dof_num.tolist()
+        self.n_dof = dof_count
 
-        # Initialize the dof counter
-        dof_count = 0
+    def _get_dload_array(self):
+        '''
+        Returns the distributed loads on the beam as a structured array.
 
-        # Loop over all nodes
-        for i_node in range(len(self.model_nodes)):
-            # Loop over each dof
-            for i_dof in range(3):
-                # Increase total dof number for each new dof
-                if self.node_support[i_node][i_dof] == 0:
-                    # This node is not restrained and is a dof
-                    dof_count += 1
-                    dof_num[i_node][i_dof] = dof_count
-                else:
-                    # This node is restrained
-                    dof_num[i_node][i_dof] = 0
-
-        self.dof_num = dof_num
-        self.n_dof = dof_count
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        dload_array : numpy array
+            structured array with dtype DistLoad.array_dtype
+        '''
+        if isinstance(self.beam.dloads, np.ndarray):
+            return self.beam.dloads
+
+        return DistLoad.to_array(self.beam.dloads)
+
+    def _get_elem_dofs(self):
+        '''
+        Returns the global dof number of each local dof for each element in
+        the model, with 0 indicating a restrained dof.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        elem_dofs : numpy array
+            numpy array of shape (n_elem, 6) containing the global dof numbers
+        '''
+        dof_num = np.asarray(self.dof_num, dtype=int).reshape(-1, 3)
+        elem_nodes = np.asarray(self.elem_nodes, dtype=int).reshape(-1, 2)
+
+        return dof_num[elem_nodes].reshape(-1, 6)
+
+    def _get_element_forces(self, displacement, elem_loads):
+        '''
+        Calculates the forces at each end of each element from the global
+        displacement vector and the element fixed end forces.
+
+        Displacements for several load cases may be passed as an array of shape
+        (n_cases, n_dof), in which case the element forces of every load case
+        are returned with shape (n_cases, n_elem, 6).
+
+        Parameters
+        ----------
+        displacement : numpy array
+            numpy array of shape (n_dof,) or (n_cases, n_dof) representing the displacement at each global degree of freedom
+        elem_loads : numpy array
+            numpy array of shape (n_elem, 6) or (n_cases, n_elem, 6) representing the fixed end forces of each element
+
+        Returns
+        -------
+        element_forces : numpy array
+            numpy array of shape (n_elem, 6) or (n_cases, n_elem, 6) representing the forces at each end of each element
+        '''
+        # Gather the local deformations of every element from the global
+        # displacement vector, with restrained dof (dof number 0) set to zero
+        displacement = np.asarray(displacement)
+        if not np.issubdtype(displacement.dtype, np.floating):
+            displacement = displacement.astype(float)
+        padded_displacement = np.concatenate((np.zeros(displacement.shape[:-1]+(1,)), displacement), axis=-1)
+        local_delta = padded_displacement[..., self.elem_dofs]
+
+        K = self.unique_stiffness_matrices[self.elem_stiffness_index]
+
+        # The element stiffness matrices are kept in float64, and the forces
+        # are returned in the precision of the displacements
+        element_forces = np.einsum('eij,...ej->...ei', K, local_delta) + elem_loads
+
+        return element_forces.astype(displacement.dtype, copy=False)
+
+    def _get_internal_forces(self, displacement):
+        '''
+        Calculates the product of the global stiffness matrix and a global displacement
+        vector in float64 directly from the element stiffness matrices.
+
+        Parameters
+        ----------
+        displacement : numpy array
+            numpy array of shape (n_dof,) representing the displacement at each global degree of freedom
+
+        Returns
+        -------
+        internal_forces : numpy array
+            numpy array of shape (n_dof,) representing the internal force at each global degree of freedom
+        '''
+        element_forces = self._get_element_forces(np.asarray(displacement, dtype=np.float64), 0)
+
+        # Sum the element end forces into the global dof, discarding the restrained dof
+        internal_forces = np.zeros(self.n_dof+1)
+        np.add.at(internal_forces, self.elem_dofs, element_forces)
+
+        return internal_forces[1:]
 
     def _get_load_vector(self):
         '''
@@ -472,17 +725,37 @@ class BeamModel:
         P = np.zeros((self.n_dof, 1))
         Pf = np.zeros((self.n_dof, 1))
 
-        # Loop over all nodes
-        for i_node in range(len(self.model_nodes)):
-            # Loop over each dof
-            for i_dof in range(3):
-                if self.dof_num[i_node][i_dof] != 0:
-                    P[self.dof_num[i_node][i_dof]-1] += self.node_pload[i_node][i_dof]
-                    Pf[self.dof_num[i_node][i_dof]-1] += self.node_elem_fef[i_node][i_dof]
+        # Scatter the nodal values at each unrestrained dof into the load vectors
+        dof_num = np.asarray(self.dof_num, dtype=int).reshape(-1, 3)
+        active = dof_num != 0
+        np.add.at(P[:, 0], dof_num[active]-1, np.asarray(self.node_pload, dtype=float).reshape(-1, 3)[active])
+        np.add.at(Pf[:, 0], dof_num[active]-1, np.asarray(self.node_elem_fef, dtype=float).reshape(-1, 3)[active])
 
         self.nodal_load_vector = P
         self.fef_load_vector = Pf
 
+    def _get_location_segments(self, elem):
+        '''
+        Pairs each location with the distributed load segments acting on the
+        element containing it.
+
+        Parameters
+        ----------
+        elem : numpy array
+            numpy array of the element containing each location
+
+        Returns
+        -------
+        point : numpy array
+            numpy array of the index of the location for each pair
+        seg : numpy array
+            numpy array of shape (n_pairs, 5) representing the load segment for each pair
+        '''
+        segments = np.asarray(self.dload_segments, dtype=float).reshape(-1, 5)
+        point, seg_idx = np.nonzero(elem[:, None] == segments[:, 0].astype(int)[None, :])
+
+        return point, segments[seg_idx]
+
     def _get_node_elem_fef(self):
         '''
         Calculates the fixed end forces due to distributed loads on
@@ -496,46 +769,61 @@ class BeamModel:
         -------
         None
         '''
-        elem_loads = [[0, 0, 0, 0, 0, 0] for _ in range(len(self.elem_nodes))]
-        node_elem_fef = [[0, 0 ,0] for _ in range(len(self.model_nodes))]
-        # Loop over all elements
-        for i_elem, elem in enumerate(self.elem_nodes):
-            # Calculate fixed end forces for y-distributed loads
-            w1 = self.elem_dload[i_elem][1][0]
-            w2 = self.elem_dload[i_elem][1][1]
-            L = self.model_nodes[elem[1]] - self.model_nodes[elem[0]]
-            if w1 != 0 and w2 != 0:
-                # Calculate fixed end forces if w1 >= w2
-                if abs(w1) > abs(w2):
-                    v_react_i = (w2*L)/2 + (7*(w1-w2)*L)/20
-                    v_react_j = (w2*L)/2 + (3*(w1-w2)*L)/20
-                    m_react_i = (w2*L**2)/12 + ((w1-w2)*L**2)/20
-                    m_react_j = -(w2*L**2)/12 - ((w1-w2)*L**2)/30
-                # Calculate fixed end forces if w1 <= w2
-                elif abs(w2) >= abs(w1):
-                    v_react_i = (w1*L)/2 + (3*(w2-w1)*L)/20
-                    v_react_j = (w1*L)/2 + (7*(w2-w1)*L)/20
-                    m_react_i = (w1*L**2)/12 + ((w2-w1)*L**2)/30
-                    m_react_j = -(w1*L**2)/12 - ((w2-w1)*L**2)/20
-                # Place the fixed end forces in the proper location
-                node_elem_fef[elem[0]][1] += -v_react_i
-                node_elem_fef[elem[0]][2] += -m_react_i
-                node_elem_fef[elem[1]][1] += -v_react_j
-                node_elem_fef[elem[1]][2] += -m_react_j
-
-                elem_loads[i_elem][1] += -v_react_i
-                elem_loads[i_elem][2] += -m_react_i
-                elem_loads[i_elem][4] += -v_react_j
-                elem_loads[i_elem][5] += -m_react_j
-
-        self.node_elem_fef = node_elem_fef
+        elem_nodes = np.asarray(self.elem_nodes, dtype=int).reshape(-1, 2)
+        model_nodes = np.asarray(self.model_nodes, dtype=float)
+        L = model_nodes[elem_nodes[:, 1]] - model_nodes[elem_nodes[:, 0]]
+
+        if self.element_type == 'exact':
+            # Integrate each load segment exactly and sum the fixed end forces on each element
+            seg = np.asarray(self.dload_segments, dtype=float).reshape(-1, 5)
+            seg_elem = seg[:, 0].astype(int)
+            seg_fef = partial_trapezoidal_fef(seg[:, 3], seg[:, 4], seg[:, 1], seg[:, 2], L[seg_elem])
+
+            v_react_i, m_react_i, v_react_j, m_react_j = np.zeros((4, len(elem_nodes)))
+            for react, fef in zip((v_react_i, m_react_i, v_react_j, m_react_j), seg_fef):
+                np.add.at(react, seg_elem, fef)
+        else:
+            # Calculate fixed end forces for y-distributed loads on all elements at once
+            elem_dload = np.asarray(self.elem_dload, dtype=float).reshape(-1, 3, 2)
+            w1 = elem_dload[:, 1, 0]
+            w2 = elem_dload[:, 1, 1]
+            v_react_i, m_react_i, v_react_j, m_react_j = trapezoidal_fef(w1, w2, L)
+
+        # Place the fixed end forces in the proper location
+        elem_loads = np.zeros((len(elem_nodes), 6))
+        elem_loads[:, 1] = -v_react_i
+        elem_loads[:, 2] = -m_react_i
+        elem_loads[:, 4] = -v_react_j
+        elem_loads[:, 5] = -m_react_j
+
+        self.node_elem_fef = node_fef(elem_nodes, elem_loads, len(model_nodes), jit=self._use_jit())
         self.elem_loads = elem_loads
 
+    def _get_pload_array(self):
+        '''
+        Returns the point loads on the beam as a structured array.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        pload_array : numpy array
+            structured array with dtype PointLoad.array_dtype
+        '''
+        if isinstance(self.beam.ploads, np.ndarray):
+            return self.beam.ploads
+
+        return PointLoad.to_array(self.beam.ploads)
+
     def _get_points_of_interest(self):
         '''
         Defines points of interest along the length of the beam model,
         including beam start and end points, points of load application, and
-        support points.
+        support points. The ends of distributed loads are only included for
+        standard elements. Points closer together than the node tolerance are
+        merged, keeping beam end and support points in preference to load points.
 
         Parameters
         ----------
@@ -545,37 +833,127 @@ class BeamModel:
         -------
         None
         '''
-        points_of_interest = []
+        # Add end points and support points
+        fixed_points = [0, self.beam.length]
+        fixed_points.extend([support[0] for support in self.beam.supports])
+
+        # Add locations of point loads and starting and ending locations of distributed loads
+        pload_array = self._get_pload_array()
+        dload_array = self._get_dload_array()
+        if self.element_type == 'exact':
+            # Distributed loads are integrated exactly within the elements, so
+            # their end points do not need to coincide with nodes
+            load_points = np.asarray(pload_array['x'], dtype=float)
+        else:
+            load_points = np.concatenate((pload_array['x'], dload_array['x_i'], dload_array['x_j']))
+
+        points = np.concatenate((np.array(fixed_points, dtype=float), load_points))
+        priority = np.concatenate((np.ones(len(fixed_points)), np.zeros(len(load_points))))
+
+        poi = unique_with_tolerance(points, self.node_tolerance, priority=priority)
+        poi = poi[poi <= self.beam.length]
+
+        self.points_of_interest = poi.tolist()
+
+    def _locate_in_elements(self, location):
+        '''
+        Finds the element containing each location along the length of the beam.
+
+        Parameters
+        ----------
+        location : int, float, or array_like
+            location(s) along the length of the beam
 
-        # Add end points
-        points_of_interest.extend([0, self.beam.length])
+        Returns
+        -------
+        elem : numpy array
+            numpy array of the element containing each location
+        x : numpy array
+            numpy array of the distance from end i of the element to each location
+        L : numpy array
+            numpy array of the length of the element containing each location
+        '''
+        location = np.atleast_1d(np.asarray(location, dtype=float))
+        if np.any(location < 0) or np.any(location > self.beam.length):
+            raise ValueError('location must be within the length of the beam.')
 
-        # Add support points
-        for support in self.beam.supports:
-            if support[0] not in points_of_interest:
-                points_of_interest.append(support[0])
+        nodes = np.asarray(self.model_nodes, dtype=float)
+        elem_nodes = np.asarray(self.elem_nodes, dtype=int).reshape(-1, 2)
 
-        # Add locations of point loads
-        for load in self.beam.ploads:
-            if load.location not in points_of_interest:
-                points_of_interest.append(load.location)
+        elem = np.clip(np.searchsorted(nodes, location, side='right') - 1, 0, len(elem_nodes)-1)
+        x_i = nodes[elem_nodes[elem, 0]]
+        L = nodes[elem_nodes[elem, 1]] - x_i
 
-        # Add starting and ending locations of distributed loads
-        for load in self.beam.dloads:
-            for point in load.location:
-                if point not in points_of_interest:
-                    points_of_interest.append(point)
+        return elem, location - x_i, L
+
+    def _refine_displacements(self, load_vector, displacement):
+        '''
+        Refines a reduced precision displacement vector to float64 accuracy. The
+        residuals are computed in float64 from the element stiffness matrices and
+        the reduced precision factorization is used as the preconditioner of a
+        conjugate gradient iteration, which converges even when the stiffness
+        matrix is too poorly conditioned for classical iterative refinement.
+
+        Parameters
+        ----------
+        displacement : numpy array
+            numpy array representing the reduced precision displacement at each global degree of freedom
+        load_vector : numpy array
+            numpy array representing the net load at each global degree of freedom
+
+        Returns
+        -------
+        displacement : numpy array
+            numpy array of shape (n_dof, 1) representing the float64 displacement at each global degree of freedom
+        '''
+        shape = (self.n_dof, self.n_dof)
+        stiffness = sparse_linalg.LinearOperator(shape, matvec=self._get_internal_forces, dtype=np.float64)
+        preconditioner = sparse_linalg.LinearOperator(
+            shape,
+            matvec=lambda residual: np.ravel(self._solve_displacements(residual)).astype(np.float64),
+            dtype=np.float64,
+        )
+
+        displacement, info = sparse_linalg.cg(
+            stiffness,
+            np.ravel(load_vector).astype(np.float64),
+            x0=np.ravel(displacement).astype(np.float64),
+            rtol=REFINEMENT_TOL,
+            maxiter=REFINEMENT_MAX_ITER,
+            M=preconditioner,
+        )
+        if info != 0:
+            raise AnalysisError('Iterative refinement did not converge. Use float64 precision for this model.')
+
+        return displacement.reshape(-1, 1)
+
+    def _release_stiffness(self):
+        '''
+        Releases the global and element stiffness matrices once the global
+        stiffness matrix has been factorized.
 
-        points_of_interest.sort()
-        poi = [item for item in points_of_interest if item <= self.beam.length]
+        Parameters
+        ----------
+        None
 
-        self.points_of_interest = poi
+        Returns
+        -------
+        None
+        '''
+        self.global_stiffness_csr = None
+        self.local_stiffness_matrices = []
 
     def _set_dload_elems(self):
         '''
         Determines which model elements have been defined by the user
         as having applied distributed loads.
 
+        The range of elements covered by each distributed load is found by
+        searching the sorted model nodes, and the load intensities at the ends
+        of every covered element (or, for exact elements, at the ends of the
+        part of the load acting on each element) are evaluated in a single
+        array operation.
+
         Parameters
         ----------
         None
@@ -584,20 +962,68 @@ class BeamModel:
         -------
         None
         '''
-        elem_dload    = [[[0, 0], [0,0], [0,0]] for _ in range(len(self.elem_nodes))]
-        for idx, elem in enumerate(self.elem_nodes):
-            for dload in self.beam.dloads:
-                m = []
-                b = []
-                for dir in dload.magnitude:
-                    m.append((dir[1]-dir[0])/(dload.location[1]-dload.location[0]))
-                    b.append(dir[0])
-                if (dload.location[0] <= self.model_nodes[elem[0]] and
-                        dload.location[1] >= self.model_nodes[elem[1]]):
-                    for idx2, _ in enumerate(elem_dload[idx]):
-                        elem_dload[idx][idx2][0] += m[idx2]*(self.model_nodes[elem[0]]-dload.location[0])+b[idx2]
-                        elem_dload[idx][idx2][1] += m[idx2]*(self.model_nodes[elem[1]]-dload.location[0])+b[idx2]
-
+        nodes = np.asarray(self.model_nodes, dtype=float)
+        elem_nodes = np.asarray(self.elem_nodes, dtype=int).reshape(-1, 2)
+        elem_dload = np.zeros((len(elem_nodes), 3, 2))
+
+        dload_array = self._get_dload_array()
+        if len(dload_array) == 0 or len(elem_nodes) == 0:
+            self.elem_dload = elem_dload
+            self.dload_segments = np.empty([0, 5])
+            return
+
+        x_start = dload_array['x_i']
+        x_end = dload_array['x_j']
+        magnitude = np.stack((
+            np.column_stack((dload_array['wx_i'], dload_array['wx_j'])),
+            np.column_stack((dload_array['wy_i'], dload_array['wy_j'])),
+            np.column_stack((dload_array['m_i'], dload_array['m_j'])),
+        ), axis=1)
+
+        if self.element_type == 'exact':
+            # Elements overlapping each distributed load
+            elem_start = np.searchsorted(nodes, x_start+self.node_tolerance, side='right') - 1
+            elem_stop = np.searchsorted(nodes, x_end-self.node_tolerance, side='left')
+            elem_start = np.clip(elem_start, 0, len(elem_nodes))
+            elem_stop = np.clip(elem_stop, 0, len(elem_nodes))
+        else:
+            # Elements lying entirely within each distributed load
+            elem_start = np.searchsorted(nodes, x_start-self.node_tolerance, side='left')
+            elem_stop = np.searchsorted(nodes, x_end+self.node_tolerance, side='right') - 1
+        n_covered = np.maximum(elem_stop-elem_start, 0)
+
+        # Expand into one (load, element) pair per covered element
+        load_idx = np.repeat(np.arange(len(dload_array)), n_covered)
+        elem_idx = elem_start[load_idx] + np.arange(load_idx.size) - np.repeat(np.cumsum(n_covered)-n_covered, n_covered)
+
+        # Evaluate the linearly varying load intensity in each direction at each element end
+        with np.errstate(divide='ignore', invalid='ignore'):
+            m = (magnitude[:, :, 1]-magnitude[:, :, 0])/(x_end-x_start)[:, None]
+        b = magnitude[:, :, 0]
+
+        x_i = nodes[elem_nodes[elem_idx, 0]]
+        x_j = nodes[elem_nodes[elem_idx, 1]]
+        if self.element_type == 'exact':
+            # Clip each load to the part acting on the element
+            x_i = np.maximum(x_i, x_start[load_idx])
+            x_j = np.minimum(x_j, x_end[load_idx])
+
+        w_i = m[load_idx]*(x_i-x_start[load_idx])[:, None] + b[load_idx]
+        w_j = m[load_idx]*(x_j-x_start[load_idx])[:, None] + b[load_idx]
+
+        if self.element_type == 'exact':
+            elem_x = nodes[elem_nodes[elem_idx, 0]]
+            self.dload_segments = np.column_stack((elem_idx, x_i-elem_x, x_j-elem_x, w_i[:, 1], w_j[:, 1]))
+            self.elem_dload = elem_dload
+            return
+
+        np.add.at(elem_dload[:, :, 0], elem_idx, w_i)
+        np.add.at(elem_dload[:, :, 1], elem_idx, w_j)
+
+        # Each loaded element carries a single transverse load segment spanning the element
+        loaded = np.nonzero(np.any(elem_dload[:, 1, :] != 0, axis=1))[0]
+        L = nodes[elem_nodes[loaded, 1]] - nodes[elem_nodes[loaded, 0]]
+        self.dload_segments = np.column_stack((loaded, np.zeros(len(loaded)), L, elem_dload[loaded, 1, 0], elem_dload[loaded, 1, 1]))
         self.elem_dload = elem_dload
 
     def _set_pload_nodes(self):
@@ -613,12 +1039,16 @@ class BeamModel:
         -------
         None
         '''
-        node_pload = [[0, 0, 0] for _ in range(len(self.model_nodes))]
-        for idx, node in enumerate(self.model_nodes):
-            for pload in self.beam.ploads:
-                if pload.location == node:
-                    for idx2, _ in enumerate(node_pload[idx]):
-                        node_pload[idx][idx2] += pload.magnitude[idx2]
+        node_pload = np.zeros((len(self.model_nodes), 3))
+
+        pload_array = self._get_pload_array()
+        if len(pload_array) > 0:
+            location = pload_array['x']
+            magnitude = np.column_stack((pload_array['px'], pload_array['py'], pload_array['m']))
+
+            pload_nodes = find_nodes(self.model_nodes, location, self.node_tolerance)
+            on_node = pload_nodes >= 0
+            np.add.at(node_pload, pload_nodes[on_node], magnitude[on_node])
 
         self.node_pload = node_pload
 
@@ -629,16 +1059,338 @@ class BeamModel:
         '''
         node_support = [(0, 0, 0) for _ in range(len(self.model_nodes))]
         support_nodes = []
-        for i_node, node in enumerate(self.model_nodes):
-            for support in self.beam.supports:
-                if support[0] == node:
-                    node_support[i_node] = support[1]
-                    support_nodes.append(i_node)
+        sup_nodes = find_nodes(self.model_nodes, [support[0] for support in self.beam.supports], self.node_tolerance)
+        for support, i_node in sorted(zip(self.beam.supports, sup_nodes), key=lambda item: item[1]):
+            if i_node >= 0:
+                node_support[i_node] = support[1]
+                support_nodes.append(int(i_node))
 
         self.node_support = node_support
         self.support_nodes = support_nodes
 
-    
+    def _factorize_block(self, dofs):
+        '''
+        Factorizes the block of the global stiffness matrix coupling the
+        specified dof using the linear solver specified by the solver attribute.
+
+        Parameters
+        ----------
+        dofs : numpy array
+            numpy array of the (zero-based) global dof in the block
+
+        Returns
+        -------
+        factor : tuple
+            tuple containing the solver type and the factorization of the block (None if the block is empty)
+        '''
+        if len(dofs) == 0:
+            return None
+
+        block = self.global_stiffness_csr[dofs][:, dofs].astype(self.precision)
+        if self._use_banded_solver():
+            # The stiffness matrix only couples dof of adjacent nodes, so it can be
+            # stored and factored as a narrow symmetric band
+            block_num = np.zeros(self.n_dof+1, dtype=int)
+            block_num[dofs+1] = np.arange(1, len(dofs)+1)
+            half_bandwidth = get_half_bandwidth(block_num[self.elem_dofs])
+            banded_stiffness = sparse_to_banded(block, half_bandwidth)
+            return ('banded', linalg.cholesky_banded(banded_stiffness))
+        else:
+            return ('dense', linalg.lu_factor(block.toarray()))
+
+    def _factorize_stiffness(self):
+        '''
+        Factorizes the global stiffness matrix using the linear solver specified
+        by the solver attribute and stores the factorization for reuse. In planar
+        bending mode only the bending dof are factorized; the uncoupled axial
+        dof are only factorized when axial loads are applied (or immediately in
+        low memory mode, as the stiffness matrix is then released).
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        '''
+        if self.planar_bending:
+            self.stiffness_factor = self._factorize_block(self.bending_dofs)
+            self.axial_factor = self._factorize_block(self.axial_dofs) if self.low_memory else None
+        else:
+            self.stiffness_factor = self._factorize_block(np.arange(self.n_dof))
+            self.axial_factor = None
+
+    def _get_support_key(self):
+        '''
+        Returns a key identifying the supports and model nodes that the support
+        nodes and global dof numbering depend on.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        key : tuple
+            tuple identifying the current support nodes and dof numbering
+        '''
+        return (
+            np.asarray([support[0] for support in self.beam.supports], dtype=float).tobytes(),
+            np.asarray([support[1] for support in self.beam.supports], dtype=int).tobytes(),
+            np.asarray(self.model_nodes, dtype=float).tobytes(),
+            self.node_tolerance,
+        )
+
+    def _get_support_reactions(self, element_forces):
+        '''
+        Calculates the support reaction at each node in the model by summing the
+        element end forces acting at each restrained degree of freedom.
+
+        Parameters
+        ----------
+        element_forces : numpy array
+            numpy array of shape (n_elem, 6) representing the forces at each end of each element
+
+        Returns
+        -------
+        support_reactions : numpy array
+            numpy array of shape (n_nodes, 3) representing the support reaction at each node
+        '''
+        elem_nodes = np.asarray(self.elem_nodes, dtype=int).reshape(-1, 2)
+
+        # Index of each local dof of each element into the flattened (n_nodes, 3) array
+        elem_node_dofs = (3*elem_nodes[:, :, None] + np.arange(3)).reshape(-1, 6)
+        restrained = self.elem_dofs == 0
+
+        support_reactions = np.zeros(3*len(self.model_nodes), dtype=element_forces.dtype)
+        np.add.at(support_reactions, elem_node_dofs[restrained], element_forces[restrained])
+
+        return support_reactions.reshape(-1, 3)
+
+    def _get_stiffness_key(self):
+        '''
+        Returns a key identifying the mesh, section properties, supports, and
+        solver that the global stiffness matrix depends on.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        key : tuple
+            tuple identifying the current global stiffness matrix
+        '''
+        return (
+            self._support_key,
+            self.beam.e_mod,
+            self.beam.area,
+            self.beam.mom_inertia,
+            self._use_banded_solver(),
+            self._use_analytical_solver(),
+            self.planar_bending,
+        )
+
+    def _solve_displacements(self, load_vector):
+        '''
+        Solves the global stiffness equations for the global displacement vector
+        using the cached factorization of the global stiffness matrix.
+
+        Parameters
+        ----------
+        load_vector : numpy array
+            numpy array representing the net load at each global degree of freedom
+
+        Returns
+        -------
+        displacement : numpy array
+            numpy array representing the displacement at each global degree of freedom
+        '''
+        load_vector = np.asarray(load_vector, dtype=self.precision)
+        if self._use_analytical_solver():
+            displacement = self._solve_simply_supported(load_vector)
+        else:
+            # Factorize the stiffness matrix only if it has changed since the last solve
+            if self.stiffness_factor is None:
+                self._factorize_stiffness()
+
+            if not self.planar_bending:
+                return self._solve_factor(self.stiffness_factor, load_vector)
+
+            # The axial dof are uncoupled from the bending dof, so each block is
+            # solved separately and the axial block only when axial loads exist
+            displacement = np.zeros(load_vector.shape, dtype=load_vector.dtype)
+            if len(self.bending_dofs) > 0:
+                displacement[self.bending_dofs] = self._solve_factor(self.stiffness_factor, load_vector[self.bending_dofs])
+
+        if len(self.axial_dofs) > 0 and np.any(load_vector[self.axial_dofs] != 0):
+            if self.axial_factor is None:
+                # The analytical solver only assembles the global stiffness matrix once axial loads are applied
+                if self.global_stiffness_csr is None:
+                    self._assemble_global_stiffness()
+                self.axial_factor = self._factorize_block(self.axial_dofs)
+            displacement[self.axial_dofs] = self._solve_factor(self.axial_factor, load_vector[self.axial_dofs])
+
+        return displacement
+
+    def _solve_simply_supported(self, load_vector):
+        '''
+        Solves the bending dof of a simply supported beam in closed form from
+        the nodal loads, without the global stiffness matrix. The nodal
+        displacements are exact, so they match those of the finite element
+        solution to round-off.
+
+        Parameters
+        ----------
+        load_vector : numpy array
+            numpy array representing the net load at each global degree of freedom
+
+        Returns
+        -------
+        displacement : numpy array
+            numpy array representing the displacement at each global degree of freedom (zero at the axial dof)
+        '''
+        dof_num = np.asarray(self.dof_num, dtype=int).reshape(-1, 3)
+        free_y = dof_num[:, 1] != 0
+        free_m = dof_num[:, 2] != 0
+
+        # Gather the transverse force and moment at each node
+        force = np.zeros((len(dof_num),) + load_vector.shape[1:])
+        moment = np.zeros((len(dof_num),) + load_vector.shape[1:])
+        force[free_y] = load_vector[dof_num[free_y, 1]-1]
+        moment[free_m] = load_vector[dof_num[free_m, 2]-1]
+
+        deflection, rotation = simply_supported_displacements(
+            self.model_nodes,
+            force,
+            moment,
+            self.beam.e_mod*self.beam.mom_inertia,
+        )
+
+        displacement = np.zeros(load_vector.shape, dtype=load_vector.dtype)
+        displacement[dof_num[free_y, 1]-1] = deflection[free_y]
+        displacement[dof_num[free_m, 2]-1] = rotation[free_m]
+
+        return displacement
+
+    def _solve_factor(self, factor, load_vector):
+        '''
+        Solves a block of the global stiffness equations using its factorization.
+
+        Parameters
+        ----------
+        factor : tuple
+            tuple containing the solver type and the factorization of the block
+        load_vector : numpy array
+            numpy array representing the net load at each dof in the block
+
+        Returns
+        -------
+        displacement : numpy array
+            numpy array representing the displacement at each dof in the block
+        '''
+        factor_type, factor = factor
+        if factor_type == 'banded':
+            return linalg.cho_solve_banded((factor, False), load_vector)
+        else:
+            return linalg.lu_solve(factor, load_vector)
+
+    def _update_analysis_loads(self):
+        '''
+        Updates the analysis after a change to the loads on the beam. The model
+        is only re-meshed if a load introduces a point of interest that is not
+        already a model node; otherwise only the nodal loads, element loads,
+        fixed end forces, and load vectors are recomputed.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        '''
+        if not self.analysis_ready or self._get_support_key() != self._support_key:
+            self.initialize_analysis()
+            return
+
+        self._get_points_of_interest()
+        if np.any(find_nodes(self.model_nodes, self.points_of_interest, self.node_tolerance) < 0):
+            self.initialize_analysis()
+            return
+
+        self._set_pload_nodes()
+        self._set_dload_elems()
+        self._get_node_elem_fef()
+        self._get_load_vector()
+        self.analysis_complete = False
+        self.analysis_ready = True
+
+    def _use_analytical_solver(self):
+        '''
+        Checks whether the closed-form solution should be used for the current
+        model, which requires a simply supported beam: one support at each end,
+        each restraining the transverse dof but not the rotation.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        bool : bool
+            bool indicating whether the analytical solver should be used
+        '''
+        if self.solver not in ['auto', 'analytical']:
+            return False
+
+        supports = sorted(self.beam.supports, key=lambda support: support[0])
+        simply_supported = (
+            len(supports) == 2
+            and abs(supports[0][0]) <= self.node_tolerance
+            and abs(supports[1][0] - self.beam.length) <= self.node_tolerance
+            and all(support[1][1] != 0 and support[1][2] == 0 for support in supports)
+        )
+        if self.solver == 'analytical' and not simply_supported:
+            raise AnalysisError('The analytical solver requires a simply supported beam.')
+
+        return simply_supported
+
+    def _use_banded_solver(self):
+        '''
+        Checks whether the banded solver should be used for the current model.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        bool : bool
+            bool indicating whether the banded solver should be used
+        '''
+        if self.solver == 'auto':
+            # The banded factorization is much smaller than the dense one, so it
+            # is always used in low memory mode
+            return self.low_memory or self.n_dof > BANDED_DOF_THRESHOLD
+        return self.solver == 'banded'
+
+    def _use_jit(self):
+        '''
+        Checks whether the compiled kernels should be used for the current model.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        bool : bool
+            bool indicating whether the compiled kernels should be used
+        '''
+        return self.backend == 'numba' or (self.backend == 'auto' and NUMBA_AVAILABLE)
+
     def _valid_add_type(self, add_type):
         '''
         Checks if the add_type parameter passed to the add_beam_dload or add_beam_pload methods if valid.
@@ -666,26 +1418,30 @@ class BeamModel:
         ----------
         add_type : str, optional
             indicates whether to add the dload to the existing loads or replace the existing loads
-        dload : list
-            list of dist load objects representing the distributed load(s) to be added to the beam referenced by the beam model
+        dload : list or numpy array
+            list of dist load objects (or structured array with dtype DistLoad.array_dtype) representing
+            the distributed load(s) to be added to the beam referenced by the beam model
 
         Returns
         -------
         None
         '''
-        if not isinstance(dload, list) or not all(isinstance(item, DistLoad) for item in dload):
-            raise TypeError('dload must be list of valid DistLoad objects')
+        if not _valid_loads(dload, DistLoad):
+            raise TypeError('dload must be list of valid DistLoad objects or a DistLoad structured array')
         if not self._valid_add_type(add_type):
             raise TypeError('add_type must be a string containing "add" or "replace"')
 
         # Add the distributed load
         if add_type == 'replace':
             self.beam.dloads = dload
-        elif add_type == 'add':
+        elif add_type == 'add' and isinstance(self.beam.dloads, list) and isinstance(dload, list):
             self.beam.dloads.extend(dload)
+        elif add_type == 'add':
+            new_dloads = dload if isinstance(dload, np.ndarray) else DistLoad.to_array(dload)
+            self.beam.dloads = np.concatenate((self._get_dload_array(), new_dloads))
 
-        # Re-initialize the analysis
-        self.initialize_analysis()
+        # Update the analysis, re-meshing only if required
+        self._update_analysis_loads()
 
     def add_beam_pload(self, pload, add_type='add'):
         '''
@@ -695,26 +1451,244 @@ class BeamModel:
         ----------
         add_type : str, optional
             indicates whether to add the pload to the existing loads or replace the existing loads
-        pload : list
-            list of point load objects representing the point load(s) to be added to the beam referenced by the beam model
+        pload : list or numpy array
+            list of point load objects (or structured array with dtype PointLoad.array_dtype) representing
+            the point load(s) to be added to the beam referenced by the beam model
 
         Returns
         -------
         None
         '''
-        if not isinstance(pload, list) or not all(isinstance(item, PointLoad) for item in pload):
-            raise TypeError('pload must be list of valid PointLoad objects')
+        if not _valid_loads(pload, PointLoad):
+            raise TypeError('pload must be list of valid PointLoad objects or a PointLoad structured array')
         if not self._valid_add_type(add_type):
             raise TypeError('add_type must be a string containing "add" or "replace"')
         
         # Add the point load
         if add_type == 'replace':
             self.beam.ploads = pload
-        elif add_type == 'add':
+        elif add_type == 'add' and isinstance(self.beam.ploads, list) and isinstance(pload, list):
             self.beam.ploads.extend(pload)
+        elif add_type == 'add':
+            new_ploads = pload if isinstance(pload, np.ndarray) else PointLoad.to_array(pload)
+            self.beam.ploads = np.concatenate((self._get_pload_array(), new_ploads))
 
-        # Re-initialize the analysis
-        self.initialize_analysis()
+        # Update the analysis, re-meshing only if required
+        self._update_analysis_loads()
+
+    def get_moment(self, location):
+        '''
+        Returns the bending moment in the analyzed beam at the specified
+        location(s), found from the forces at end i of each element and the
+        distributed loads acting between end i and the location.
+
+        Parameters
+        ----------
+        location : int, float, or array_like
+            location(s) along the length of the beam
+
+        Returns
+        -------
+        moment : float or numpy array
+            bending moment (or numpy array of bending moments) at the specified location(s)
+        '''
+        if not self.analysis_complete:
+            raise AnalysisError('Analysis must be performed prior to retrieving moments.')
+
+        elem, x, L = self._locate_in_elements(location)
+
+        element_forces = self.get_element_forces()[elem]
+        moment = -element_forces[:, 2] + x*element_forces[:, 1]
+
+        # Add the moment due to the distributed loads acting to the left of each location
+        point, seg = self._get_location_segments(elem)
+        if len(seg) > 0:
+            np.add.at(moment, point, linear_load_moment(seg[:, 3], seg[:, 4], seg[:, 1], seg[:, 2], x[point]))
+
+        if np.ndim(location) == 0:
+            return float(moment[0])
+        return moment
+
+    def get_node_index(self, location):
+        '''
+        Returns the number of the model node at the specified location, matched
+        to within the node tolerance.
+
+        Parameters
+        ----------
+        location : int, float, or array_like
+            location(s) along the length of the beam
+
+        Returns
+        -------
+        node : int or numpy array
+            node number (or numpy array of node numbers) at the specified location(s)
+        '''
+        nodes = find_nodes(self.model_nodes, location, self.node_tolerance)
+        if np.any(nodes < 0):
+            raise ValueError(f'{location} is not a model node location.')
+
+        if np.ndim(location) == 0:
+            return int(nodes[0])
+        return nodes
+
+    def get_deflection(self, location):
+        '''
+        Returns the vertical deflection of the analyzed beam at the specified
+        location(s). Within each element the deflection is the cubic
+        interpolation of the nodal displacements plus the deflection of the
+        fixed-ended element under its distributed loads, which is exact for
+        the loads on the element.
+
+        Parameters
+        ----------
+        location : int, float, or array_like
+            location(s) along the length of the beam
+
+        Returns
+        -------
+        deflection : float or numpy array
+            vertical deflection (or numpy array of vertical deflections) at the specified location(s)
+        '''
+        if not self.analysis_complete:
+            raise AnalysisError('Analysis must be performed prior to retrieving deflections.')
+
+        elem, x, L = self._locate_in_elements(location)
+
+        # Interpolate the nodal displacements with the cubic Hermite shape functions
+        padded_displacement = np.concatenate(([0.0], np.ravel(self.global_displacement)))
+        delta = padded_displacement[self.elem_dofs[elem]]
+        xi = x/L
+        deflection = (
+            (1 - 3*xi**2 + 2*xi**3)*delta[:, 1]
+            + L*(xi - 2*xi**2 + xi**3)*delta[:, 2]
+            + (3*xi**2 - 2*xi**3)*delta[:, 4]
+            + L*(xi**3 - xi**2)*delta[:, 5]
+        )
+
+        # Add the deflection of the fixed-ended elements under their distributed loads
+        point, seg = self._get_location_segments(elem)
+        if len(seg) > 0:
+            EI = self.beam.e_mod*self.beam.mom_inertia
+            np.add.at(deflection, point, fixed_end_deflection(seg[:, 3], seg[:, 4], seg[:, 1], seg[:, 2], L[point], EI, x[point]))
+
+        if np.ndim(location) == 0:
+            return float(deflection[0])
+        return deflection
+
+    def get_element_forces(self):
+        '''
+        Returns the forces at each end of each element of the analyzed beam.
+        In low memory mode the element forces are recomputed from the global
+        displacements.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        element_forces : numpy array
+            numpy array of shape (n_elem, 6) representing the forces at each end of each element
+        '''
+        if not self.analysis_complete:
+            raise AnalysisError('Analysis must be performed prior to retrieving element forces.')
+
+        if self.element_forces is not None:
+            return self.element_forces
+
+        return self._get_element_forces(np.ravel(self.global_displacement), self.elem_loads)
+
+    def get_load_case(self, ploads=None, dloads=None):
+        '''
+        Builds the global load vector and element fixed end forces for a set of
+        loads on the current mesh, without changing the loads on the beam.
+        The result can be passed to solve_load_cases().
+
+        Parameters
+        ----------
+        dloads : list or numpy array, optional
+            list of dist load objects or DistLoad structured array in the load case (None for no distributed loads)
+        ploads : list or numpy array, optional
+            list of point load objects or PointLoad structured array in the load case (None for no point loads)
+
+        Returns
+        -------
+        load_vector : numpy array
+            numpy array of shape (n_dof,) representing the net load at each global degree of freedom
+        elem_loads : numpy array
+            numpy array of shape (n_elem, 6) representing the fixed end forces of each element
+        '''
+        if ploads is not None and not _valid_loads(ploads, PointLoad):
+            raise TypeError('ploads must be list of valid PointLoad objects, a PointLoad structured array, or None')
+        if dloads is not None and not _valid_loads(dloads, DistLoad):
+            raise TypeError('dloads must be list of valid DistLoad objects, a DistLoad structured array, or None')
+        if not self.analysis_ready:
+            raise AnalysisError('Analysis must first be initialized by calling the initialize_analysis() method.')
+
+        # Map the load case onto the current mesh, restoring the beam loads and
+        # the load attributes of the model afterwards
+        beam_loads = (self.beam.ploads, self.beam.dloads)
+        model_loads = (
+            self.points_of_interest,
+            self.node_pload,
+            self.dload_segments,
+            self.elem_dload,
+            self.node_elem_fef,
+            self.elem_loads,
+            self.nodal_load_vector,
+            self.fef_load_vector,
+        )
+        try:
+            self.beam.ploads = [] if ploads is None else ploads
+            self.beam.dloads = [] if dloads is None else dloads
+
+            self._get_points_of_interest()
+            if np.any(find_nodes(self.model_nodes, self.points_of_interest, self.node_tolerance) < 0):
+                raise AnalysisError('Load case locations must coincide with existing model nodes.')
+
+            self._set_pload_nodes()
+            self._set_dload_elems()
+            self._get_node_elem_fef()
+            self._get_load_vector()
+
+            load_vector = np.ravel(self.nodal_load_vector - self.fef_load_vector)
+            elem_loads = self.elem_loads
+        finally:
+            self.beam.ploads, self.beam.dloads = beam_loads
+            (
+                self.points_of_interest,
+                self.node_pload,
+                self.dload_segments,
+                self.elem_dload,
+                self.node_elem_fef,
+                self.elem_loads,
+                self.nodal_load_vector,
+                self.fef_load_vector,
+            ) = model_loads
+
+        return load_vector, elem_loads
+
+    def get_support_reactions(self):
+        '''
+        Returns the support reaction at each support node of the analyzed beam.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        support_reactions : numpy array
+            numpy array of shape (n_supports, 3) representing the support reaction at each node in support_nodes
+        '''
+        if not self.analysis_complete:
+            raise AnalysisError('Analysis must be performed prior to retrieving support reactions.')
+
+        if self.low_memory:
+            return self.support_reactions
+
+        return self.support_reactions[self.support_nodes]
 
     def initialize_analysis(self):
         '''
@@ -730,89 +1704,79 @@ class BeamModel:
         '''
         self._get_points_of_interest()
         self._create_model_nodes_and_elems()
-        self._set_support_nodes()
         self._set_pload_nodes()
         self._set_dload_elems()
         self._get_node_elem_fef()
-        self._fill_global_dof()
-        self._assemble_global_stiffness()
+
+        # Only re-derive the support nodes and dof numbering when the supports
+        # or the model nodes have changed
+        support_key = self._get_support_key()
+        if support_key != self._support_key:
+            self._set_support_nodes()
+            self._fill_global_dof()
+            self._support_key = support_key
+
+        # Only re-assemble the stiffness matrix (and discard its factorization)
+        # when the mesh, section, or supports have changed
+        stiffness_key = self._get_stiffness_key()
+        if stiffness_key != self._stiffness_key:
+            if self._use_analytical_solver():
+                # Simply supported beams are solved in closed form, so only the
+                # element stiffness matrices are needed (for the element forces)
+                self._set_element_stiffness()
+                self.global_stiffness_csr = None
+            else:
+                self._assemble_global_stiffness()
+            self._stiffness_key = stiffness_key
+            self.stiffness_factor = None
+            self.axial_factor = None
+
+            # Keep only the factorization of the stiffness matrix in low memory mode
+            if self.low_memory and not self._use_analytical_solver():
+                self._factorize_stiffness()
+                self._release_stiffness()
+
         self._get_load_vector()
         self.analysis_complete = False
         self.analysis_ready = True
 
-    def perform_analysis(self):
+    def perform_analysis(self, refine=False):
         '''
         Computes the displacement vector, element force matrix, and support reaction vector.
 
         Parameters
         ----------
-        None
+        refine : bool, optional
+            indicates whether to refine a float32 solution to float64 accuracy (ignored for float64 models)
 
         Returns
         -------
         None
         '''
+        if not isinstance(refine, bool):
+            raise TypeError('refine must be either True or False')
 
         if not self.analysis_ready:
             raise AnalysisError('Analysis must first be initialized by calling the initialize_analysis() method.')
         elif self.analysis_ready:
             # Calculate the global displacement vector
             load_vector = self.nodal_load_vector - self.fef_load_vector
-            self.global_displacement = np.linalg.solve(
-                self.global_stiffness, load_vector
-            )
+            self.global_displacement = self._solve_displacements(load_vector)
+            if refine and self.precision != 'float64':
+                self.global_displacement = self._refine_displacements(load_vector, self.global_displacement)
             
-            # Calculate element forces
-            elemxyM = np.zeros((len(self.elem_nodes), 6))
-    
-            # Loop over all elements
-            for i_elem in range(len(self.elem_nodes)):
-                local_delta = np.zeros((6, 1))
-                local_Pf = np.zeros((6, 1))
-    
-                # Get local element stiffness matrix
-                K = self.local_stiffness_matrices[i_elem]
-    
-                l_dof = -1
-                # Extract local data first
-                for i_node in range(2):
-                    # Get end node number for element # i_elem
-                    node_num = self.elem_nodes[i_elem][i_node]
-                    for i_dof in range(3):
-                        l_dof += 1
-                        # Extract local element loads
-                        local_Pf[l_dof] = self.elem_loads[i_elem][l_dof]
-    
-                        # Extract local deformations
-                        G_dof = self.dof_num[node_num][i_dof]
-                        if G_dof != 0:
-                            local_delta[l_dof] = self.global_displacement[G_dof-1]
-    
-                # Calculate element forces
-                local_element_forces = np.matmul(K, local_delta) + local_Pf
-    
-                # Store element forces
-                elemxyM[i_elem] = local_element_forces.transpose()
-    
-            # Calculate support reactions
-            support_reactions = np.zeros((len(self.model_nodes), 3))
-    
-            # Loop over all elements
-            for i_elem in range(len(self.elem_nodes)):
-                l_dof = -1
-    
-                # Loop over each node in the element
-                for i_node in range(2):
-                    node_num = self.elem_nodes[i_elem][i_node]
-                    # Loop over each dof
-                    for i_dof in range(3):
-                        l_dof += 1
-                        if self.dof_num[node_num][i_dof] == 0:
-                            support_reactions[node_num][i_dof] += elemxyM[i_elem][l_dof]
-    
+            # Calculate element forces and support reactions
+            elemxyM = self._get_element_forces(np.ravel(self.global_displacement), self.elem_loads)
+            support_reactions = self._get_support_reactions(elemxyM)
+
             self.analysis_complete = True
-            self.element_forces = elemxyM
-            self.support_reactions = support_reactions
+            if self.low_memory:
+                # Element forces are recomputed on request from the displacements
+                self.element_forces = None
+                self.support_reactions = support_reactions[self.support_nodes]
+            else:
+                self.element_forces = elemxyM
+                self.support_reactions = support_reactions
 
     def plot_bmd(self, with_design=False):
         '''
@@ -832,35 +1796,9 @@ class BeamModel:
         if not self.analysis_complete:
             raise AnalysisError('Analysis must be performed prior to generating plots.')
 
-        left_moment = []
-        right_moment = []
-        for elem_f in self.element_forces:
-            left_moment.append(elem_f[2]/12)
-            right_moment.append(elem_f[5]/12)
-        
-        mom_count1 = 0
-        mom_count2 = 0
-
-        bmd_val = np.zeros((2*len(self.model_nodes)))
-        for i_bmd in range(2*len(self.model_nodes)):
-            if i_bmd < 2*len(self.model_nodes)-2 and (i_bmd+1) % 2 != 0:
-                bmd_val[i_bmd] = -left_moment[mom_count1]
-                mom_count1 += 1
-            elif i_bmd < 2*len(self.model_nodes)-2 and (i_bmd+1) % 2 == 0:
-                bmd_val[i_bmd] = bmd_val[i_bmd-1]
-                mom_count2 += 1
-            elif i_bmd == 2*len(self.model_nodes)-2:
-                bmd_val[i_bmd] = right_moment[len(self.elem_nodes)-1]
-            elif i_bmd == 2*len(self.model_nodes)-1:
-                bmd_val[i_bmd] = bmd_val[i_bmd-1]
-
-        lval_bmd = np.zeros(2*(len(self.model_nodes)))
-        lval_bmd_count = 0
-        for i_lval_bmd in range(len(self.model_nodes)):
-            lval_bmd[i_lval_bmd+lval_bmd_count] = self.model_nodes[i_lval_bmd]/self.beam.length
-            lval_bmd[i_lval_bmd+lval_bmd_count+1] = self.model_nodes[i_lval_bmd]/self.beam.length
-            lval_bmd_count += 1
-        
+        bmd_val = bmd_values(self.get_element_forces(), jit=self._use_jit())
+        lval_bmd = np.repeat(np.asarray(self.model_nodes, dtype=float)/self.beam.length, 2)
+
         fig, ax = plt.subplots()
         bmd_dem, = ax.plot(lval_bmd.tolist(), bmd_val.tolist(), 'b-', label='Demand')
 
@@ -947,32 +1885,9 @@ class BeamModel:
         if not self.analysis_complete:
             raise AnalysisError('Analysis must be performed prior to generating plots.')
         
-        left_shear = []
-        right_shear = []
-        for elem_f in self.element_forces:
-            left_shear.append(elem_f[1])
-            right_shear.append(elem_f[4])
-
-        shear_count1 = 0
-        shear_count2 = 0
-
-        sfd_val = np.zeros(2*len(self.model_nodes))
-        for i_sfd in range(1, len(self.model_nodes)):
-            if i_sfd < 2*len(self.model_nodes)-1:
-                sfd_val[i_sfd+shear_count2] = left_shear[shear_count1]
-                sfd_val[i_sfd+shear_count2+1] = -right_shear[shear_count1]
-                shear_count1 += 1
-                shear_count2 += 1
-            elif i_sfd == 2*len(self.model_nodes)-1:
-                sfd_val[i_sfd] = 0
-
-        lval_sfd = np.zeros(2*(len(self.model_nodes)))
-        lval_sfd_count = 0
-        for i_lval_sfd in range(len(self.model_nodes)):
-            lval_sfd[i_lval_sfd+lval_sfd_count] = self.model_nodes[i_lval_sfd]/self.beam.length
-            lval_sfd[i_lval_sfd+lval_sfd_count+1] = self.model_nodes[i_lval_sfd]/self.beam.length
-            lval_sfd_count += 1
-        
+        sfd_val = sfd_values(self.get_element_forces(), jit=self._use_jit())
+        lval_sfd = np.repeat(np.asarray(self.model_nodes, dtype=float)/self.beam.length, 2)
+
         fig, ax = plt.subplots()
         sfd_dem, = ax.plot(lval_sfd.tolist(), sfd_val.tolist(), 'b-', label='Demand')
 
@@ -1005,17 +1920,141 @@ class BeamModel:
 
         return fig, (round(abs_max_shear, 2), round(x_max, 2))
 
+    def set_mesh_refinement(self, zones, node_spacing):
+        '''
+        Refines the mesh within the specified zones, using the maximum node
+        spacing elsewhere, and re-meshes the model.
+
+        Parameters
+        ----------
+        node_spacing : int or float
+            maximum node spacing within the refinement zones
+        zones : list
+            list of tuples indicating the start and end of each refinement zone (empty list to remove refinement)
+
+        Returns
+        -------
+        None
+        '''
+        if not isinstance(zones, list) or not all(isinstance(zone, (list, tuple)) and len(zone) == 2 for zone in zones):
+            raise TypeError('zones must be a list of tuples indicating the start and end of each zone')
+        if not isinstance(node_spacing, (int, float)) or node_spacing <= 0:
+            raise TypeError('node_spacing must be a positive int or float')
+
+        self.refinement_zones = zones
+        self.refined_node_spacing = node_spacing
+
+        self.initialize_analysis()
+
+    def solve_load_cases(self, load_vectors, elem_loads=None):
+        '''
+        Solves several load cases against a single factorization of the global
+        stiffness matrix. The loads on the beam and the results stored on the
+        model are not changed.
+
+        Parameters
+        ----------
+        elem_loads : array_like, optional
+            array of shape (n_cases, n_elem, 6) representing the fixed end forces of each element
+            in each load case (None if the load cases have no distributed loads)
+        load_vectors : array_like
+            array of shape (n_cases, n_dof) representing the net load at each global degree of
+            freedom in each load case (see get_load_case())
+
+        Returns
+        -------
+        displacements : numpy array
+            numpy array of shape (n_cases, n_dof) representing the displacement at each global
+            degree of freedom in each load case
+        element_forces : numpy array
+            numpy array of shape (n_cases, n_elem, 6) representing the forces at each end of each
+            element in each load case
+        '''
+        if not self.analysis_ready:
+            raise AnalysisError('Analysis must first be initialized by calling the initialize_analysis() method.')
+
+        load_vectors = np.asarray(load_vectors, dtype=float)
+        if load_vectors.ndim != 2 or load_vectors.shape[1] != self.n_dof:
+            raise TypeError('load_vectors must be an array of shape (n_cases, n_dof)')
+
+        n_cases = load_vectors.shape[0]
+        if elem_loads is None:
+            elem_loads = np.zeros((n_cases, len(self.elem_nodes), 6))
+        else:
+            elem_loads = np.asarray(elem_loads, dtype=float)
+            if elem_loads.shape != (n_cases, len(self.elem_nodes), 6):
+                raise TypeError('elem_loads must be an array of shape (n_cases, n_elem, 6)')
+
+        # Back-substitute every load case at once against the cached factorization
+        displacements = self._solve_displacements(load_vectors.T).T
+        element_forces = self._get_element_forces(displacements, elem_loads)
+
+        return displacements, element_forces
+
+    def update_loads(self, ploads=None, dloads=None):
+        '''
+        Replaces the point and/or distributed loads on the Beam object referenced by the
+        BeamModel object and updates the analysis. The existing mesh is kept when every
+        load location already coincides with a model node, in which case only the load
+        vectors are recomputed and the cached stiffness factorization is reused.
+
+        Parameters
+        ----------
+        dloads : list or numpy array, optional
+            list of dist load objects or DistLoad structured array to replace the existing
+            distributed loads (None leaves them unchanged)
+        ploads : list or numpy array, optional
+            list of point load objects or PointLoad structured array to replace the existing
+            point loads (None leaves them unchanged)
+
+        Returns
+        -------
+        None
+        '''
+        if ploads is not None and not _valid_loads(ploads, PointLoad):
+            raise TypeError('ploads must be list of valid PointLoad objects, a PointLoad structured array, or None')
+        if dloads is not None and not _valid_loads(dloads, DistLoad):
+            raise TypeError('dloads must be list of valid DistLoad objects, a DistLoad structured array, or None')
+
+        if ploads is not None:
+            self.beam.ploads = ploads
+        if dloads is not None:
+            self.beam.dloads = dloads
+
+        self._update_analysis_loads()
+
 class DistLoad:
     '''
     A class representing a distributed load.
 
+    Large numbers of distributed loads can instead be stored in a numpy structured array
+    with dtype DistLoad.array_dtype, which is accepted directly by Beam and BeamModel.
+
     Attributes
     ----------
+    array_dtype : numpy dtype
+        structured dtype (x_i, x_j, wx_i, wx_j, wy_i, wy_j, m_i, m_j) for bulk distributed load arrays
     location : tuple
         tuple representing the start and end locations of the distributed load along the beam
     magntidue : tuple
         tuple of tuples representing the magnitude of the distributed load at its start and end locations
+
+    Methods
+    -------
+    from_array(dload_array):
+        Converts a distributed load structured array into a list of DistLoad objects.
+    to_array(dloads):
+        Converts a list of DistLoad objects into a distributed load structured array.
     '''
+    __slots__ = ('location', 'magnitude')
+
+    array_dtype = np.dtype([
+        ('x_i', float), ('x_j', float),
+        ('wx_i', float), ('wx_j', float),
+        ('wy_i', float), ('wy_j', float),
+        ('m_i', float), ('m_j', float),
+    ])
+
     def __init__(self, location, magnitude):
         '''
         Constructs all the necessary attributes for the dist load object.
@@ -1087,17 +2126,81 @@ class DistLoad:
                         return False
             return True
 
+    @staticmethod
+    def from_array(dload_array):
+        '''
+        Converts a distributed load structured array into a list of DistLoad objects.
+
+        Parameters
+        ----------
+        dload_array : numpy array
+            structured array with dtype DistLoad.array_dtype
+
+        Returns
+        -------
+        dloads : list
+            list of dist load objects
+        '''
+        if not _is_load_array(dload_array, DistLoad.array_dtype):
+            raise TypeError('dload_array must be a numpy structured array with dtype DistLoad.array_dtype')
+
+        return [
+            DistLoad(location=(x_i, x_j), magnitude=((wx_i, wx_j), (wy_i, wy_j), (m_i, m_j)))
+            for x_i, x_j, wx_i, wx_j, wy_i, wy_j, m_i, m_j in dload_array.tolist()
+        ]
+
+    @staticmethod
+    def to_array(dloads):
+        '''
+        Converts a list of DistLoad objects into a distributed load structured array.
+
+        Parameters
+        ----------
+        dloads : list
+            list of dist load objects
+
+        Returns
+        -------
+        dload_array : numpy array
+            structured array with dtype DistLoad.array_dtype
+        '''
+        if not isinstance(dloads, list) or not all(isinstance(item, DistLoad) for item in dloads):
+            raise TypeError('dloads must be a list of valid DistLoad objects')
+
+        return np.array(
+            [(*dload.location, *dload.magnitude[0], *dload.magnitude[1], *dload.magnitude[2]) for dload in dloads],
+            dtype=DistLoad.array_dtype,
+        )
+
 class PointLoad:
     '''
     A class representing a concentrated load.
 
+    Large numbers of concentrated loads can instead be stored in a numpy structured array
+    with dtype PointLoad.array_dtype, which is accepted directly by Beam and BeamModel.
+
     Attributes
     ----------
+    array_dtype : numpy dtype
+        structured dtype (x, px, py, m) for bulk concentrated load arrays
     location : int or float
         int or float representing the location of the concentrated load along the beam
     magntidue : tuple
         tuple representing the magnitude of the concentrated load
+
+    Methods
+    -------
+    from_array(pload_array):
+        Converts a concentrated load structured array into a list of PointLoad objects.
+    to_array(ploads):
+        Converts a list of PointLoad objects into a concentrated load structured array.
     '''
+    __slots__ = ('location', 'magnitude')
+
+    array_dtype = np.dtype([
+        ('x', float), ('px', float), ('py', float), ('m', float),
+    ])
+
     def __init__(self, location, magnitude):
         '''
         Constructs all the necessary attributes for the point load object.
@@ -1158,3 +2261,88 @@ class PointLoad:
             return False
         else:
             return True
+
+    @staticmethod
+    def from_array(pload_array):
+        '''
+        Converts a concentrated load structured array into a list of PointLoad objects.
+
+        Parameters
+        ----------
+        pload_array : numpy array
+            structured array with dtype PointLoad.array_dtype
+
+        Returns
+        -------
+        ploads : list
+            list of point load objects
+        '''
+        if not _is_load_array(pload_array, PointLoad.array_dtype):
+            raise TypeError('pload_array must be a numpy structured array with dtype PointLoad.array_dtype')
+
+        return [
+            PointLoad(location=x, magnitude=(px, py, m))
+            for x, px, py, m in pload_array.tolist()
+        ]
+
+    @staticmethod
+    def to_array(ploads):
+        '''
+        Converts a list of PointLoad objects into a concentrated load structured array.
+
+        Parameters
+        ----------
+        ploads : list
+            list of point load objects
+
+        Returns
+        -------
+        pload_array : numpy array
+            structured array with dtype PointLoad.array_dtype
+        '''
+        if not isinstance(ploads, list) or not all(isinstance(item, PointLoad) for item in ploads):
+            raise TypeError('ploads must be a list of valid PointLoad objects')
+
+        return np.array(
+            [(pload.location, *pload.magnitude) for pload in ploads],
+            dtype=PointLoad.array_dtype,
+        )
+
+def _is_load_array(loads, dtype):
+    '''
+    Checks whether loads is a one-dimensional numpy structured array with the specified dtype.
+
+    Parameters
+    ----------
+    dtype : numpy dtype
+        DistLoad.array_dtype or PointLoad.array_dtype
+    loads : any
+        object to be checked
+
+    Returns
+    -------
+    bool : bool
+        bool indicating whether loads is a valid load array
+    '''
+    return isinstance(loads, np.ndarray) and loads.ndim == 1 and loads.dtype == dtype
+
+def _valid_loads(loads, load_class):
+    '''
+    Checks whether loads is a list of load_class objects or a load_class structured array.
+
+    Parameters
+    ----------
+    load_class : class
+        DistLoad or PointLoad
+    loads : any
+        object to be checked
+
+    Returns
+    -------
+    bool : bool
+        bool indicating whether loads is valid
+    '''
+    if isinstance(loads, list):
+        return all(isinstance(item, load_class) for item in loads)
+
+    return _is_load_array(loads, load_class.array_dtype)
@@ -0,0 +1,63 @@
+import numpy as np
+from scipy import sparse
+
+def get_half_bandwidth(elem_dofs):
+    '''
+    Returns the half-bandwidth of the global stiffness matrix implied by the
+    global degree of freedom numbers at the ends of each element.
+
+    Parameters
+    ----------
+    elem_dofs : numpy array
+        numpy array of shape (n_elem, 6) containing the global dof number for
+        each local dof of each element (0 indicates a restrained dof)
+
+    Returns
+    -------
+    half_bandwidth : int
+        number of super-diagonals required to store the global stiffness matrix
+    '''
+    elem_dofs = np.asarray(elem_dofs)
+    if elem_dofs.size == 0:
+        return 0
+
+    active = elem_dofs != 0
+    big = np.iinfo(elem_dofs.dtype).max
+    dof_max = np.where(active, elem_dofs, 0).max(axis=1)
+    dof_min = np.where(active, elem_dofs, big).min(axis=1)
+
+    has_dof = active.any(axis=1)
+    if not has_dof.any():
+        return 0
+
+    return int((dof_max[has_dof] - dof_min[has_dof]).max())
+
+def sparse_to_banded(matrix, half_bandwidth):
+    '''
+    Converts a sparse symmetric matrix into the upper banded storage format
+    used by scipy.linalg.solveh_banded and scipy.linalg.cholesky_banded.
+
+    Parameters
+    ----------
+    half_bandwidth : int
+        number of super-diagonals to be stored
+    matrix : scipy sparse matrix
+        sparse symmetric matrix of shape (n, n)
+
+    Returns
+    -------
+    banded : numpy array
+        numpy array of shape (half_bandwidth+1, n) where banded[u+i-j, j] = matrix[i, j]
+    '''
+    if not sparse.issparse(matrix):
+        raise TypeError('matrix must be a scipy sparse matrix')
+
+    coo = sparse.coo_matrix(matrix)
+    coo.sum_duplicates()
+    upper = coo.row <= coo.col
+
+    n = matrix.shape[0]
+    banded = np.zeros((half_bandwidth+1, n), dtype=matrix.dtype)
+    banded[half_bandwidth+coo.row[upper]-coo.col[upper], coo.col[upper]] = coo.data[upper]
+
+    return banded
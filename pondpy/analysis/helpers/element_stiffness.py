@@ -0,0 +1,120 @@
+from collections import OrderedDict
+
+import numpy as np
+
+STIFFNESS_CACHE_SIZE = 4096 # Maximum number of element stiffness matrices held in the cache
+
+_stiffness_cache = OrderedDict()
+
+def clear_stiffness_cache():
+    '''
+    Removes all element stiffness matrices from the cache.
+
+    Parameters
+    ----------
+    None
+
+    Returns
+    -------
+    None
+    '''
+    _stiffness_cache.clear()
+
+def frame_element_stiffness(E, A, I, L):
+    '''
+    Calculates the local stiffness matrix of 2D frame elements.
+
+    Parameters
+    ----------
+    A : float
+        cross-sectional area of the elements
+    E : float
+        modulus of elasticity of the elements
+    I : float
+        moment of inertia of the elements
+    L : array_like
+        length of each element
+
+    Returns
+    -------
+    K : numpy array
+        numpy array of shape (n_elem, 6, 6) representing the local stiffness matrix of each element
+    '''
+    L = np.asarray(L, dtype=float).reshape(-1)
+
+    K = np.zeros((len(L), 6, 6))
+    K[:, 0, 0] = (E*A)/L
+    K[:, 1, 1] = (12*E*I)/(L**3)
+    K[:, 1, 2] = (6*E*I)/(L**2)
+    K[:, 1, 4] = -K[:, 1, 1]
+    K[:, 1, 5] = K[:, 1, 2]
+    K[:, 2, 2] = (4*E*I)/(L)
+    K[:, 2, 4] = -K[:, 1, 2]
+    K[:, 2, 5] = 0.5*K[:, 2, 2]
+    K[:, 3, 3] = K[:, 0, 0]
+    K[:, 4, 4] = K[:, 1, 1]
+    K[:, 4, 5] = -K[:, 1, 2]
+    K[:, 5, 5] = K[:, 2, 2]
+
+    # Fill in symmetric terms of K
+    diag = np.einsum('eii->ei', K)
+    K = K + K.transpose(0, 2, 1)
+    K[:, range(6), range(6)] -= diag
+
+    return K
+
+def get_element_stiffness(E, A, I, L, tol):
+    '''
+    Returns the local stiffness matrices of 2D frame elements, sharing one
+    matrix between all elements with the same section properties and a length
+    within tol of each other. Matrices are cached between calls, so elements
+    of different members with the same section and length also share a matrix.
+
+    Parameters
+    ----------
+    A : float
+        cross-sectional area of the elements
+    E : float
+        modulus of elasticity of the elements
+    I : float
+        moment of inertia of the elements
+    L : array_like
+        length of each element
+    tol : float
+        length tolerance within which elements are treated as identical
+
+    Returns
+    -------
+    stiffness_matrices : list
+        list of read-only numpy arrays of shape (6, 6), one for each unique element
+    elem_index : numpy array
+        numpy array of the index into stiffness_matrices for each element
+    '''
+    L = np.asarray(L, dtype=float).reshape(-1)
+
+    # Quantize the element lengths so that lengths within tol share a key
+    if tol > 0:
+        L_key = np.round(L/tol).astype(np.int64)
+    else:
+        L_key = L
+    unique_key, unique_idx, elem_index = np.unique(L_key, return_index=True, return_inverse=True)
+
+    keys = [(E, A, I, tol, key) for key in unique_key.tolist()]
+    missing = [i for i, key in enumerate(keys) if key not in _stiffness_cache]
+
+    # Build the stiffness matrices for any new elements at once
+    if missing:
+        K = frame_element_stiffness(E, A, I, L[unique_idx[missing]])
+        K.flags.writeable = False
+        for i, k in zip(missing, K):
+            _stiffness_cache[keys[i]] = k
+
+    stiffness_matrices = []
+    for key in keys:
+        _stiffness_cache.move_to_end(key)
+        stiffness_matrices.append(_stiffness_cache[key])
+
+    while len(_stiffness_cache) > STIFFNESS_CACHE_SIZE:
+        _stiffness_cache.popitem(last=False)
+
+    return stiffness_matrices, elem_index.reshape(-1)
@@ -0,0 +1,197 @@
+import numpy as np
+
+def trapezoidal_fef(w1, w2, L):
+    '''
+    Calculates the fixed end shears and moments of fixed-fixed beam elements
+    under a linearly varying (trapezoidal or triangular) transverse load.
+
+    Parameters
+    ----------
+    L : array_like
+        length of each element
+    w1 : array_like
+        load intensity at end i of each element
+    w2 : array_like
+        load intensity at end j of each element
+
+    Returns
+    -------
+    v_react_i : numpy array
+        fixed end shear at end i of each element
+    m_react_i : numpy array
+        fixed end moment at end i of each element
+    v_react_j : numpy array
+        fixed end shear at end j of each element
+    m_react_j : numpy array
+        fixed end moment at end j of each element
+    '''
+    w1 = np.asarray(w1, dtype=float)
+    w2 = np.asarray(w2, dtype=float)
+    L = np.asarray(L, dtype=float)
+
+    # Superpose a uniform load of w1 and a triangular load rising from 0 to (w2-w1)
+    v_react_i = L*(7*w1 + 3*w2)/20
+    v_react_j = L*(3*w1 + 7*w2)/20
+    m_react_i = L**2*(3*w1 + 2*w2)/60
+    m_react_j = -L**2*(2*w1 + 3*w2)/60
+
+    return v_react_i, m_react_i, v_react_j, m_react_j
+
+# Three point Gauss-Legendre rule on [0, 1], exact for polynomials up to degree 5
+_GAUSS_POINTS = (np.polynomial.legendre.leggauss(3)[0] + 1)/2
+_GAUSS_WEIGHTS = np.polynomial.legendre.leggauss(3)[1]/2
+
+def _integrate_linear_load(func, w_a, w_b, a, b):
+    '''
+    Integrates func(s)*w(s) over [a, b] for a load varying linearly from w_a
+    at a to w_b at b, exactly when func is a polynomial of degree 4 or less.
+
+    Parameters
+    ----------
+    a : array_like
+        start of each integration interval
+    b : array_like
+        end of each integration interval
+    func : callable
+        function of the integration variable s, evaluated with arrays of shape (n, 3)
+    w_a : array_like
+        load intensity at a
+    w_b : array_like
+        load intensity at b
+
+    Returns
+    -------
+    integral : numpy array
+        value of the integral over each interval
+    '''
+    a = np.asarray(a, dtype=float)[..., None]
+    b = np.asarray(b, dtype=float)[..., None]
+    w_a = np.asarray(w_a, dtype=float)[..., None]
+    w_b = np.asarray(w_b, dtype=float)[..., None]
+
+    s = a + (b-a)*_GAUSS_POINTS
+    w = w_a + (w_b-w_a)*_GAUSS_POINTS
+
+    return np.sum(_GAUSS_WEIGHTS*func(s)*w, axis=-1)*(b-a)[..., 0]
+
+def partial_trapezoidal_fef(w_a, w_b, a, b, L):
+    '''
+    Calculates the fixed end shears and moments of fixed-fixed beam elements
+    under a linearly varying transverse load acting over part of each element.
+    The load is integrated exactly against the cubic Hermite shape functions.
+
+    Parameters
+    ----------
+    L : array_like
+        length of each element
+    a : array_like
+        distance from end i of each element to the start of the load
+    b : array_like
+        distance from end i of each element to the end of the load
+    w_a : array_like
+        load intensity at the start of the load
+    w_b : array_like
+        load intensity at the end of the load
+
+    Returns
+    -------
+    v_react_i : numpy array
+        fixed end shear at end i of each element
+    m_react_i : numpy array
+        fixed end moment at end i of each element
+    v_react_j : numpy array
+        fixed end shear at end j of each element
+    m_react_j : numpy array
+        fixed end moment at end j of each element
+    '''
+    L = np.asarray(L, dtype=float)[..., None]
+
+    v_react_i = _integrate_linear_load(lambda s: 1 - 3*(s/L)**2 + 2*(s/L)**3, w_a, w_b, a, b)
+    m_react_i = _integrate_linear_load(lambda s: s*(1 - s/L)**2, w_a, w_b, a, b)
+    v_react_j = _integrate_linear_load(lambda s: 3*(s/L)**2 - 2*(s/L)**3, w_a, w_b, a, b)
+    m_react_j = _integrate_linear_load(lambda s: s**2*(s/L - 1)/L, w_a, w_b, a, b)
+
+    return v_react_i, m_react_i, v_react_j, m_react_j
+
+def fixed_end_deflection(w_a, w_b, a, b, L, EI, x):
+    '''
+    Calculates the deflection at x of fixed-fixed beam elements under a
+    linearly varying transverse load acting over part of each element.
+
+    Parameters
+    ----------
+    EI : float
+        flexural rigidity of the elements
+    L : array_like
+        length of each element
+    a : array_like
+        distance from end i of each element to the start of the load
+    b : array_like
+        distance from end i of each element to the end of the load
+    w_a : array_like
+        load intensity at the start of the load
+    w_b : array_like
+        load intensity at the end of the load
+    x : array_like
+        distance from end i of each element to the point of interest
+
+    Returns
+    -------
+    deflection : numpy array
+        deflection at x of each element
+    '''
+    w_a = np.asarray(w_a, dtype=float)
+    w_b = np.asarray(w_b, dtype=float)
+    a = np.asarray(a, dtype=float)
+    b = np.asarray(b, dtype=float)
+    L_ = np.asarray(L, dtype=float)
+    x_ = np.asarray(x, dtype=float)
+    L = L_[..., None]
+    x = x_[..., None]
+
+    # Split the load at x, integrating the Green's function of the fixed-fixed
+    # beam, G(x, s), separately on either side of the point of interest
+    slope = np.divide(w_b-w_a, b-a, out=np.zeros_like(w_a), where=(b > a))
+    split = np.clip(x_, a, b)
+    w_split = w_a + slope*(split-a)
+
+    left = _integrate_linear_load(lambda s: (L-x)**2*s**2*(3*x*L - (2*x+L)*s), w_a, w_split, a, split)
+    right = _integrate_linear_load(lambda s: (L-s)**2*x**2*(3*s*L - (2*s+L)*x), w_split, w_b, split, b)
+
+    return (left + right)/(6*EI*L_**3)
+
+def linear_load_moment(w_a, w_b, a, b, x):
+    '''
+    Calculates the moment at x due to the part of a linearly varying transverse
+    load that acts between the start of the element and x.
+
+    Parameters
+    ----------
+    a : array_like
+        distance from end i of each element to the start of the load
+    b : array_like
+        distance from end i of each element to the end of the load
+    w_a : array_like
+        load intensity at the start of the load
+    w_b : array_like
+        load intensity at the end of the load
+    x : array_like
+        distance from end i of each element to the point of interest
+
+    Returns
+    -------
+    moment : numpy array
+        moment at x due to the load acting to the left of x
+    '''
+    w_a = np.asarray(w_a, dtype=float)
+    w_b = np.asarray(w_b, dtype=float)
+    a = np.asarray(a, dtype=float)
+    b = np.asarray(b, dtype=float)
+    x_ = np.asarray(x, dtype=float)
+    x = x_[..., None]
+
+    slope = np.divide(w_b-w_a, b-a, out=np.zeros_like(w_a), where=(b > a))
+    split = np.clip(x_, a, b)
+    w_split = w_a + slope*(split-a)
+
+    return _integrate_linear_load(lambda s: x-s, w_a, w_split, a, split)
@@ -0,0 +1,69 @@
+import numpy as np
+
+def aitken_step(x, g, prev_residual, prev_factor):
+    '''
+    Calculates the next iterate of a fixed-point iteration x = g(x) using
+    vector Aitken (Irons-Tuck) relaxation, which adapts the relaxation factor
+    from the change in the residual between iterations.
+
+    Parameters
+    ----------
+    g : numpy array
+        numpy array representing the fixed-point map evaluated at x
+    prev_factor : float
+        relaxation factor used in the previous iteration
+    prev_residual : numpy array
+        numpy array representing the residual g - x of the previous iteration (None for the first iteration)
+    x : numpy array
+        numpy array representing the current iterate
+
+    Returns
+    -------
+    x_next : numpy array
+        numpy array representing the next iterate
+    factor : float
+        relaxation factor used for the next iterate
+    '''
+    residual = g - x
+    factor = prev_factor
+    if prev_residual is not None:
+        d_residual = residual - prev_residual
+        denom = np.dot(d_residual, d_residual)
+        if denom > 0:
+            factor = -prev_factor*np.dot(prev_residual, d_residual)/denom
+
+    return x + factor*residual, factor
+
+def anderson_step(x_hist, g_hist, mixing):
+    '''
+    Calculates the next iterate of a fixed-point iteration x = g(x) using
+    Anderson mixing, which combines the previous iterates to minimize the
+    linearized residual.
+
+    Parameters
+    ----------
+    g_hist : list
+        list of numpy arrays representing the fixed-point map evaluated at each iterate in x_hist
+    mixing : float
+        mixing factor applied to the combined residual
+    x_hist : list
+        list of numpy arrays representing the most recent iterates, oldest first
+
+    Returns
+    -------
+    x_next : numpy array
+        numpy array representing the next iterate
+    '''
+    X = np.array(x_hist)
+    G = np.array(g_hist)
+    F = G - X
+
+    if len(F) < 2:
+        return X[-1] + mixing*F[-1]
+
+    # Least squares combination of the residual differences
+    dF = np.diff(F, axis=0).T
+    dG = np.diff(G, axis=0).T
+    gamma = np.linalg.lstsq(dF, F[-1], rcond=None)[0]
+
+    return G[-1] - dG @ gamma - (1-mixing)*(F[-1] - dF @ gamma)
@@ -0,0 +1,201 @@
+import numpy as np
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+NUMBA_AVAILABLE = numba is not None
+
+def _node_fef_loop(elem_nodes, elem_loads, n_nodes):
+    '''Loop implementation of node_fef(), compiled with numba when available.'''
+    node_fef = np.zeros((n_nodes, 3))
+    for i_elem in range(elem_nodes.shape[0]):
+        for i_dof in range(3):
+            node_fef[elem_nodes[i_elem, 0], i_dof] += elem_loads[i_elem, i_dof]
+            node_fef[elem_nodes[i_elem, 1], i_dof] += elem_loads[i_elem, i_dof+3]
+
+    return node_fef
+
+def _node_fef_numpy(elem_nodes, elem_loads, n_nodes):
+    '''NumPy implementation of node_fef().'''
+    node_fef = np.zeros((n_nodes, 3))
+    np.add.at(node_fef, elem_nodes[:, 0], elem_loads[:, :3])
+    np.add.at(node_fef, elem_nodes[:, 1], elem_loads[:, 3:])
+
+    return node_fef
+
+def _stiffness_triplets_loop(elem_dofs, stiffness, elem_index):
+    '''Loop implementation of stiffness_triplets(), compiled with numba when available.'''
+    n_active = 0
+    for i_elem in range(elem_dofs.shape[0]):
+        for i in range(6):
+            for j in range(6):
+                if elem_dofs[i_elem, i] != 0 and elem_dofs[i_elem, j] != 0:
+                    n_active += 1
+
+    rows = np.empty(n_active, dtype=np.int64)
+    cols = np.empty(n_active, dtype=np.int64)
+    data = np.empty(n_active)
+    n_active = 0
+    for i_elem in range(elem_dofs.shape[0]):
+        for i in range(6):
+            for j in range(6):
+                if elem_dofs[i_elem, i] != 0 and elem_dofs[i_elem, j] != 0:
+                    rows[n_active] = elem_dofs[i_elem, i] - 1
+                    cols[n_active] = elem_dofs[i_elem, j] - 1
+                    data[n_active] = stiffness[elem_index[i_elem], i, j]
+                    n_active += 1
+
+    return rows, cols, data
+
+def _stiffness_triplets_numpy(elem_dofs, stiffness, elem_index):
+    '''NumPy implementation of stiffness_triplets().'''
+    K = stiffness[elem_index]
+    rows = np.broadcast_to(elem_dofs[:, :, None], K.shape)
+    cols = np.broadcast_to(elem_dofs[:, None, :], K.shape)
+    active = (rows != 0) & (cols != 0)
+
+    return rows[active]-1, cols[active]-1, K[active]
+
+def _bmd_values_loop(element_forces):
+    '''Loop implementation of bmd_values(), compiled with numba when available.'''
+    n_elem = element_forces.shape[0]
+    bmd_val = np.zeros(2*(n_elem+1))
+    for i_elem in range(n_elem):
+        bmd_val[2*i_elem] = -element_forces[i_elem, 2]/12
+        bmd_val[2*i_elem+1] = bmd_val[2*i_elem]
+    bmd_val[2*n_elem] = element_forces[n_elem-1, 5]/12
+    bmd_val[2*n_elem+1] = bmd_val[2*n_elem]
+
+    return bmd_val
+
+def _bmd_values_numpy(element_forces):
+    '''NumPy implementation of bmd_values().'''
+    return np.repeat(np.append(-element_forces[:, 2], element_forces[-1, 5])/12, 2)
+
+def _sfd_values_loop(element_forces):
+    '''Loop implementation of sfd_values(), compiled with numba when available.'''
+    n_elem = element_forces.shape[0]
+    sfd_val = np.zeros(2*(n_elem+1))
+    for i_elem in range(n_elem):
+        sfd_val[2*i_elem+1] = element_forces[i_elem, 1]
+        sfd_val[2*i_elem+2] = -element_forces[i_elem, 4]
+
+    return sfd_val
+
+def _sfd_values_numpy(element_forces):
+    '''NumPy implementation of sfd_values().'''
+    return np.concatenate(([0.0], np.column_stack((element_forces[:, 1], -element_forces[:, 4])).ravel(), [0.0]))
+
+if NUMBA_AVAILABLE:
+    _node_fef_jit = numba.njit(cache=True)(_node_fef_loop)
+    _stiffness_triplets_jit = numba.njit(cache=True)(_stiffness_triplets_loop)
+    _bmd_values_jit = numba.njit(cache=True)(_bmd_values_loop)
+    _sfd_values_jit = numba.njit(cache=True)(_sfd_values_loop)
+
+def bmd_values(element_forces, jit=False):
+    '''
+    Returns the bending moment diagram values in k-ft, with each node
+    repeated, from the forces at each end of each element.
+
+    Parameters
+    ----------
+    element_forces : numpy array
+        numpy array of shape (n_elem, 6) representing the forces at each end of each element
+    jit : bool, optional
+        indicates whether to use the compiled kernel
+
+    Returns
+    -------
+    bmd_val : numpy array
+        numpy array of shape (2*n_nodes,) representing the bending moment at each node
+    '''
+    element_forces = np.ascontiguousarray(element_forces, dtype=float)
+    if jit:
+        return _bmd_values_jit(element_forces)
+
+    return _bmd_values_numpy(element_forces)
+
+def node_fef(elem_nodes, elem_loads, n_nodes, jit=False):
+    '''
+    Sums the fixed end forces of the elements at each node.
+
+    Parameters
+    ----------
+    elem_loads : numpy array
+        numpy array of shape (n_elem, 6) representing the fixed end forces of each element
+    elem_nodes : numpy array
+        numpy array of shape (n_elem, 2) representing the node number at each end of each element
+    jit : bool, optional
+        indicates whether to use the compiled kernel
+    n_nodes : int
+        number of nodes in the model
+
+    Returns
+    -------
+    node_fef : numpy array
+        numpy array of shape (n_nodes, 3) representing the fixed end forces at each node
+    '''
+    elem_nodes = np.ascontiguousarray(elem_nodes, dtype=np.int64)
+    elem_loads = np.ascontiguousarray(elem_loads, dtype=float)
+    if jit:
+        return _node_fef_jit(elem_nodes, elem_loads, n_nodes)
+
+    return _node_fef_numpy(elem_nodes, elem_loads, n_nodes)
+
+def sfd_values(element_forces, jit=False):
+    '''
+    Returns the shear force diagram values in k, with each node repeated,
+    from the forces at each end of each element.
+
+    Parameters
+    ----------
+    element_forces : numpy array
+        numpy array of shape (n_elem, 6) representing the forces at each end of each element
+    jit : bool, optional
+        indicates whether to use the compiled kernel
+
+    Returns
+    -------
+    sfd_val : numpy array
+        numpy array of shape (2*n_nodes,) representing the shear force on either side of each node
+    '''
+    element_forces = np.ascontiguousarray(element_forces, dtype=float)
+    if jit:
+        return _sfd_values_jit(element_forces)
+
+    return _sfd_values_numpy(element_forces)
+
+def stiffness_triplets(elem_dofs, stiffness, elem_index, jit=False):
+    '''
+    Returns the row, column, and value of every element stiffness term
+    coupling two unrestrained dof, for assembly into the global stiffness matrix.
+
+    Parameters
+    ----------
+    elem_dofs : numpy array
+        numpy array of shape (n_elem, 6) representing the global dof number of each local dof (0 = restrained)
+    elem_index : numpy array
+        numpy array of the index into stiffness for each element
+    jit : bool, optional
+        indicates whether to use the compiled kernel
+    stiffness : numpy array
+        numpy array of shape (n_unique, 6, 6) representing the unique element stiffness matrices
+
+    Returns
+    -------
+    rows : numpy array
+        numpy array of the (zero-based) global row of each term
+    cols : numpy array
+        numpy array of the (zero-based) global column of each term
+    data : numpy array
+        numpy array of the value of each term
+    '''
+    elem_dofs = np.ascontiguousarray(elem_dofs, dtype=np.int64)
+    stiffness = np.ascontiguousarray(stiffness, dtype=float)
+    elem_index = np.ascontiguousarray(elem_index, dtype=np.int64)
+    if jit:
+        return _stiffness_triplets_jit(elem_dofs, stiffness, elem_index)
+
+    return _stiffness_triplets_numpy(elem_dofs, stiffness, elem_index)
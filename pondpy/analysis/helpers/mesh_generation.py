@@ -0,0 +1,107 @@
+import numpy as np
+
+def find_nodes(nodes, locations, tol):
+    '''
+    Finds the index of the node matching each location to within a tolerance.
+
+    Parameters
+    ----------
+    locations : array_like
+        locations to be matched to the nodes
+    nodes : numpy array
+        sorted numpy array of node locations
+    tol : float
+        maximum distance between a location and its matching node
+
+    Returns
+    -------
+    indices : numpy array
+        numpy array containing the index of the matching node for each
+        location, or -1 where no node lies within the tolerance
+    '''
+    nodes = np.asarray(nodes, dtype=float)
+    locations = np.atleast_1d(np.asarray(locations, dtype=float))
+    if nodes.size == 0:
+        return np.full(locations.shape, -1, dtype=int)
+
+    # Compare each location to the nodes on either side of its insertion point
+    right = np.clip(np.searchsorted(nodes, locations), 0, nodes.size-1)
+    left = np.clip(right-1, 0, nodes.size-1)
+    use_left = np.abs(locations-nodes[left]) <= np.abs(locations-nodes[right])
+    nearest = np.where(use_left, left, right)
+
+    return np.where(np.abs(locations-nodes[nearest]) <= tol, nearest, -1)
+
+def subdivide_segments(points, max_spacing):
+    '''
+    Subdivides the segments between consecutive points into equal sub-segments
+    no longer than the maximum spacing.
+
+    Parameters
+    ----------
+    max_spacing : int, float, or array_like
+        maximum length of each sub-segment, either for all segments or for each segment
+    points : numpy array
+        sorted numpy array of segment end points
+
+    Returns
+    -------
+    nodes : numpy array
+        sorted numpy array of node locations, including the original points
+    '''
+    points = np.asarray(points, dtype=float)
+    if points.size < 2:
+        return points.copy()
+
+    seg_start = points[:-1]
+    seg_length = np.diff(points)
+    n_sub = np.ceil(seg_length/max_spacing).astype(int)
+
+    # Local sub-segment number of every node except the last point
+    seg_idx = np.repeat(np.arange(n_sub.size), n_sub)
+    local_idx = np.arange(seg_idx.size) - np.repeat(np.cumsum(n_sub)-n_sub, n_sub)
+
+    nodes = (seg_length/n_sub)[seg_idx]*local_idx + seg_start[seg_idx]
+
+    return np.append(nodes, points[-1])
+
+def unique_with_tolerance(values, tol, priority=None):
+    '''
+    Returns the sorted unique values, treating values within the tolerance of
+    their neighbour as duplicates.
+
+    Parameters
+    ----------
+    priority : array_like, optional
+        priority of each value; the value with the highest priority is kept
+        from each group of duplicates (ties keep the smallest value)
+    tol : float
+        maximum distance between values to be considered duplicates
+    values : array_like
+        values to be made unique
+
+    Returns
+    -------
+    unique : numpy array
+        sorted numpy array of unique values
+    '''
+    values = np.asarray(values, dtype=float).ravel()
+    if values.size == 0:
+        return values
+
+    if priority is None:
+        priority = np.zeros(values.size)
+    priority = np.asarray(priority).ravel()
+
+    order = np.argsort(values, kind='stable')
+    values = values[order]
+    priority = priority[order]
+
+    # Start a new group wherever the gap to the previous value exceeds the tolerance
+    group = np.concatenate(([0], np.cumsum(np.diff(values) > tol)))
+
+    # Within each group keep the value with the highest priority
+    keep = np.lexsort((np.arange(values.size), -priority, group))
+    first = np.concatenate(([True], np.diff(group[keep]) != 0))
+
+    return values[keep[first]]
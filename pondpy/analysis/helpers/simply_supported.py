@@ -0,0 +1,59 @@
+import numpy as np
+
+def simply_supported_displacements(x, force, moment, EI):
+    '''
+    Calculates the deflection and rotation at each node of a simply supported
+    beam under transverse forces and moments applied at the nodes. The beam is
+    statically determinate, so the bending moment is found from statics and
+    integrated exactly between the nodes, where it varies linearly.
+
+    Loads for several load cases may be passed as arrays of shape (n_nodes, n_cases).
+
+    Parameters
+    ----------
+    EI : float
+        flexural rigidity of the beam
+    force : array_like
+        transverse force at each node (positive upward)
+    moment : array_like
+        moment at each node (positive counterclockwise)
+    x : array_like
+        location of each node along the beam, with the supports at the first and last nodes
+
+    Returns
+    -------
+    deflection : numpy array
+        deflection at each node (positive upward)
+    rotation : numpy array
+        rotation at each node (positive counterclockwise)
+    '''
+    force = np.asarray(force, dtype=float)
+    moment = np.asarray(moment, dtype=float)
+    x = np.asarray(x, dtype=float)
+    x = (x - x[0]).reshape((-1,) + (1,)*(force.ndim-1))
+    L = x[-1]
+
+    # Support reactions from the equilibrium of the whole beam
+    r_b = -(np.sum(force*x, axis=0) + np.sum(moment, axis=0))/L
+    r_a = -np.sum(force, axis=0) - r_b
+    force = force.copy()
+    force[0] += r_a
+
+    # Shear and sagging moment just to the right of each node
+    shear = np.cumsum(force, axis=0)
+    m_right = x*shear - np.cumsum(force*x, axis=0) - np.cumsum(moment, axis=0)
+
+    # Integrate the linear moment over each element for the rotation and
+    # deflection relative to a zero rotation at the left support
+    h = np.diff(x, axis=0)
+    m_a = m_right[:-1]
+    m_b = m_a + shear[:-1]*h
+
+    zero = np.zeros((1,) + force.shape[1:])
+    rotation = np.concatenate((zero, np.cumsum(h*(m_a+m_b)/(2*EI), axis=0)))
+    deflection = np.concatenate((zero, np.cumsum(h*rotation[:-1] + h**2*(2*m_a+m_b)/(6*EI), axis=0)))
+
+    # Rotate the beam about the left support so that it deflects zero at the right support
+    rotation_a = -deflection[-1]/L
+
+    return deflection + rotation_a*x, rotation + rotation_a
@@ -1,3 +1,5 @@
+import numpy as np
+
 from pondpy import (
     AnalysisError,
     Beam,
@@ -5,9 +7,13 @@ from pondpy import (
     DistLoad,
     PointLoad,
 )
+from .fem_analysis import precision_types
 
 CONV_D_TO_Q = 62.4/(12**3)/1000 # Constant to convert water depth in inches to rain load in k/in^2
 
+ADAPTIVE_COARSENING = 4 # Node spacing outside refinement zones as a multiple of max_node_spacing (adaptive mesh only)
+ADAPTIVE_ZONE_WIDTH = 4 # Half-width of each refinement zone as a multiple of max_node_spacing (adaptive mesh only)
+
 class Loading:
     '''
     A class to represent the loading criteria for a roof bay.
@@ -53,16 +59,16 @@ class PrimaryMember(Beam):
 
     Attributes
     ----------
-    dloads : list
-        list of dist load objects
+    dloads : list or numpy array
+        list of dist load objects or structured array with dtype DistLoad.array_dtype
     length : float
         length of the beam
     size : steel beam size object
         steel beam size object for the beam
     supports : list
         list of tuples indicating location and type of beam supports
-    ploads : list
-        list of point load objects
+    ploads : list or numpy array
+        list of point load objects or structured array with dtype PointLoad.array_dtype
     '''
     pass
 
@@ -268,14 +274,27 @@ class RoofBayModel:
 
     Attributes
     ----------
+    adaptive_mesh : bool
+        indicates whether the beam models are meshed coarsely away from supports, point loads, and the ponding front
     analysis_complete : bool
         bool indicating whether the analysis has been successfully performed
     analysis_ready : bool
         bool indicating whether the analysis has been initialized and is ready to be performed
+    influence : bool
+        indicates whether the deflection and reaction influence matrices of the beam models are precomputed
+    influence_matrices : dict
+        dictionary containing the influence matrices of each primary and secondary member (empty if influence is False)
     initial_impounded_depth : dict
         dictionary containing initial impounded water depth in inches for each primary and secondary member
+    low_memory : bool
+        indicates whether the beam models are created in low memory mode
     max_node_spacing : int or float
         maximum node spacing along length of beam model objects in inches
+    precision : str
+        floating point precision of the beam models ('float64' or 'float32')
+    ponding_fronts : list
+        list containing the location of the ponding front in inches along each secondary member about which
+        its mesh is refined (None if the member has no ponding front or the mesh is not adaptive)
     primary_models : list
         list of beam model objects for the primary framing members
     roof_bay : roof bay
@@ -285,22 +304,36 @@ class RoofBayModel:
 
     Methods
     -------
-    analyze_roof_bay(rain_load):
+    analyze_roof_bay(rain_load, refine=False):
         Analyzes the roof bay for the dead load and the input rain loads.
     generate_plots():
         Generates the deflected shape, shear force diagram, and bending moment diagram plots for each primary and secondary member.
+    get_influence_deflections(impounded_depth):
+        Calculates the deflections of the primary and secondary members for an impounded water depth using the influence matrices.
     initialize_analysis():
         Prepares the model for analysis. To be called at instantiation and when the user specifies.
     '''
 
-    def __init__(self, roof_bay, max_node_spacing = 6):
+    def __init__(self, roof_bay, max_node_spacing = 6, low_memory=False, adaptive_mesh=False, precision='float64', influence=False):
         '''
         Constructs all the necessary attributes for the roof bay object.
 
         Parameters
         ----------
+        adaptive_mesh : bool, optional
+            indicates whether to mesh the beam models at max_node_spacing only near supports, point loads, and
+            the ponding front, coarsening elsewhere and re-meshing when the ponding front leaves its refined zone
+        influence : bool, optional
+            indicates whether to precompute the deflection and reaction influence matrices of the beam models,
+            so the response to any impounded water depth is found by matrix-vector products (not available
+            with adaptive_mesh, as the meshes then change between iterations)
+        low_memory : bool, optional
+            indicates whether the beam models should be created in low memory mode
         max_node_spacing : int or float, optional
             maximum node spacing along length of beam model objects in inches
+        precision : str, optional
+            floating point precision of the beam models. 'float32' halves their memory use at reduced
+            accuracy; analyze_roof_bay(rain_load, refine=True) recovers float64 accuracy
         roof_bay : roof bay
             roof bay object
         '''
@@ -308,9 +341,24 @@ class RoofBayModel:
             raise TypeError('roof_bay must be a valid RoofBay object')
         if not isinstance(max_node_spacing, (int, float)):
             raise TypeError('max_node_spacing must be int or float')
-
+        if not isinstance(low_memory, bool):
+            raise TypeError('low_memory must be either True or False')
+        if not isinstance(adaptive_mesh, bool):
+            raise TypeError('adaptive_mesh must be either True or False')
+        if not isinstance(precision, str) or precision not in precision_types:
+            raise TypeError('precision must be a string. Options are: float64, float32.')
+        if not isinstance(influence, bool):
+            raise TypeError('influence must be either True or False')
+        if influence and adaptive_mesh:
+            raise TypeError('influence cannot be used with adaptive_mesh')
+
+        self.adaptive_mesh = adaptive_mesh
         self.analysis_complete = False
         self.analysis_ready = False
+        self.influence = influence
+        self.influence_matrices = {}
+        self.low_memory = low_memory
+        self.precision = precision
         self.roof_bay = roof_bay
         self.max_node_spacing = max_node_spacing
 
@@ -324,38 +372,113 @@ class RoofBayModel:
         '''
         s_spacing = self.roof_bay.secondary_spacing
         for i_pmodel, p_model in enumerate(self.primary_models):
-            ploads = []
+            ploads = np.zeros(len(self.secondary_models), dtype=PointLoad.array_dtype)
             for i_smodel, s_model in enumerate(self.secondary_models):
-                sup_reactions = [s_model.support_reactions[node] for node in s_model.support_nodes]
-                x_load = s_spacing*i_smodel
+                sup_reactions = s_model.get_support_reactions()
+                reaction = -1*sup_reactions[i_pmodel]
 
-                reaction = tuple(-1*sup_reactions[i_pmodel])
-                cur_pload = [PointLoad(x_load, reaction)]
-                ploads.extend(cur_pload)
+                ploads[i_smodel] = (s_spacing*i_smodel, *reaction)
+
+            p_model.add_beam_pload(ploads, add_type='replace')
 
-                p_model.add_beam_pload(ploads, add_type='replace')
-            
     def _apply_secondary_loads(self, rain_load):
         '''
         Applies the dead and rain loading to each SecondaryMember object in the RoofBayModel object.
 
         Parameters
         ----------
-        rain_load : list
-            list of dist load objects representing the rain load on the roof bay
+        rain_load : dict
+            dictionary containing a list of dist load objects or a DistLoad structured array
+            representing the rain load on each secondary member
         '''
         for i_smodel, s_model in enumerate(self.secondary_models):
-            dloads = []
             # Retrieve the dead load from secondary_dl dictionary
-            s_dl = [self.roof_bay.secondary_dl[i_smodel][0]]
-            dloads.extend(s_dl)
+            s_dl = DistLoad.to_array([self.roof_bay.secondary_dl[i_smodel][0]])
 
-            # Retrieve the rain loads from input rain_load list
+            # Retrieve the rain loads from input rain_load dictionary
             s_rl = rain_load[i_smodel]
-            dloads.extend(s_rl)
+            if not isinstance(s_rl, np.ndarray):
+                s_rl = DistLoad.to_array(s_rl)
 
-            s_model.add_beam_dload(dloads, add_type='replace')
+            s_model.add_beam_dload(np.concatenate((s_dl, s_rl)), add_type='replace')
         
+    def _create_influence_matrices(self):
+        '''
+        Precomputes the influence matrices of each primary and secondary member. For each secondary member,
+        these give the deflection at each node and the support reactions per inch of impounded water depth at
+        each node, with the rain load varying linearly between nodes. For each primary member, these give the
+        deflection at each secondary member location per kip of upward point load at each secondary member
+        location. The response to the dead loads is stored with each set of matrices.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        '''
+        trib_w = self.roof_bay.secondary_tribw
+        s_locations = self.roof_bay.secondary_spacing*np.arange(len(self.secondary_models))
+
+        secondary_influence = {}
+        for i_smodel, s_model in enumerate(self.secondary_models):
+            nodes = np.asarray(s_model.model_nodes, dtype=float)
+            s_dl = DistLoad.to_array([self.roof_bay.secondary_dl[i_smodel][0]])
+
+            # Rain load for a unit depth at each node, varying linearly to zero at the adjacent nodes
+            w_unit = -CONV_D_TO_Q*trib_w[i_smodel]
+            load_cases = [s_model.get_load_case(dloads=s_dl)]
+            for i_node in range(len(nodes)):
+                elems = [i_elem for i_elem in (i_node-1, i_node) if 0 <= i_elem < len(nodes)-1]
+                unit_rl = np.zeros(len(elems), dtype=DistLoad.array_dtype)
+                unit_rl['x_i'] = nodes[elems]
+                unit_rl['x_j'] = nodes[np.add(elems, 1)]
+                unit_rl['wy_i'] = np.where(np.equal(elems, i_node), w_unit, 0)
+                unit_rl['wy_j'] = np.where(np.equal(elems, i_node), 0, w_unit)
+                load_cases.append(s_model.get_load_case(dloads=unit_rl))
+
+            load_vectors, elem_loads = zip(*load_cases)
+            displacements, element_forces = s_model.solve_load_cases(np.array(load_vectors), np.array(elem_loads))
+            deflections = self._get_nodal_deflections(s_model, displacements)
+            reactions = np.array([s_model._get_support_reactions(forces)[s_model.support_nodes] for forces in element_forces])
+
+            secondary_influence[i_smodel] = {
+                'Dead Deflection':deflections[0],
+                'Dead Reaction':reactions[0],
+                'Deflection':deflections[1:].T,
+                'Reaction':reactions[1:].transpose(1, 2, 0),
+            }
+
+        primary_influence = {}
+        for p_model in self.primary_models:
+            # Solve on a temporary model with nodes at the secondary member locations, where the reactions
+            # will be applied, so the loads and results of the primary member model are left unchanged
+            ploads = np.zeros(len(s_locations), dtype=PointLoad.array_dtype)
+            ploads['x'] = s_locations
+            p_beam = p_model.beam
+            temp_model = BeamModel(Beam(p_beam.length, p_beam.size, p_beam.supports, ploads=ploads, dloads=p_beam.dloads), max_node_spacing=self.max_node_spacing, precision=self.precision)
+
+            load_cases = [temp_model.get_load_case(dloads=p_beam.dloads)]
+            for i_smodel in range(len(s_locations)):
+                unit_pload = ploads[i_smodel:i_smodel+1].copy()
+                unit_pload['py'] = 1
+                load_cases.append(temp_model.get_load_case(ploads=unit_pload))
+
+            load_vectors, elem_loads = zip(*load_cases)
+            displacements, _ = temp_model.solve_load_cases(np.array(load_vectors), np.array(elem_loads))
+            deflections = self._get_nodal_deflections(temp_model, displacements)[:, temp_model.get_node_index(s_locations)]
+
+            primary_influence[len(primary_influence)] = {
+                'Dead Deflection':deflections[0],
+                'Deflection':deflections[1:].T,
+            }
+
+        self.influence_matrices = {
+            'Primary':primary_influence,
+            'Secondary':secondary_influence,
+        }
+
     def _create_primary_models(self):
         '''
         Creates BeamModels for each primary member in the roof bay, adds the primary member self-weight (if enabled)
@@ -371,7 +494,13 @@ class RoofBayModel:
         '''
         primary_models = []
         for idx, p_mem in enumerate(self.roof_bay.primary_framing.primary_members):
-            cur_model = BeamModel(p_mem, max_node_spacing=self.max_node_spacing, ini_analysis=True)
+            if self.adaptive_mesh:
+                # Refine the mesh about the supports and the secondary member locations
+                cur_model = BeamModel(p_mem, max_node_spacing=ADAPTIVE_COARSENING*self.max_node_spacing, ini_analysis=True, low_memory=self.low_memory, precision=self.precision)
+                s_locations = [self.roof_bay.secondary_spacing*i_smodel for i_smodel in range(len(self.roof_bay.secondary_framing.secondary_members))]
+                cur_model.set_mesh_refinement(self._get_refinement_zones(p_mem, s_locations), self.max_node_spacing)
+            else:
+                cur_model = BeamModel(p_mem, max_node_spacing=self.max_node_spacing, ini_analysis=True, low_memory=self.low_memory, precision=self.precision)
 
             # Retrieve self-weight from primary_sw dictionary
             p_sw = self.roof_bay.primary_sw[idx]
@@ -396,8 +525,25 @@ class RoofBayModel:
         None
         '''
         secondary_models = []
+        ponding_fronts = []
         for idx, s_mem in enumerate(self.roof_bay.secondary_framing.secondary_members):
-            cur_model = BeamModel(s_mem, max_node_spacing=self.max_node_spacing, ini_analysis=True)
+            if self.adaptive_mesh:
+                # Refine the mesh about the supports and the initial ponding front. Exact elements
+                # are used so that the rain load does not add nodes outside the refined zones.
+                cur_model = BeamModel(
+                    s_mem,
+                    max_node_spacing=ADAPTIVE_COARSENING*self.max_node_spacing,
+                    ini_analysis=True,
+                    low_memory=self.low_memory,
+                    element_type='exact',
+                    precision=self.precision,
+                )
+                front = self._get_ponding_front(s_mem, self._initial_ponding_profile()[2])
+                cur_model.set_mesh_refinement(self._get_refinement_zones(s_mem, [] if front is None else [front]), self.max_node_spacing)
+            else:
+                cur_model = BeamModel(s_mem, max_node_spacing=self.max_node_spacing, ini_analysis=True, low_memory=self.low_memory, precision=self.precision)
+                front = None
+            ponding_fronts.append(front)
 
             # Retrieve dead load from secondary_dl dictionary
             s_dl = self.roof_bay.secondary_dl[idx]
@@ -406,8 +552,73 @@ class RoofBayModel:
 
             secondary_models.append(cur_model)
 
+        self.ponding_fronts = ponding_fronts
         self.secondary_models = secondary_models
 
+    def _get_nodal_deflections(self, model, displacements):
+        '''
+        Gathers the vertical deflection at each node of a beam model from its global displacements.
+
+        Parameters
+        ----------
+        displacements : numpy array
+            numpy array of shape (n_cases, n_dof) representing the displacement at each global degree of freedom
+        model : beam model
+            beam model object
+
+        Returns
+        -------
+        deflections : numpy array
+            numpy array of shape (n_cases, n_nodes) representing the vertical deflection at each node
+        '''
+        dof = np.asarray(model.dof_num, dtype=int).reshape(-1, 3)[:, 1]
+        padded = np.concatenate((np.zeros((len(displacements), 1)), displacements), axis=1)
+
+        return padded[:, dof]
+
+    def _get_ponding_front(self, member, ponding_length):
+        '''
+        Returns the location of the ponding front along a secondary member.
+
+        Parameters
+        ----------
+        member : secondary member
+            secondary member object
+        ponding_length : float
+            length of impounded water along the secondary member in inches
+
+        Returns
+        -------
+        front : float
+            location of the ponding front in inches (None if the member is completely wet or dry)
+        '''
+        if 0 < ponding_length < member.length:
+            return float(ponding_length)
+
+        return None
+
+    def _get_refinement_zones(self, member, locations):
+        '''
+        Returns the mesh refinement zones about the supports of a member and
+        the specified locations along its length.
+
+        Parameters
+        ----------
+        locations : list
+            list of locations along the member in inches, such as point loads and ponding fronts
+        member : beam
+            primary or secondary member object
+
+        Returns
+        -------
+        zones : list
+            list of tuples indicating the start and end of each refinement zone in inches
+        '''
+        half_width = ADAPTIVE_ZONE_WIDTH*self.max_node_spacing
+        centers = [support[0] for support in member.supports] + list(locations)
+
+        return [(center-half_width, center+half_width) for center in centers]
+
     def _get_secondary_rl(self, impounded_depth):
         '''
         Calculates the rain load at each node along the length of each secondary member based on the impounded
@@ -420,39 +631,54 @@ class RoofBayModel:
 
         Returns
         -------
-        None
+        secondary_rl : dict
+            dictionary containing a DistLoad structured array with one rain load per element for each secondary member
         '''
         trib_w = self.roof_bay.secondary_tribw
 
         secondary_rl = {}
         for i_member, member in enumerate(self.secondary_models):
-            member_rl = []
             cur_tribw = trib_w[i_member] # inches
-            # Calculate distributed rain load for each member
-            for i_node, node in enumerate(member.model_nodes[:-1]):
-                if i_node < len(member.model_nodes):
-                    x_i_rl = node # inches
-                    x_j_rl = member.model_nodes[i_node+1] # inches
+            nodes = np.asarray(member.model_nodes, dtype=float) # inches
+            depth = np.asarray(impounded_depth['Secondary'][i_member], dtype=float) # inches
 
-                    depth_i = impounded_depth['Secondary'][i_member][i_node] # inches
-                    depth_j = impounded_depth['Secondary'][i_member][i_node+1] # inches
+            # Calculate distributed rain load for each element
+            w_rl = depth*CONV_D_TO_Q*cur_tribw # k/in
 
-                    q_rl_i = depth_i*CONV_D_TO_Q # k/in^2
-                    q_rl_j = depth_j*CONV_D_TO_Q # k/in^2
+            member_rl = np.zeros(len(nodes)-1, dtype=DistLoad.array_dtype)
+            member_rl['x_i'] = nodes[:-1]
+            member_rl['x_j'] = nodes[1:]
+            member_rl['wy_i'] = -w_rl[:-1]
+            member_rl['wy_j'] = -w_rl[1:]
 
-                    w_rl_i = q_rl_i*cur_tribw # k/in
-                    w_rl_j = q_rl_j*cur_tribw # k/in
+            secondary_rl[i_member] = member_rl
 
-                    cur_rl = DistLoad(location=(x_i_rl, x_j_rl), magnitude=((0, 0), (-w_rl_i, -w_rl_j), (0, 0)))
+        return secondary_rl
 
-                member_rl.append(cur_rl)
+    def _initial_ponding_profile(self):
+        '''
+        Calculates the initial depth of impounded water at end i of the secondary members, the roof slope,
+        and the initial length of impounded water along the secondary members.
 
-            if i_member not in secondary_rl.keys():
-                secondary_rl[i_member] = []
+        Parameters
+        ----------
+        None
 
-            secondary_rl[i_member].extend(member_rl)
+        Returns
+        -------
+        d_impounded_i : float
+            depth of impounded water at end i of the secondary members in inches
+        roof_slope : float
+            roof slope in in/in
+        impounded_length : float
+            length of impounded water along the secondary framing in inches
+        '''
+        d_impounded_i = self.roof_bay.loading.rain_load/CONV_D_TO_Q # Depth of impounded water at end i in inches
+        roof_slope = self.roof_bay.secondary_framing.slope/12 # Roof slope in in/in
+        if roof_slope == 0:
+            return d_impounded_i, roof_slope, self.roof_bay.secondary_framing.secondary_members[0].length
 
-        return secondary_rl
+        return d_impounded_i, roof_slope, d_impounded_i/roof_slope
 
     def _initial_impounded_water_depth(self):
         '''
@@ -467,15 +693,8 @@ class RoofBayModel:
         None
         '''
         # Load and calculate required parameters
-        q_rl = self.roof_bay.loading.rain_load # Units: k/in^2
-        d_impounded_i = q_rl/CONV_D_TO_Q # Depth of impounded water at end i in inches
-        roof_slope = self.roof_bay.secondary_framing.slope/12 # Roof slope in in/in
+        d_impounded_i, roof_slope, impounded_length = self._initial_ponding_profile()
         bay_length = self.roof_bay.secondary_framing.secondary_members[0].length # Length of roof bay in inches
-        if roof_slope == 0:
-            impounded_length = bay_length
-        else:
-            impounded_length = d_impounded_i/roof_slope # Length of impounded water along secondary framing in inches
-        
 
         # First deal with the primary members
         impounded_depth_p = {}
@@ -508,14 +727,56 @@ class RoofBayModel:
             'Secondary':impounded_depth_s,
         }
 
-    def analyze_roof_bay(self, rain_load):
+    def _update_ponding_front(self, i_smodel, ponding_length):
+        '''
+        Re-meshes a secondary member about its new ponding front if the front
+        has moved outside the refined zone (adaptive mesh only). The member is
+        re-analyzed for its current loads on the new mesh, which reproduces the
+        existing solution because the distributed loads are integrated exactly.
+
+        Parameters
+        ----------
+        i_smodel : int
+            index of the secondary member
+        ponding_length : float
+            length of impounded water along the secondary member in inches
+
+        Returns
+        -------
+        remeshed : bool
+            bool indicating whether the secondary member was re-meshed
+        '''
+        if not self.adaptive_mesh:
+            return False
+
+        s_model = self.secondary_models[i_smodel]
+        front = self._get_ponding_front(s_model.beam, ponding_length)
+        old_front = self.ponding_fronts[i_smodel]
+
+        half_width = ADAPTIVE_ZONE_WIDTH*self.max_node_spacing
+        if front is None and old_front is None:
+            return False
+        if front is not None and old_front is not None and abs(front-old_front) <= half_width:
+            return False
+
+        self.ponding_fronts[i_smodel] = front
+        s_model.set_mesh_refinement(self._get_refinement_zones(s_model.beam, [] if front is None else [front]), self.max_node_spacing)
+        s_model.perform_analysis()
+
+        return True
+
+    def analyze_roof_bay(self, rain_load, refine=False):
         '''
         Analyzes the roof bay for the dead load and the input rain loads.
 
         Parameters
         ----------
-        rain_load : list
-            list of dist load objects representing the rain load on the roof bay
+        rain_load : dict
+            dictionary containing a list of dist load objects or a DistLoad structured array
+            representing the rain load on each secondary member
+        refine : bool, optional
+            indicates whether to refine float32 beam model solutions to float64 accuracy, e.g.
+            for the final pass of an analysis (ignored for float64 models)
 
         Returns
         -------
@@ -527,7 +788,7 @@ class RoofBayModel:
 
         # Perform the secondary member analysis
         for s_model in self.secondary_models:
-            s_model.perform_analysis()
+            s_model.perform_analysis(refine=refine)
 
         # Next handle the primary member analysis
         # Apply the secondary member reactions as point loads to the primary members
@@ -535,7 +796,7 @@ class RoofBayModel:
 
         # Perform the primary member analysis
         for p_model in self.primary_models:
-            p_model.perform_analysis()
+            p_model.perform_analysis(refine=refine)
 
         self.analysis_complete = True
 
@@ -596,6 +857,44 @@ class RoofBayModel:
         # Return the plots dict
         return plots
 
+    def get_influence_deflections(self, impounded_depth):
+        '''
+        Calculates the deflections of the primary and secondary members for an impounded water depth
+        using the influence matrices, without re-analyzing the beam models.
+
+        Parameters
+        ----------
+        impounded_depth : dict
+            dictionary containing impounded water depth in inches at the nodes of each secondary member
+
+        Returns
+        -------
+        deflections : dict
+            dictionary containing the deflection at each secondary member location along each primary member
+            and the deflection at each node of each secondary member
+        '''
+        if not self.influence:
+            raise AnalysisError('Influence matrices are only available when influence is True.')
+
+        secondary_deflections = {}
+        primary_loads = np.zeros((len(self.primary_models), len(self.secondary_models)))
+        for i_smodel, influence in self.influence_matrices['Secondary'].items():
+            depth = np.asarray(impounded_depth['Secondary'][i_smodel], dtype=float)
+            secondary_deflections[i_smodel] = influence['Dead Deflection'] + influence['Deflection'] @ depth
+
+            # The vertical reactions of the secondary members load the primary members
+            reactions = influence['Dead Reaction'] + influence['Reaction'] @ depth
+            primary_loads[:, i_smodel] = -reactions[:, 1]
+
+        primary_deflections = {}
+        for i_pmodel, influence in self.influence_matrices['Primary'].items():
+            primary_deflections[i_pmodel] = influence['Dead Deflection'] + influence['Deflection'] @ primary_loads[i_pmodel]
+
+        return {
+            'Primary':primary_deflections,
+            'Secondary':secondary_deflections,
+        }
+
     def initialize_analysis(self):
         '''
         Prepares the model for analysis. To be called at instantiation and 
@@ -613,6 +912,8 @@ class RoofBayModel:
         self._create_secondary_models()
         self.initial_impounded_depth = self._initial_impounded_water_depth()
         self.initial_secondary_rl = self._get_secondary_rl(impounded_depth=self.initial_impounded_depth)
+        if self.influence:
+            self._create_influence_matrices()
         self.analysis_ready = True
 
 class SecondaryMember(Beam):
@@ -621,16 +922,16 @@ class SecondaryMember(Beam):
 
     Attributes
     ----------
-    dloads : list
-        list of dist load objects
+    dloads : list or numpy array
+        list of dist load objects or structured array with dtype DistLoad.array_dtype
     length : float
         length of the beam
     size : steel beam size object
         steel beam size object for the beam
     supports : list
         list of tuples indicating location and type of beam supports
-    ploads : list
-        list of point load objects
+    ploads : list or numpy array
+        list of point load objects or structured array with dtype PointLoad.array_dtype
     '''
     pass
 
@@ -1,4 +1,5 @@
 import os
+import numpy as np
 from scipy import integrate
 import time
 
@@ -14,8 +15,16 @@ from pondpy import (
     SteelJoistDesign,
 )
 
+from .analysis.helpers.fixed_point import aitken_step, anderson_step
+from .analysis.helpers.mesh_generation import find_nodes
 from .report.helpers.save_figures import save_figure
 
+accelerator_types = ['none', 'relaxation', 'aitken', 'anderson']
+convergence_norm_types = ['weight', 'l2', 'linf', 'reactions']
+
+ANDERSON_HISTORY = 5 # Number of previous iterations combined by the Anderson accelerator
+DIVERGENCE_WINDOW = 3 # Number of successive non-decreasing changes in water weight that stop the analysis
+
 class PondPyModel:
     '''
     A class to represent a pondpy analysis object.
@@ -24,14 +33,29 @@ class PondPyModel:
 
     Attributes
     ----------
+    accelerator : str
+        accelerator applied to the impounded water depth between iterations ('none', 'relaxation', 'aitken', or 'anderson')
+    adaptive_mesh : bool
+        indicates whether the roof bay model refines its mesh only about supports, point loads, and the ponding front
     analysis_complete : bool
         bool indicating whether the analysis has been performed
+    convergence_norm : list
+        list of convergence norms that must all be below stop_criterion for the analysis to converge
+    detect_divergence : bool
+        indicates whether the analysis stops early when the water weight diverges or oscillates
+    direct_solve : bool
+        indicates whether the converged impounded water depth is found with a single linear solve when the whole
+        roof bay is submerged
     impounded_depth : dict
         dictionary containing impounded water depth at model nodes for both primary and secondary members
+    influence : bool
+        indicates whether the iterations use precomputed influence matrices instead of re-analyzing the beam models
     iter_results : dict
         dictionary holding iterative analysis results
     loading : loading object
         Loading object representing the loading criteria for the roof bay
+    low_memory : bool
+        indicates whether the roof bay model is created in low memory mode
     max_iter : int
         maximum number of iterations for the iterative analysis
     mirrored_left : bool
@@ -46,6 +70,9 @@ class PondPyModel:
         roof bay model object to be used for the iterative analysis
     primary_framing : primary framing object
         primary framing object representing the primary framing for the roof bay
+    relaxation_factor : float
+        relaxation factor of the relaxation accelerator (initial factor of the aitken accelerator and mixing factor
+        of the anderson accelerator)
     secondary_framing : secondary framing object
         secondsry framing object representing the secondary framing for the roof bay
     show_results : bool
@@ -57,17 +84,47 @@ class PondPyModel:
     -------
     generate_report():
         Generates a report for the analyzed PondPyModel object.
+    get_ponding_stability():
+        Calculates the ponding amplification factor and the margin to ponding instability of the roof bay.
     perform_analysis():
         Performs the iterative analysis of the PondPyModel object.
     '''
-    def __init__(self, primary_framing, secondary_framing, loading, mirrored_left=False, mirrored_right=False, stop_criterion=0.001, max_iter=50, show_results=True):
+    def __init__(self, primary_framing, secondary_framing, loading, mirrored_left=False, mirrored_right=False, stop_criterion=0.001, max_iter=50, show_results=True, low_memory=False, adaptive_mesh=False, influence=False, accelerator='none', relaxation_factor=0.5, direct_solve=False, convergence_norm='weight', detect_divergence=True):
         '''
         Constructs the required input attributes for the PondPy object.
 
         Parameters
         ----------
+        accelerator : str, optional
+            accelerator applied to the impounded water depth at the nodes of the secondary members between
+            iterations. 'none' uses the plain fixed-point iteration, 'relaxation' under-relaxes each update by
+            relaxation_factor, 'aitken' adapts the relaxation factor every iteration, and 'anderson' combines
+            the previous ANDERSON_HISTORY iterations
+        adaptive_mesh : bool, optional
+            indicates whether to refine the beam model meshes only about supports, point loads, and the ponding
+            front, coarsening elsewhere and re-meshing when the ponding front leaves its refined zone
+        convergence_norm : str or list, optional
+            convergence norm, or list of convergence norms that must all be satisfied, compared to stop_criterion.
+            'weight' is the relative change in the impounded water weight, 'l2' and 'linf' are the relative
+            changes in the impounded water depth vector at the secondary member nodes, and 'reactions' is the
+            relative change in the vertical support reactions of the secondary members
+        detect_divergence : bool, optional
+            indicates whether to stop the analysis early when the change in impounded water weight does not
+            decrease for DIVERGENCE_WINDOW successive iterations, reporting whether it diverged or oscillated
+            (only with the 'none' and 'relaxation' accelerators)
+        direct_solve : bool, optional
+            indicates whether to find the converged impounded water depth with a single linear solve using the
+            influence matrices when the initial impounded water covers the whole roof bay. The analysis falls back
+            to iteration when the solution has a wet/dry front (not available with adaptive_mesh)
+        influence : bool, optional
+            indicates whether to precompute the deflection and reaction influence matrices of the beam models,
+            so each iteration is a set of matrix-vector products and the beam models are only analyzed for
+            the converged impounded water depth (not available with adaptive_mesh)
         loading : loading
             Loading object representing the loading criteria for the roof bay
+        low_memory : bool, optional
+            indicates whether to keep only the stiffness factorizations and support reactions of the
+            beam models, computing element forces on request
         max_iter : int, optional
             maximum number of iterations for the iterative analysis
         mirrored_left : bool, optional
@@ -80,6 +137,9 @@ class PondPyModel:
             roof bay model object to be used for the iterative analysis
         primary_framing : list
             list of PrimaryFraming objects representing the primary framing for the roof bay
+        relaxation_factor : float, optional
+            relaxation factor of the relaxation accelerator (initial factor of the aitken accelerator and mixing
+            factor of the anderson accelerator)
         secondary_framing : list
             list of SecondaryFraming objects representing the secondary framing for the roof bay
         show_results : bool, optional
@@ -87,14 +147,34 @@ class PondPyModel:
         stop_criterion : float, optional
             criterion to stop the iterative analysis
         '''
+        if not isinstance(accelerator, str) or accelerator not in accelerator_types:
+            raise TypeError('accelerator must be a string. Options are: none, relaxation, aitken, anderson.')
+        if not isinstance(adaptive_mesh, bool):
+            raise TypeError('adaptive_mesh must be either True or False')
+        if isinstance(convergence_norm, str):
+            convergence_norm = [convergence_norm]
+        if not isinstance(convergence_norm, (list, tuple)) or not convergence_norm or any(norm not in convergence_norm_types for norm in convergence_norm):
+            raise TypeError('convergence_norm must be a string or list of strings. Options are: weight, l2, linf, reactions.')
+        if not isinstance(detect_divergence, bool):
+            raise TypeError('detect_divergence must be either True or False')
+        if not isinstance(direct_solve, bool):
+            raise TypeError('direct_solve must be either True or False')
+        if direct_solve and adaptive_mesh:
+            raise TypeError('direct_solve is not available with adaptive_mesh')
+        if not isinstance(influence, bool):
+            raise TypeError('influence must be either True or False')
         if not isinstance(loading, Loading):
             raise TypeError('loaidng must be a valid Loading object')
+        if not isinstance(low_memory, bool):
+            raise TypeError('low_memory must be either True or False')
         if not isinstance(max_iter, int) or max_iter <= 0:
             raise TypeError('max_iter must be a positive integer')
         if not isinstance(mirrored_left, bool):
             raise TypeError('mirrored_left must be either True or False')
         if not isinstance(mirrored_right, bool):
             raise TypeError('mirrored_right must be either True or False')
+        if not isinstance(relaxation_factor, (int, float)) or not 0 < relaxation_factor <= 1:
+            raise TypeError('relaxation_factor must be an int or float between 0 and 1')
         if not isinstance(primary_framing, PrimaryFraming):
             raise TypeError('primary_framing must be a valid PrimaryFraming object')
         if not isinstance(secondary_framing, SecondaryFraming):
@@ -104,20 +184,84 @@ class PondPyModel:
         if not isinstance(stop_criterion, float) or stop_criterion <= 0:
             raise TypeError('stop_criterion must be a positive float')
 
+        self.accelerator = accelerator
+        self.adaptive_mesh = adaptive_mesh
         self.analysis_complete = False
+        self.convergence_norm = list(convergence_norm)
+        self.detect_divergence = detect_divergence
+        self.direct_solve = direct_solve
+        self.influence = influence
         self.iter_results = {}
         self.loading = loading
+        self.low_memory = low_memory
         self.max_iter = max_iter
         self.mirrored_left = mirrored_left
         self.mirrored_right = mirrored_right
         self.primary_framing = primary_framing
+        self.relaxation_factor = relaxation_factor
         self.secondary_framing = secondary_framing
         self.show_results = show_results
         self.stop_criterion = stop_criterion
 
+        self._reset_acceleration_history()
+        self._depth_index = None
+
         self._create_roof_bay_model()
         self.impounded_depth = self.roof_bay_model._initial_impounded_water_depth()
 
+    def _accelerate_impounded_depth(self, impounded_depth, next_depth, nodes):
+        '''
+        Applies the accelerator to the impounded water depth calculated for the next iteration. The depth
+        at the nodes of all secondary members is treated as a single vector, and the acceleration history
+        is discarded whenever the secondary members are re-meshed.
+
+        Parameters
+        ----------
+        impounded_depth : dict
+            dictionary containing the impounded water depth at model nodes for the current iteration
+        next_depth : dict
+            dictionary containing the impounded water depth at model nodes calculated for the next iteration
+        nodes : list
+            list containing the model nodes of each secondary member for the current iteration
+
+        Returns
+        -------
+        impounded_depth : dict
+            dictionary containing the accelerated impounded water depth at model nodes for the next iteration
+        '''
+        if self.accelerator == 'none':
+            return next_depth
+
+        s_models = self.roof_bay_model.secondary_models
+        history = self._acceleration_history
+        remeshed = any(not np.array_equal(s_model.model_nodes, cur_nodes) for s_model, cur_nodes in zip(s_models, nodes))
+        if remeshed:
+            self._reset_acceleration_history()
+            return next_depth
+
+        x = np.concatenate([np.asarray(impounded_depth['Secondary'][i_smodel], dtype=float) for i_smodel in range(len(s_models))])
+        g = np.concatenate([np.asarray(next_depth['Secondary'][i_smodel], dtype=float) for i_smodel in range(len(s_models))])
+
+        if self.accelerator == 'relaxation':
+            x_next = x + self.relaxation_factor*(g - x)
+        elif self.accelerator == 'aitken':
+            x_next, history['factor'] = aitken_step(x, g, history['residual'], history['factor'])
+            history['residual'] = g - x
+        elif self.accelerator == 'anderson':
+            history['x'] = (history['x'] + [x])[-(ANDERSON_HISTORY+1):]
+            history['g'] = (history['g'] + [g])[-(ANDERSON_HISTORY+1):]
+            x_next = anderson_step(history['x'], history['g'], self.relaxation_factor)
+
+        # The extrapolated depth cannot be negative
+        x_next = np.maximum(x_next, 0)
+
+        split = np.cumsum([len(s_model.model_nodes) for s_model in s_models])[:-1]
+        impounded_depth_s = {i_smodel:depth.tolist() for i_smodel, depth in enumerate(np.split(x_next, split))}
+
+        return {
+            'Secondary':impounded_depth_s,
+        }
+
     def _calculate_impounded_weight(self, impounded_depth):
         '''
         Calculates the weight of the impounded water on the roof bay.
@@ -148,109 +292,132 @@ class PondPyModel:
 
         return impounded_weight
     
-    def _calculate_next_impounded_depth(self):
+    def _calculate_residuals(self, prev_state, state):
+        '''
+        Calculates each convergence norm in convergence_norm between two successive iterations. Depths are
+        interpolated onto the current model nodes in case the secondary members were re-meshed.
+
+        Parameters
+        ----------
+        prev_state : dict
+            dictionary from _get_convergence_state() for the previous iteration
+        state : dict
+            dictionary from _get_convergence_state() for the current iteration
+
+        Returns
+        -------
+        residuals : dict
+            dictionary containing the value of each convergence norm
+        '''
+        # Relaxation only moves the depth by relaxation_factor times the fixed-point residual, so the
+        # changes between iterations are scaled back up to measure the undamped residual
+        scale = self.relaxation_factor if self.accelerator == 'relaxation' else 1
+
+        residuals = {}
+        for norm in self.convergence_norm:
+            if norm == 'weight':
+                residuals[norm] = abs(state['Weight'] - prev_state['Weight'])/prev_state['Weight']/scale
+            elif norm in ['l2', 'linf']:
+                depth = np.concatenate([cur_depth for _, cur_depth in state['Depth']])
+                prev_depth = np.concatenate([np.interp(nodes, prev_nodes, cur_prev_depth) for (nodes, _), (prev_nodes, cur_prev_depth) in zip(state['Depth'], prev_state['Depth'])])
+                order = 2 if norm == 'l2' else np.inf
+                residuals[norm] = np.linalg.norm(depth - prev_depth, order)/max(np.linalg.norm(depth, order), 1e-12)/scale
+            elif norm == 'reactions':
+                change = np.max(np.abs(state['Reactions'] - prev_state['Reactions']))
+                residuals[norm] = change/max(np.max(np.abs(state['Reactions'])), 1e-12)/scale
+
+        return residuals
+
+    def _calculate_next_impounded_depth(self, deflections=None):
         '''
         Calculates the impounded water depth at model nodes for both primary and secondary members for the next iteration
 
         Parameters
         ----------
-        None
+        deflections : dict, optional
+            dictionary containing the primary and secondary member deflections from the influence matrices
+            (None to use the results of the beam models)
 
         Returns
         -------
         impounded_depth : dict
             dictionary containing impounded water depth at model nodes for both primary and secondary members
         '''
+        p_models = self.roof_bay_model.primary_models
+        s_models = self.roof_bay_model.secondary_models
+        index = self._get_depth_index()
+
         # First find the deflection at each end of each secondary member
-        end_deflections = []
-        for i_smodel, _ in enumerate(self.roof_bay_model.secondary_models):
-            cur_deflections = []
-            for p_model in self.roof_bay_model.primary_models:
-                node = p_model.model_nodes.index(self.roof_bay_model.roof_bay.secondary_spacing*i_smodel)
-                g_dof = p_model.dof_num[node][1]
-                if g_dof != 0:
-                    defl = p_model.global_displacement[g_dof-1][0]
-                elif g_dof == 0:
-                    defl = 0.0
-                
-                cur_deflections.append(defl)
-
-            end_deflections.append(cur_deflections)
-
-        # Next calculate the height of node j relative to node i for each secondary member, including deflection
-        # Then store the straight-line slope for each member
+        if deflections is not None:
+            end_deflections = np.array([deflections['Primary'][i_pmodel] for i_pmodel in range(len(p_models))]).T
+        else:
+            end_deflections = np.array([np.append(0.0, p_model.global_displacement[:, 0])[p_dof] for p_model, p_dof in zip(p_models, index['Primary Dof'])]).T
+
+        # Next calculate the straight-line slope in in/in of each secondary member, including deflection
         ini_slope = self.roof_bay.secondary_framing.slope/12
-        defl_slope = []
-        for i_smodel, s_model in enumerate(self.roof_bay_model.secondary_models):
-            height_i = end_deflections[i_smodel][0]
-            height_j = s_model.beam.length*ini_slope + end_deflections[i_smodel][1]
+        defl_slope = (index['Length']*ini_slope + end_deflections[:, 1] - end_deflections[:, 0])/index['Length']
 
-            rel_h = height_j - height_i
+        # Next calculate the depth of water at end i and the length of ponding for each secondary member
+        ini_depth_i = np.array([self.roof_bay_model.initial_impounded_depth['Secondary'][i_smodel][0] for i_smodel in range(len(s_models))])
+        ponding_depth_i = ini_depth_i - end_deflections[:, 0]
+        no_front = np.where(ponding_depth_i >= 0, np.inf, -np.inf)
+        ponding_length = np.divide(ponding_depth_i, defl_slope, out=no_front, where=defl_slope != 0)
 
-            defl_slope.append(rel_h/s_model.beam.length) # Store the straight-line slope in in/in
+        # Re-mesh the secondary members whose ponding front has left the refined zone (adaptive mesh only)
+        for i_smodel in range(len(s_models)):
+            self.roof_bay_model._update_ponding_front(i_smodel, ponding_length[i_smodel])
+        index = self._get_depth_index()
 
-        # Next calculate the length of ponding for each secondary member
-        ponding_length = []
-        ponding_depth_i = []
-        for i_smodel in range(len(defl_slope)):
-            ini_depth_i = self.roof_bay_model.initial_impounded_depth['Secondary'][i_smodel][0]
-            depth_i = ini_depth_i - end_deflections[i_smodel][0]
+        # Next determine the depth of water considering the straight-line depth and deflection
+        # at each node of all secondary members. Nodes are wet where the straight-line depth is
+        # not negative, which also covers flat members and members sloping down away from end i.
+        if deflections is not None:
+            node_disp = np.concatenate([deflections['Secondary'][i_smodel] for i_smodel in range(len(s_models))])
+        else:
+            node_disp = np.concatenate([[0.0]] + [s_model.global_displacement[:, 0] for s_model in s_models])[index['Secondary Dof']]
 
-            ponding_length.append(depth_i/defl_slope[i_smodel])
-            ponding_depth_i.append(depth_i)
+        member = index['Member']
+        straight_depth = ponding_depth_i[member] - defl_slope[member]*index['Nodes']
+        nodal_depth = np.where(straight_depth >= 0, straight_depth - node_disp, 0.0)
 
-        # Next determine the depth of water considering the straight-line depth and deflection
-        # at each node for each secondary member.
-        impounded_depth_s = {}
-        for i_smodel, s_model in enumerate(self.roof_bay_model.secondary_models):
-            cur_nodes = s_model.model_nodes
-            cur_disp = []
-            for i_node in range(len(s_model.model_nodes)):
-                G_dof = s_model.dof_num[i_node][1]
-                if G_dof != 0:
-                    cur_disp.append(s_model.global_displacement[G_dof-1][0])
-                else:
-                    cur_disp.append(0.0)
-
-            nodal_depth = []
-            for i_node, node in enumerate(cur_nodes):
-                if node <= ponding_length[i_smodel]:
-                    cur_depth = (ponding_depth_i[i_smodel] - defl_slope[i_smodel]*node) - cur_disp[i_node]
-                elif node > ponding_length[i_smodel]:
-                    cur_depth = 0.0
-
-                nodal_depth.append(cur_depth)
-
-            impounded_depth_s[i_smodel] = nodal_depth
+        impounded_depth_s = {i_smodel:depth.tolist() for i_smodel, depth in enumerate(np.split(nodal_depth, index['Split']))}
 
-        # Next determine the depth of water considering the straight-line depth and deflection
-        # at each node for each primary member.
         # Note: Impounded depth for the primary members is not required for analysis. All rain
         # loads are assumed to be transferred to the primary members by the secondary members.
-        '''impounded_depth_p = {}
-        for i_pmodel, p_model in enumerate(self.roof_bay_model.primary_models):
-            cur_disp = []
-            for i_node in range(len(p_model.model_nodes)):
-                G_dof = p_model.dof_num[i_node][1]
-                if G_dof != 0:
-                    cur_disp.append(p_model.global_displacement[G_dof-1][0])
-                else:
-                    cur_disp.append(0.0)
-
-            nodal_depth = []
-            if i_pmodel == 0:
-                for i_node, node in enumerate(p_model.model_nodes):
-                    cur_depth = self.roof_bay_model.initial_impounded_depth['Primary'][i_pmodel][i_node] - cur_disp[i_node]
-                    nodal_depth.append(cur_depth)
-                        
-            impounded_depth_p[i_pmodel] = nodal_depth'''
-
         impounded_depth = {
             'Secondary':impounded_depth_s,
-        }         
+        }
 
         return impounded_depth
 
+    def _check_divergence(self, impounded_weight):
+        '''
+        Checks whether the iterative analysis is diverging or oscillating. The change in impounded water weight
+        shrinks every iteration for a stable roof bay, so the analysis is diverging when it does not decrease for
+        DIVERGENCE_WINDOW successive iterations, and oscillating when its sign also alternates.
+
+        Parameters
+        ----------
+        impounded_weight : list
+            list of the impounded water weight at each iteration
+
+        Returns
+        -------
+        status : str
+            'diverged' or 'oscillating' if the analysis should stop, None otherwise
+        '''
+        if not np.isfinite(impounded_weight[-1]):
+            return 'diverged'
+
+        changes = np.diff(impounded_weight[-(DIVERGENCE_WINDOW+2):])
+        if len(changes) < DIVERGENCE_WINDOW+1 or np.any(changes == 0):
+            return None
+
+        if np.all(np.abs(changes[1:]) >= np.abs(changes[:-1])):
+            return 'oscillating' if np.all(changes[1:]*changes[:-1] < 0) else 'diverged'
+
+        return None
+
     def _create_roof_bay_model(self):
         '''
         Creates the roof bay model to be used in the iterative analysis.
@@ -264,7 +431,194 @@ class PondPyModel:
         None
         '''
         self.roof_bay = RoofBay(self.primary_framing, self.secondary_framing, self.loading, self.mirrored_left, self.mirrored_right)
-        self.roof_bay_model = RoofBayModel(self.roof_bay)
+        self.roof_bay_model = RoofBayModel(self.roof_bay, low_memory=self.low_memory, adaptive_mesh=self.adaptive_mesh, influence=self.influence or self.direct_solve)
+
+    def _get_wet_ponding_operator(self):
+        '''
+        Assembles the linear operator C*F giving the increase in impounded water depth at each secondary member
+        node per unit impounded water depth at each secondary member node when the whole roof bay is submerged.
+        F gives the deflections per unit depth from the influence matrices, and C maps the deflections to the
+        change in depth, combining the secondary member deflection with the primary member deflections at
+        each end of the secondary member. The influence matrices are computed if they are not available,
+        without changing the loads or results of the beam models.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        CF : numpy array
+            numpy array of shape (n, n), where n is the total number of secondary member nodes, ordered by
+            secondary member
+        '''
+        if not self.roof_bay_model.influence_matrices:
+            self.roof_bay_model._create_influence_matrices()
+
+        s_models = self.roof_bay_model.secondary_models
+        s_influence = self.roof_bay_model.influence_matrices['Secondary']
+        p_influence = self.roof_bay_model.influence_matrices['Primary']
+        offsets = np.concatenate(([0], np.cumsum([len(s_model.model_nodes) for s_model in s_models])))
+
+        CF = np.zeros((offsets[-1], offsets[-1]))
+        for i_smodel, s_model in enumerate(s_models):
+            rows = slice(offsets[i_smodel], offsets[i_smodel+1])
+            nodes = np.asarray(s_model.model_nodes, dtype=float)
+
+            # The primary member deflections at each end of the secondary member vary linearly along it
+            end_weights = [1 - nodes/s_model.beam.length, nodes/s_model.beam.length]
+
+            CF[rows, rows] += s_influence[i_smodel]['Deflection']
+            for i_pmodel, weights in enumerate(end_weights):
+                for j_smodel in range(len(s_models)):
+                    cols = slice(offsets[j_smodel], offsets[j_smodel+1])
+                    load = -s_influence[j_smodel]['Reaction'][i_pmodel, 1]
+                    CF[rows, cols] += np.outer(weights, p_influence[i_pmodel]['Deflection'][i_smodel, j_smodel]*load)
+
+        # Deflections are negative downward, so the depth increases by -deflection
+        return -CF
+
+    def _get_convergence_state(self, impounded_weight):
+        '''
+        Collects the quantities compared by the convergence norms for the current iteration. The secondary
+        member reactions are taken from the influence matrices or from the analyzed beam models.
+
+        Parameters
+        ----------
+        impounded_weight : float
+            weight of the impounded water for the current iteration
+
+        Returns
+        -------
+        state : dict
+            dictionary containing the impounded water weight, the model nodes and impounded water depth of each
+            secondary member, and the vertical support reactions of the secondary members (if required)
+        '''
+        s_models = self.roof_bay_model.secondary_models
+        state = {
+            'Weight':impounded_weight,
+            'Depth':[(np.asarray(s_model.model_nodes, dtype=float), np.asarray(self.impounded_depth['Secondary'][i_smodel], dtype=float)) for i_smodel, s_model in enumerate(s_models)],
+        }
+
+        if 'reactions' in self.convergence_norm:
+            if self.influence:
+                influence = self.roof_bay_model.influence_matrices['Secondary']
+                reactions = [influence[i_smodel]['Dead Reaction'] + influence[i_smodel]['Reaction'] @ depth for i_smodel, (_, depth) in enumerate(state['Depth'])]
+            else:
+                reactions = [s_model.get_support_reactions() for s_model in s_models]
+            state['Reactions'] = np.array([reaction[:, 1] for reaction in reactions])
+
+        return state
+
+    def _get_depth_index(self):
+        '''
+        Returns the index arrays used to calculate the impounded water depth at the nodes of all secondary members
+        at once. They are rebuilt only when the model nodes or dof numbering of a beam model change.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        depth_index : dict
+            dictionary containing the model nodes of all secondary members, the secondary member of each node,
+            the split points between secondary members, the length of each secondary member, the vertical
+            dof of each primary member at each secondary member location (None if the primary member has no
+            nodes there), and the vertical dof of each secondary member node into the displacements of all
+            secondary members (0 = restrained)
+        '''
+        models = self.roof_bay_model.primary_models + self.roof_bay_model.secondary_models
+        key = [(model.model_nodes, model.dof_num) for model in models]
+        cached = self._depth_index
+        if cached is not None and len(cached['Key']) == len(key) and all(a is c and b is d for (a, b), (c, d) in zip(key, cached['Key'])):
+            return cached
+
+        s_models = self.roof_bay_model.secondary_models
+        s_locations = self.roof_bay_model.roof_bay.secondary_spacing*np.arange(len(s_models))
+
+        # The primary members only have nodes at the secondary member locations once the secondary member
+        # reactions have been applied, which is always the case when their displacements are gathered
+        primary_dof = []
+        for p_model in self.roof_bay_model.primary_models:
+            dof = np.asarray(p_model.dof_num, dtype=int).reshape(-1, 3)[:, 1]
+            nodes = find_nodes(p_model.model_nodes, s_locations, p_model.node_tolerance)
+            primary_dof.append(None if np.any(nodes < 0) else dof[nodes])
+
+        # Offset the dof of each secondary member past a leading zero for restrained dof
+        n_nodes = [len(s_model.model_nodes) for s_model in s_models]
+        offsets = np.cumsum([0] + [s_model.n_dof for s_model in s_models])
+        secondary_dof = []
+        for s_model, offset in zip(s_models, offsets):
+            dof = np.asarray(s_model.dof_num, dtype=int).reshape(-1, 3)[:, 1]
+            secondary_dof.append(np.where(dof != 0, dof + offset, 0))
+
+        self._depth_index = {
+            'Key':key,
+            'Length':np.array([s_model.beam.length for s_model in s_models], dtype=float),
+            'Member':np.repeat(np.arange(len(s_models)), n_nodes),
+            'Nodes':np.concatenate([np.asarray(s_model.model_nodes, dtype=float) for s_model in s_models]),
+            'Primary Dof':primary_dof,
+            'Secondary Dof':np.concatenate(secondary_dof),
+            'Split':np.cumsum(n_nodes)[:-1],
+        }
+
+        return self._depth_index
+
+    def _reset_acceleration_history(self):
+        '''
+        Resets the history of the accelerator to its state before the first iteration.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        '''
+        self._acceleration_history = {'factor':self.relaxation_factor, 'g':[], 'residual':None, 'x':[]}
+
+    def _solve_wet_impounded_depth(self):
+        '''
+        Solves for the converged impounded water depth in one step when the whole roof bay is submerged.
+        Without a wet/dry front, the deflections are linear in the impounded water depth, so the fixed point
+        of the iteration satisfies (I - C*F)*d = d0, where C*F is the operator from _get_wet_ponding_operator()
+        and d0 is the impounded water depth on the roof deflected by the dead loads alone.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        impounded_depth : dict
+            dictionary containing the converged impounded water depth at model nodes (None if the initial
+            impounded water does not cover the roof bay or the solution has a wet/dry front)
+        '''
+        initial_depth = self.roof_bay_model._initial_impounded_water_depth()['Secondary']
+        if not all(np.all(np.asarray(depth) > 0) for depth in initial_depth.values()):
+            return None
+
+        s_models = self.roof_bay_model.secondary_models
+        CF = self._get_wet_ponding_operator()
+
+        # Deflections under the dead loads alone give the depth for zero impounded water
+        zero_depth = {'Secondary':{i_smodel:np.zeros(len(s_model.model_nodes)) for i_smodel, s_model in enumerate(s_models)}}
+        dead_deflections = self.roof_bay_model.get_influence_deflections(zero_depth)
+        d0 = np.concatenate(list(self._calculate_next_impounded_depth(dead_deflections)['Secondary'].values()))
+
+        depth = np.linalg.solve(np.eye(len(d0)) - CF, d0)
+        split = np.cumsum([len(s_model.model_nodes) for s_model in s_models])[:-1]
+        impounded_depth = {'Secondary':{i_smodel:cur_depth.tolist() for i_smodel, cur_depth in enumerate(np.split(depth, split))}}
+
+        # The solution is only valid if it is a fixed point of the iteration, which fails when a wet/dry front exists
+        deflections = self.roof_bay_model.get_influence_deflections(impounded_depth)
+        next_depth = np.concatenate(list(self._calculate_next_impounded_depth(deflections)['Secondary'].values()))
+        if np.any(depth < 0) or not np.allclose(next_depth, depth, rtol=1e-8, atol=1e-10):
+            return None
+
+        return impounded_depth
 
     def generate_report(self, output_folder, filename='pondpy_results', filetype='html', company='', proj_num='', proj_name='', desc=''):
         '''
@@ -409,6 +763,36 @@ class PondPyModel:
 
         report_builder.save_report(context=context)
 
+    def get_ponding_stability(self):
+        '''
+        Calculates the ponding amplification factor and the margin to ponding instability of the roof bay from
+        the largest eigenvalue of the linearized ponding operator for a fully submerged roof bay. Each unit of
+        impounded water depth in the shape of the corresponding eigenvector deflects the roof by the eigenvalue
+        times that depth, so the iteration diverges when the eigenvalue reaches 1. The operator does not depend
+        on the rain load and bounds the response when only part of the roof bay is submerged, so the check can
+        screen framing before the iterative analysis.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        stability : dict
+            dictionary containing the largest eigenvalue, the amplification factor 1/(1 - eigenvalue) of the
+            impounded water depth (inf if unstable), the stability margin 1 - eigenvalue, and whether the
+            roof bay is stable
+        '''
+        eigenvalue = np.max(np.linalg.eigvals(self._get_wet_ponding_operator()).real)
+        margin = 1 - eigenvalue
+
+        return {
+            'Eigenvalue':eigenvalue,
+            'Amplification Factor':1/margin if margin > 0 else np.inf,
+            'Margin':margin,
+            'Stable':bool(margin > 0),
+        }
+
     def perform_analysis(self):
         '''
         Performs the iterative analysis of the PondPy object.
@@ -420,28 +804,76 @@ class PondPyModel:
         Returns
         -------
         output : dict
-            dictionary of output variables
+            dictionary of output variables, with the status of the analysis ('converged', 'max_iter', 'diverged',
+            or 'oscillating') and the value of each convergence norm at each iteration
         '''
         iteration = 0
         impounded_weight = []
+        residuals = {norm:[] for norm in self.convergence_norm}
+        self._reset_acceleration_history()
         out_str = 'Iteration\t|\tWater Weight (k)\t|\tDifference\n'
         start = time.time()
+
+        status = None
+        prev_state = None
+        if self.direct_solve:
+            wet_depth = self._solve_wet_impounded_depth()
+            if wet_depth is not None:
+                # Start from the initial impounded water depth so the output reports the change in weight
+                cur_impounded_weight = self._calculate_impounded_weight(self.impounded_depth)
+                impounded_weight.append(cur_impounded_weight)
+                out_str += f'{iteration}\t\t|\t{round(cur_impounded_weight,2)}\t\t\t|\t----\n'
+
+                self.impounded_depth = wet_depth
+                iteration += 1
+                status = 'converged'
+
         while True:
-            rain_load = self.roof_bay_model._get_secondary_rl(self.impounded_depth)
-            self.roof_bay_model.analyze_roof_bay(rain_load=rain_load)
+            if self.influence:
+                deflections = self.roof_bay_model.get_influence_deflections(self.impounded_depth)
+            else:
+                rain_load = self.roof_bay_model._get_secondary_rl(self.impounded_depth)
+                self.roof_bay_model.analyze_roof_bay(rain_load=rain_load)
+                deflections = None
             cur_impounded_weight = self._calculate_impounded_weight(self.impounded_depth)
             impounded_weight.append(cur_impounded_weight)
+            state = self._get_convergence_state(cur_impounded_weight)
 
             if iteration > 0:
                 diff = (impounded_weight[iteration] - impounded_weight[iteration-1])/impounded_weight[iteration-1]
                 out_str += f'{iteration}\t\t|\t{round(cur_impounded_weight,2)}\t\t\t|\t{round(diff,5)}\n'
             else:
-                diff = 1
                 out_str += f'{iteration}\t\t|\t{round(cur_impounded_weight,2)}\t\t\t|\t----\n'
 
-            if diff <= self.stop_criterion or iteration >= self.max_iter:
+            if status is None and prev_state is not None:
+                cur_residuals = self._calculate_residuals(prev_state, state)
+                for norm, residual in cur_residuals.items():
+                    residuals[norm].append(residual)
+
+                if all(residual <= self.stop_criterion for residual in cur_residuals.values()):
+                    status = 'converged'
+                    if self.accelerator == 'relaxation':
+                        # The relaxed depth lags the fixed point, so finish with one undamped iteration
+                        self.impounded_depth = self._calculate_next_impounded_depth(deflections)
+                        iteration += 1
+                        continue
+                elif self.detect_divergence and self.accelerator in ['none', 'relaxation']:
+                    # The extrapolating accelerators do not reduce the change in weight every iteration
+                    status = self._check_divergence(impounded_weight)
+
+            if status is None and iteration >= self.max_iter:
+                status = 'max_iter'
+
+            if status is not None:
+                if self.influence:
+                    # Analyze the beam models once for the final depth so their results are available
+                    rain_load = self.roof_bay_model._get_secondary_rl(self.impounded_depth)
+                    self.roof_bay_model.analyze_roof_bay(rain_load=rain_load)
+
                 end = time.time()
                 time_elapsed = end - start
+                if status in ['diverged', 'oscillating']:
+                    out_str += f'Analysis stopped after {iteration} iterations: the water weight {status}.\n'
                 out_str += f'Analysis finished in {round(time_elapsed, 2)} s.'
                 self.out_str = out_str
                 if self.show_results:
@@ -451,12 +883,18 @@ class PondPyModel:
                     'Weight':impounded_weight,
                     'Iterations':iteration,
                     'Time':time_elapsed,
+                    'Status':status,
+                    'Residuals':residuals,
                 }
 
-                self.analysis_complete = True
+                # A diverged or oscillating analysis has no valid results to report
+                self.analysis_complete = status in ['converged', 'max_iter']
                 self.iter_results = output
 
                 return output
-            
-            self.impounded_depth = self._calculate_next_impounded_depth()
+
+            prev_state = state
+            nodes = [s_model.model_nodes for s_model in self.roof_bay_model.secondary_models]
+            next_depth = self._calculate_next_impounded_depth(deflections)
+            self.impounded_depth = self._accelerate_impounded_depth(self.impounded_depth, next_depth, nodes)
             iteration += 1
@@ -170,3 +170,406 @@ def test_invalid_plot_sfd():
     with pytest.raises(AnalysisError):
         beam_model = BeamModel(beam=beam, ini_analysis=True, max_node_spacing=6)
         beam_model.plot_sfd()
+
+def test_invalid_solver():
+    with pytest.raises(TypeError):
+        BeamModel(beam=beam, solver='sparse')
+
+def test_banded_solver_matches_dense():
+    loaded_beam = Beam(length=length, size=beam_size, supports=supports, ploads=[PointLoad(location=60, magnitude=(0, -5, 0))], dloads=[DistLoad(location=(0, length), magnitude=((0, 0), (-0.1, -0.1), (0, 0)))])
+    dense_model = BeamModel(beam=loaded_beam, solver='dense')
+    banded_model = BeamModel(beam=loaded_beam, solver='banded')
+    dense_model.perform_analysis()
+    banded_model.perform_analysis()
+    assert np.allclose(dense_model.global_displacement, banded_model.global_displacement, rtol=1e-10, atol=1e-12)
+    assert np.allclose(dense_model.element_forces, banded_model.element_forces, rtol=1e-8, atol=1e-6)
+
+def test_global_stiffness_dense_and_sparse():
+    beam_model = BeamModel(beam=Beam(length=length, size=beam_size, supports=supports, ploads=[], dloads=[]), solver='dense')
+    S = beam_model.global_stiffness
+    assert len(beam_model.local_stiffness_matrices) == 40
+    assert beam_model.elem_dofs.shape == (40, 6)
+    assert beam_model.global_stiffness_csr.shape == (119, 119)
+    assert np.allclose(beam_model.global_stiffness_csr.toarray(), S)
+    assert np.allclose(S, S.T)
+
+def test_global_stiffness_dense_copy_on_request():
+    beam_model = BeamModel(beam=Beam(length=length, size=beam_size, supports=supports, ploads=[], dloads=[]), solver='banded')
+    beam_model.perform_analysis()
+    assert beam_model._dense_stiffness == (None, None)
+    S = beam_model.global_stiffness
+    assert np.allclose(beam_model.global_stiffness_csr.toarray(), S)
+    assert beam_model.global_stiffness is S
+
+def test_stiffness_factorization_reused_for_load_updates():
+    beam_model = BeamModel(beam=Beam(length=length, size=beam_size, supports=supports, ploads=[], dloads=[]), solver='dense')
+    beam_model.perform_analysis()
+    stiffness_factor = beam_model.stiffness_factor
+    global_stiffness = beam_model.global_stiffness
+    beam_model.add_beam_dload([DistLoad(location=(0, length), magnitude=((0, 0), (-0.1, -0.1), (0, 0)))], add_type='replace')
+    beam_model.perform_analysis()
+    assert beam_model.stiffness_factor is stiffness_factor
+    assert beam_model.global_stiffness is global_stiffness
+
+    fresh_model = BeamModel(beam=Beam(length=length, size=beam_size, supports=supports, ploads=[], dloads=[DistLoad(location=(0, length), magnitude=((0, 0), (-0.1, -0.1), (0, 0)))]))
+    fresh_model.perform_analysis()
+    assert np.allclose(beam_model.global_displacement, fresh_model.global_displacement)
+
+def test_stiffness_factorization_reset_for_new_mesh():
+    beam_model = BeamModel(beam=Beam(length=length, size=beam_size, supports=supports, ploads=[], dloads=[]), solver='dense')
+    beam_model.perform_analysis()
+    stiffness_factor = beam_model.stiffness_factor
+    beam_model.add_beam_pload([PointLoad(location=100, magnitude=(0, -5, 0))])
+    assert beam_model.stiffness_factor is None
+    beam_model.perform_analysis()
+    assert beam_model.stiffness_factor is not stiffness_factor
+
+def test_update_loads_keeps_mesh():
+    beam_model = BeamModel(beam=Beam(length=length, size=beam_size, supports=supports, ploads=[], dloads=[]))
+    model_nodes = beam_model.model_nodes
+    beam_model.update_loads(ploads=[PointLoad(location=120, magnitude=(0, -5, 0))], dloads=[DistLoad(location=(60, 180), magnitude=((0, 0), (-0.1, -0.2), (0, 0)))])
+    assert beam_model.model_nodes is model_nodes
+    assert beam_model.analysis_ready == True
+    beam_model.perform_analysis()
+
+    fresh_model = BeamModel(beam=Beam(length=length, size=beam_size, supports=supports, ploads=[PointLoad(location=120, magnitude=(0, -5, 0))], dloads=[DistLoad(location=(60, 180), magnitude=((0, 0), (-0.1, -0.2), (0, 0)))]))
+    fresh_model.perform_analysis()
+    assert np.allclose(beam_model.global_displacement, fresh_model.global_displacement)
+    assert np.allclose(beam_model.element_forces, fresh_model.element_forces)
+
+def test_update_loads_remeshes_for_new_point_of_interest():
+    beam_model = BeamModel(beam=Beam(length=length, size=beam_size, supports=supports, ploads=[], dloads=[]))
+    beam_model.update_loads(ploads=[PointLoad(location=100, magnitude=(0, -5, 0))])
+    assert 100 in beam_model.model_nodes
+    assert len(beam_model.model_nodes) == 42
+
+def test_invalid_update_loads():
+    beam_model = BeamModel(beam=Beam(length=length, size=beam_size, supports=supports, ploads=[], dloads=[]))
+    with pytest.raises(TypeError):
+        beam_model.update_loads(ploads=[dload])
+    with pytest.raises(TypeError):
+        beam_model.update_loads(dloads=pload)
+
+def test_invalid_node_tolerance():
+    with pytest.raises(TypeError):
+        BeamModel(beam=beam, node_tolerance=-1)
+
+def test_near_equal_points_of_interest_merged():
+    close_ploads = [PointLoad(location=117.99999999, magnitude=(0, -5, 0)), PointLoad(location=118.0, magnitude=(0, -5, 0))]
+    beam_model = BeamModel(beam=Beam(length=length, size=beam_size, supports=supports, ploads=close_ploads, dloads=[]))
+    assert len(beam_model.points_of_interest) == 3
+    assert np.all(np.diff(beam_model.model_nodes) > beam_model.node_tolerance)
+    node = beam_model.get_node_index(118.0)
+    assert beam_model.node_pload[node][1] == -10
+
+def test_get_node_index(beam_model_default):
+    assert beam_model_default.get_node_index(0) == 0
+    assert beam_model_default.get_node_index(length) == len(beam_model_default.model_nodes)-1
+    assert list(beam_model_default.get_node_index([0, length])) == [0, len(beam_model_default.model_nodes)-1]
+    with pytest.raises(ValueError):
+        beam_model_default.get_node_index(length+1)
+
+def test_dload_mapping_to_elements():
+    partial_dload = DistLoad(location=(60, 120), magnitude=((0, 0), (-1, -2), (0, 0)))
+    beam_model = BeamModel(beam=Beam(length=length, size=beam_size, supports=supports, ploads=[], dloads=[partial_dload]))
+    loaded = np.nonzero(beam_model.elem_dload[:, 1, 0])[0]
+    assert list(loaded) == list(range(10, 20))
+    assert beam_model.elem_dload[10, 1, 0] == pytest.approx(-1)
+    assert beam_model.elem_dload[19, 1, 1] == pytest.approx(-2)
+    assert beam_model.elem_dload[14, 1, 1] == pytest.approx(-1.5)
+
+def test_triangular_dload_reactions():
+    w = -0.2
+    triangular_dload = DistLoad(location=(0, length), magnitude=((0, 0), (0, w), (0, 0)))
+    beam_model = BeamModel(beam=Beam(length=length, size=beam_size, supports=supports, ploads=[], dloads=[triangular_dload]))
+    beam_model.perform_analysis()
+    reactions = beam_model.support_reactions[beam_model.support_nodes]
+    assert reactions[0][1] == pytest.approx(-w*length/6)
+    assert reactions[1][1] == pytest.approx(-w*length/3)
+
+def test_support_reactions_equilibrium():
+    loads = dict(
+        ploads=[PointLoad(location=60, magnitude=(0, -5, 0))],
+        dloads=[DistLoad(location=(0, length), magnitude=((0, 0), (-0.1, -0.3), (0, 0)))],
+    )
+    beam_model = BeamModel(beam=Beam(length=length, size=beam_size, supports=supports, **loads))
+    beam_model.perform_analysis()
+    total_load = -5 + (-0.1-0.3)/2*length
+    assert beam_model.support_reactions[:, 1].sum() == pytest.approx(-total_load)
+    non_support = [i for i in range(len(beam_model.model_nodes)) if i not in beam_model.support_nodes]
+    assert np.all(beam_model.support_reactions[non_support] == 0)
+
+def test_structured_array_loads_match_objects():
+    ploads = [PointLoad(location=60, magnitude=(0, -5, 0))]
+    dloads = [DistLoad(location=(30, 200), magnitude=((0, 0), (-0.1, -0.3), (0, 0)))]
+    object_model = BeamModel(beam=Beam(length=length, size=beam_size, supports=supports, ploads=ploads, dloads=dloads))
+    array_model = BeamModel(beam=Beam(
+        length=length,
+        size=beam_size,
+        supports=supports,
+        ploads=PointLoad.to_array(ploads),
+        dloads=DistLoad.to_array(dloads),
+    ))
+    object_model.perform_analysis()
+    array_model.perform_analysis()
+    assert np.allclose(object_model.model_nodes, array_model.model_nodes)
+    assert np.allclose(object_model.global_displacement, array_model.global_displacement)
+
+    array_model.add_beam_pload(PointLoad.to_array(ploads), add_type='add')
+    object_model.add_beam_pload(ploads, add_type='add')
+    assert len(array_model.beam.ploads) == 2
+    assert np.allclose(object_model.nodal_load_vector, array_model.nodal_load_vector)
+
+def test_invalid_structured_array_loads(beam_model_default):
+    with pytest.raises(TypeError):
+        beam_model_default.add_beam_dload(PointLoad.to_array([pload]))
+    with pytest.raises(TypeError):
+        Beam(length=length, size=beam_size, supports=supports, ploads=DistLoad.to_array([dload]))
+
+def test_solve_load_cases_matches_individual_analyses():
+    load_cases = [
+        dict(ploads=[PointLoad(location=60, magnitude=(0, -5, 0))], dloads=None),
+        dict(ploads=None, dloads=[DistLoad(location=(0, length), magnitude=((0, 0), (-0.1, -0.3), (0, 0)))]),
+        dict(ploads=[PointLoad(location=60, magnitude=(0, -2, 0))], dloads=[DistLoad(location=(0, 120), magnitude=((0, 0), (-0.2, -0.2), (0, 0)))]),
+    ]
+    beam_model = BeamModel(beam=Beam(length=length, size=beam_size, supports=supports, ploads=[], dloads=[]))
+    cases = [beam_model.get_load_case(**case) for case in load_cases]
+    load_vectors = np.array([case[0] for case in cases])
+    elem_loads = np.array([case[1] for case in cases])
+    displacements, element_forces = beam_model.solve_load_cases(load_vectors, elem_loads)
+    assert displacements.shape == (3, beam_model.n_dof)
+    assert element_forces.shape == (3, len(beam_model.elem_nodes), 6)
+    assert len(beam_model.beam.ploads) == 0 and len(beam_model.beam.dloads) == 0
+
+    for i_case, case in enumerate(load_cases):
+        case_model = BeamModel(beam=Beam(
+            length=length,
+            size=beam_size,
+            supports=supports,
+            ploads=case['ploads'] or [],
+            dloads=case['dloads'] or [],
+        ))
+        case_model.perform_analysis()
+        assert np.allclose(displacements[i_case], np.ravel(case_model.global_displacement))
+        assert np.allclose(element_forces[i_case], case_model.element_forces)
+
+def test_invalid_load_cases(beam_model_default):
+    with pytest.raises(TypeError):
+        beam_model_default.solve_load_cases(np.zeros((2, beam_model_default.n_dof+1)))
+    with pytest.raises(TypeError):
+        beam_model_default.solve_load_cases(np.zeros((2, beam_model_default.n_dof)), np.zeros((1, 1, 6)))
+    with pytest.raises(AnalysisError):
+        beam_model_default.get_load_case(ploads=[PointLoad(location=1.5, magnitude=(0, -1, 0))])
+
+def test_element_stiffness_shared_between_elements_and_models():
+    first_model = BeamModel(beam=Beam(length=length, size=beam_size, supports=supports, ploads=[], dloads=[]))
+    second_model = BeamModel(beam=Beam(length=length, size=beam_size, supports=supports, ploads=[], dloads=[]))
+    assert first_model.unique_stiffness_matrices.shape == (1, 6, 6)
+    assert all(K is first_model.local_stiffness_matrices[0] for K in first_model.local_stiffness_matrices)
+    assert second_model.local_stiffness_matrices[0] is first_model.local_stiffness_matrices[0]
+    assert not first_model.local_stiffness_matrices[0].flags.writeable
+
+    uneven_model = BeamModel(beam=Beam(length=length, size=beam_size, supports=supports, ploads=[], dloads=[
+        DistLoad(location=(0, 100), magnitude=((0, 0), (-0.1, -0.1), (0, 0))),
+    ]))
+    assert len(uneven_model.unique_stiffness_matrices) == 2
+    L = np.diff(uneven_model.model_nodes)
+    for K, l in zip(uneven_model.local_stiffness_matrices, L):
+        assert K[1][1] == pytest.approx(12*beam.e_mod*beam.mom_inertia/l**3)
+
+def test_low_memory_mode():
+    loads = dict(
+        ploads=[PointLoad(location=60, magnitude=(0, -5, 0))],
+        dloads=[DistLoad(location=(0, length), magnitude=((0, 0), (-0.1, -0.3), (0, 0)))],
+    )
+    full_model = BeamModel(beam=Beam(length=length, size=beam_size, supports=supports, **loads))
+    lean_model = BeamModel(beam=Beam(length=length, size=beam_size, supports=supports, **loads), low_memory=True, solver='banded')
+    assert lean_model.global_stiffness is None
+    assert lean_model.global_stiffness_csr is None
+    assert lean_model.stiffness_factor[0] == 'banded'
+    with pytest.raises(AnalysisError):
+        lean_model.get_element_forces()
+
+    full_model.perform_analysis()
+    lean_model.perform_analysis()
+    assert lean_model.element_forces is None
+    assert lean_model.support_reactions.shape == (2, 3)
+    assert np.allclose(lean_model.get_support_reactions(), full_model.get_support_reactions())
+    assert np.allclose(lean_model.get_element_forces(), full_model.get_element_forces(), atol=1e-6)
+
+    lean_model.update_loads(ploads=[PointLoad(location=120, magnitude=(0, -5, 0))])
+    lean_model.perform_analysis()
+    assert lean_model.get_support_reactions()[:, 1].sum() == pytest.approx(5 + 0.2*length)
+
+def test_invalid_low_memory():
+    with pytest.raises(TypeError):
+        BeamModel(beam=beam, low_memory='True')
+
+def test_interior_deflection_and_moment():
+    w = -0.1
+    beam_model = BeamModel(
+        beam=Beam(length=length, size=beam_size, supports=supports, ploads=[], dloads=[DistLoad(location=(0, length), magnitude=((0, 0), (w, w), (0, 0)))]),
+        max_node_spacing=100,
+    )
+    with pytest.raises(AnalysisError):
+        beam_model.get_deflection(length/2)
+    beam_model.perform_analysis()
+    EI = beam.e_mod*beam.mom_inertia
+    assert beam_model.get_deflection(length/2) == pytest.approx(5*w*length**4/(384*EI))
+    assert beam_model.get_moment([length/2, 50]) == pytest.approx([-w*length**2/8, -w*50*(length-50)/2])
+    with pytest.raises(ValueError):
+        beam_model.get_moment(length+1)
+
+def test_exact_elements_match_fine_mesh():
+    x = np.linspace(0, length, 81)
+    w = -0.05 - 0.2*np.sin(np.pi*x/length)
+    sampled_load = np.zeros(80, dtype=DistLoad.array_dtype)
+    sampled_load['x_i'] = x[:-1]
+    sampled_load['x_j'] = x[1:]
+    sampled_load['wy_i'] = w[:-1]
+    sampled_load['wy_j'] = w[1:]
+
+    fine_model = BeamModel(beam=Beam(length=length, size=beam_size, supports=supports, ploads=[], dloads=sampled_load), max_node_spacing=3)
+    exact_model = BeamModel(
+        beam=Beam(length=length, size=beam_size, supports=supports, ploads=[], dloads=sampled_load),
+        max_node_spacing=60,
+        element_type='exact',
+    )
+    assert len(exact_model.model_nodes) == 5
+    fine_model.perform_analysis()
+    exact_model.perform_analysis()
+
+    locations = [length/2, 47.0, 100.3]
+    assert exact_model.get_deflection(locations) == pytest.approx(fine_model.get_deflection(locations))
+    assert exact_model.get_moment(locations) == pytest.approx(fine_model.get_moment(locations))
+    assert exact_model.get_support_reactions() == pytest.approx(fine_model.get_support_reactions())
+
+def test_invalid_element_type():
+    with pytest.raises(TypeError):
+        BeamModel(beam=beam, element_type='cubic')
+
+def test_set_mesh_refinement():
+    beam_model = BeamModel(beam=Beam(length=length, size=beam_size, supports=supports, ploads=[], dloads=[]), max_node_spacing=24)
+    assert len(beam_model.model_nodes) == 11
+    beam_model.set_mesh_refinement([(100, 140)], 4)
+    spacing = np.diff(beam_model.model_nodes)
+    in_zone = (beam_model.model_nodes[:-1] >= 100) & (beam_model.model_nodes[1:] <= 140)
+    assert np.all(spacing[in_zone] <= 4 + 1e-9)
+    assert np.all(spacing[~in_zone] <= 24 + 1e-9)
+    assert len(beam_model.model_nodes) == 21
+    assert beam_model.analysis_ready
+    beam_model.set_mesh_refinement([], 4)
+    assert len(beam_model.model_nodes) == 11
+    with pytest.raises(TypeError):
+        beam_model.set_mesh_refinement([100, 140], 4)
+    with pytest.raises(TypeError):
+        beam_model.set_mesh_refinement([(100, 140)], 0)
+
+@pytest.mark.parametrize('solver', ['dense', 'banded'])
+def test_planar_bending_matches_full_model(solver):
+    loads = dict(
+        ploads=[PointLoad(location=60, magnitude=(0, -5, 20))],
+        dloads=[DistLoad(location=(30, 200), magnitude=((0, 0), (-0.1, -0.3), (0, 0)))],
+    )
+    full_model = BeamModel(beam=Beam(length=length, size=beam_size, supports=supports, **loads), solver=solver, planar_bending=False)
+    planar_model = BeamModel(beam=Beam(length=length, size=beam_size, supports=supports, **loads), solver=solver)
+    full_model.perform_analysis()
+    planar_model.perform_analysis()
+    assert len(planar_model.axial_dofs) + len(planar_model.bending_dofs) == planar_model.n_dof
+    assert planar_model.axial_factor is None
+    assert np.allclose(planar_model.global_displacement, full_model.global_displacement, rtol=1e-10, atol=1e-12)
+    assert np.allclose(planar_model.element_forces, full_model.element_forces, rtol=1e-8, atol=1e-6)
+
+    # Axial loads are solved with a separate factorization of the axial dof
+    axial_pload = [PointLoad(location=120, magnitude=(3, -5, 0))]
+    full_model.update_loads(ploads=axial_pload)
+    planar_model.update_loads(ploads=axial_pload)
+    full_model.perform_analysis()
+    planar_model.perform_analysis()
+    assert planar_model.axial_factor is not None
+    assert np.allclose(planar_model.global_displacement, full_model.global_displacement, rtol=1e-10, atol=1e-12)
+
+def test_invalid_planar_bending():
+    with pytest.raises(TypeError):
+        BeamModel(beam=beam, planar_bending=None)
+
+@pytest.mark.parametrize('low_memory', [False, True])
+def test_float32_precision_with_refinement(low_memory):
+    dloads = [DistLoad(location=(0, length), magnitude=((0, 0), (-0.1, -0.3), (0, 0)))]
+    ploads = [PointLoad(location=length/3, magnitude=(0, -5, 0))]
+    model_64 = BeamModel(beam=Beam(length=length, size=beam_size, supports=supports, ploads=ploads, dloads=dloads))
+    model_64.perform_analysis()
+    model_32 = BeamModel(
+        beam=Beam(length=length, size=beam_size, supports=supports, ploads=ploads, dloads=dloads),
+        low_memory=low_memory,
+        precision='float32',
+    )
+    model_32.perform_analysis()
+
+    assert model_32.global_displacement.dtype == np.float32
+    assert model_32.get_element_forces().dtype == np.float32
+    np.testing.assert_allclose(model_32.global_displacement, model_64.global_displacement, rtol=0, atol=1e-2*np.abs(model_64.global_displacement).max())
+
+    model_32.perform_analysis(refine=True)
+    assert model_32.global_displacement.dtype == np.float64
+    np.testing.assert_allclose(model_32.global_displacement, model_64.global_displacement, rtol=0, atol=1e-9*np.abs(model_64.global_displacement).max())
+    np.testing.assert_allclose(model_32.get_support_reactions(), model_64.get_support_reactions(), atol=1e-8)
+
+def test_invalid_precision():
+    with pytest.raises(TypeError):
+        BeamModel(beam=beam, precision='float16')
+    with pytest.raises(TypeError):
+        BeamModel(beam=beam).perform_analysis(refine=None)
+
+def test_support_map_cached_until_supports_change():
+    continuous_supports = [(0, (1, 1, 0)), (length/2, (0, 1, 0)), (length, (1, 1, 0))]
+    ploads = [PointLoad(location=length/4, magnitude=(0, -5, 0))]
+    model = BeamModel(beam=Beam(length=length, size=beam_size, supports=continuous_supports, ploads=ploads, dloads=[]))
+    model.perform_analysis()
+    dof_num = model.dof_num
+    support_nodes = model.support_nodes
+
+    # Load-only edits and re-initializing on the same mesh reuse the support map and dof numbering
+    model.add_beam_pload([PointLoad(location=length/4, magnitude=(0, -8, 0))], add_type='replace')
+    model.initialize_analysis()
+    assert model.dof_num is dof_num
+    assert model.stiffness_factor is not None
+    assert model.support_nodes is support_nodes
+    assert model.support_nodes == [0, model.get_node_index(length/2), len(model.model_nodes)-1]
+
+    # Changing the supports invalidates the cache on the next load edit
+    model.beam.supports = [(0, (1, 1, 1)), (length/2, (0, 1, 0)), (length, (1, 1, 0))]
+    model.add_beam_pload([PointLoad(location=length/4, magnitude=(0, -5, 0))], add_type='replace')
+    assert model.dof_num is not dof_num
+    assert model.dof_num[0] == [0, 0, 0]
+    assert model.n_dof == 3*len(model.model_nodes) - 6
+    assert model.stiffness_factor is None
+
+@pytest.mark.parametrize('element_type', ['standard', 'exact'])
+def test_analytical_solver_matches_fem(element_type):
+    loads = dict(
+        ploads=[PointLoad(location=60, magnitude=(2, -5, 10))],
+        dloads=[
+            DistLoad(location=(0, length), magnitude=((0, 0), (-0.1, -0.3), (0, 0))),
+            DistLoad(location=(45, 130), magnitude=((0, 0), (0, -0.2), (0, 0))),
+        ],
+    )
+    fem_model = BeamModel(beam=Beam(length=length, size=beam_size, supports=supports, **loads), solver='dense', element_type=element_type)
+    analytical_model = BeamModel(beam=Beam(length=length, size=beam_size, supports=supports, **loads), element_type=element_type)
+    assert analytical_model.global_stiffness is None
+    assert analytical_model.global_stiffness_csr is None
+
+    fem_model.perform_analysis()
+    analytical_model.perform_analysis()
+    scale = np.abs(fem_model.global_displacement).max()
+    np.testing.assert_allclose(analytical_model.global_displacement, fem_model.global_displacement, rtol=0, atol=1e-9*scale)
+    np.testing.assert_allclose(analytical_model.element_forces, fem_model.element_forces, rtol=0, atol=1e-6)
+    np.testing.assert_allclose(analytical_model.get_support_reactions(), fem_model.get_support_reactions(), rtol=0, atol=1e-6)
+
+def test_invalid_analytical_solver():
+    continuous_supports = [(0, (1, 1, 0)), (length/2, (0, 1, 0)), (length, (1, 1, 0))]
+    continuous_model = BeamModel(beam=Beam(length=length, size=beam_size, supports=continuous_supports, ploads=[], dloads=[]))
+    assert continuous_model.global_stiffness is not None
+
+    with pytest.raises(AnalysisError):
+        BeamModel(beam=Beam(length=length, size=beam_size, supports=continuous_supports, ploads=[], dloads=[]), solver='analytical')
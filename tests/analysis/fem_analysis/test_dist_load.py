@@ -44,4 +44,20 @@ def test_invalid_magnitude_component_length():
 def test_invalid_magnitude_inner_component():
     with pytest.raises(TypeError):
         DistLoad(location=location, magnitude=(('0', '0', '0'), ('0', '0', '0'), ('0', '0', '0')))
-        
\ No newline at end of file
+        
+def test_dload_array_roundtrip(valid_dload):
+    dload_array = DistLoad.to_array([valid_dload, valid_dload])
+    assert dload_array.dtype == DistLoad.array_dtype
+    assert len(dload_array) == 2
+    assert dload_array['wy_i'][0] == -2
+
+    dloads = DistLoad.from_array(dload_array)
+    assert len(dloads) == 2
+    assert dloads[0].location == location
+    assert dloads[0].magnitude == magnitude
+
+def test_invalid_dload_array():
+    with pytest.raises(TypeError):
+        DistLoad.from_array([(0, 10, 0, 0, -2, -2, 0, 0)])
+    with pytest.raises(TypeError):
+        DistLoad.to_array([None])
@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+from steelpy import aisc
+
+from pondpy import (
+    Beam,
+    BeamModel,
+    DistLoad,
+    PointLoad,
+    SteelBeamSize,
+)
+from pondpy.analysis.helpers import kernels
+
+length = 20*12
+supports = [(0, (1, 1, 0)), (length, (1, 1, 0))]
+
+w12x16 = aisc.W_shapes.W12X16
+beam_size = SteelBeamSize('W12X16', w12x16)
+
+rng = np.random.default_rng(0)
+n_elem = 12
+elem_nodes = np.column_stack((np.arange(n_elem), np.arange(1, n_elem+1)))
+elem_loads = rng.normal(size=(n_elem, 6))
+element_forces = rng.normal(size=(n_elem, 6))
+elem_dofs = np.arange(1, 3*(n_elem+1)+1).reshape(-1, 3)
+elem_dofs = np.hstack((elem_dofs[:-1], elem_dofs[1:]))
+elem_dofs[0, :2] = 0
+elem_dofs[-1, 3:5] = 0
+stiffness = rng.normal(size=(3, 6, 6))
+elem_index = rng.integers(0, 3, size=n_elem)
+
+def _loaded_beam():
+    dloads = [DistLoad(location=(0, length), magnitude=((0, 0), (-0.1, -0.3), (0, 0)))]
+    ploads = [PointLoad(location=length/3, magnitude=(0, -5, 0))]
+    return Beam(length=length, size=beam_size, supports=supports, ploads=ploads, dloads=dloads)
+
+def test_loop_kernels_match_numpy():
+    np.testing.assert_allclose(
+        kernels._node_fef_loop(elem_nodes, elem_loads, n_elem+1),
+        kernels._node_fef_numpy(elem_nodes, elem_loads, n_elem+1),
+    )
+    np.testing.assert_allclose(kernels._bmd_values_loop(element_forces), kernels._bmd_values_numpy(element_forces))
+    np.testing.assert_allclose(kernels._sfd_values_loop(element_forces), kernels._sfd_values_numpy(element_forces))
+
+    loop_triplets = kernels._stiffness_triplets_loop(elem_dofs, stiffness, elem_index)
+    numpy_triplets = kernels._stiffness_triplets_numpy(elem_dofs, stiffness, elem_index)
+    for loop_val, numpy_val in zip(loop_triplets, numpy_triplets):
+        np.testing.assert_allclose(loop_val, numpy_val)
+
+def test_jit_kernels_match_numpy():
+    pytest.importorskip('numba')
+
+    np.testing.assert_allclose(
+        kernels.node_fef(elem_nodes, elem_loads, n_elem+1, jit=True),
+        kernels.node_fef(elem_nodes, elem_loads, n_elem+1),
+    )
+    np.testing.assert_allclose(kernels.bmd_values(element_forces, jit=True), kernels.bmd_values(element_forces))
+    np.testing.assert_allclose(kernels.sfd_values(element_forces, jit=True), kernels.sfd_values(element_forces))
+
+    jit_triplets = kernels.stiffness_triplets(elem_dofs, stiffness, elem_index, jit=True)
+    numpy_triplets = kernels.stiffness_triplets(elem_dofs, stiffness, elem_index)
+    for jit_val, numpy_val in zip(jit_triplets, numpy_triplets):
+        np.testing.assert_allclose(jit_val, numpy_val)
+
+def test_backends_match():
+    numpy_model = BeamModel(beam=_loaded_beam(), backend='numpy')
+    numpy_model.perform_analysis()
+    auto_model = BeamModel(beam=_loaded_beam(), backend='auto')
+    auto_model.perform_analysis()
+
+    np.testing.assert_allclose(auto_model.global_displacement, numpy_model.global_displacement)
+    np.testing.assert_allclose(auto_model.get_element_forces(), numpy_model.get_element_forces())
+    np.testing.assert_allclose(auto_model.support_reactions, numpy_model.support_reactions)
+
+def test_invalid_backend():
+    with pytest.raises(TypeError):
+        BeamModel(beam=_loaded_beam(), backend='fortran')
+
+    if not kernels.NUMBA_AVAILABLE:
+        with pytest.raises(ImportError):
+            BeamModel(beam=_loaded_beam(), backend='numba')
@@ -28,3 +28,18 @@ def test_invalid_magnitude_length():
 def test_invalid_magnitude_components():
     with pytest.raises(TypeError):
         PointLoad(location=location, magnitude=('0', '5', '0'))
+
+def test_pload_array_roundtrip(valid_pload):
+    pload_array = PointLoad.to_array([valid_pload])
+    assert pload_array.dtype == PointLoad.array_dtype
+    assert pload_array['py'][0] == -5
+
+    ploads = PointLoad.from_array(pload_array)
+    assert ploads[0].location == location
+    assert ploads[0].magnitude == magnitude
+
+def test_invalid_pload_array():
+    with pytest.raises(TypeError):
+        PointLoad.from_array([(5, 0, -5, 9)])
+    with pytest.raises(TypeError):
+        PointLoad.to_array([None])
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 from flaky import flaky
 from joistpy import sji
@@ -100,3 +101,95 @@ def test_valid_generate_plots(roof_bay_model_default):
 def test_invalid_generate_plots(roof_bay_model_default):
     with pytest.raises(AnalysisError):
         plot_dict = roof_bay_model_default.generate_plots()
+
+def test_analyze_roof_bay_low_memory(roof_bay_model_default):
+    rl = roof_bay_model_default._get_secondary_rl(roof_bay_model_default.initial_impounded_depth)
+    roof_bay_model_default.analyze_roof_bay(rain_load=rl)
+
+    lean_model = RoofBayModel(roof_bay=roof_bay, low_memory=True)
+    lean_model.analyze_roof_bay(rain_load=rl)
+    for full, lean in zip(roof_bay_model_default.primary_models, lean_model.primary_models):
+        assert lean.element_forces is None
+        assert lean.get_support_reactions() == pytest.approx(full.get_support_reactions())
+
+def test_invalid_low_memory():
+    with pytest.raises(TypeError):
+        RoofBayModel(roof_bay=roof_bay, low_memory=None)
+
+def test_adaptive_mesh(roof_bay_model_default):
+    adaptive_model = RoofBayModel(roof_bay=roof_bay, adaptive_mesh=True)
+    uniform_dof = sum(model.n_dof for model in roof_bay_model_default.secondary_models)
+    adaptive_dof = sum(model.n_dof for model in adaptive_model.secondary_models)
+    assert adaptive_dof < uniform_dof
+
+    # The ponding front lies within the refined zone of each secondary member
+    for front, model in zip(adaptive_model.ponding_fronts, adaptive_model.secondary_models):
+        near_front = np.abs(model.model_nodes - front) <= 4*adaptive_model.max_node_spacing
+        assert np.all(np.diff(model.model_nodes)[near_front[:-1] & near_front[1:]] <= adaptive_model.max_node_spacing + 1e-9)
+
+    rl = adaptive_model._get_secondary_rl(adaptive_model.initial_impounded_depth)
+    adaptive_model.analyze_roof_bay(rain_load=rl)
+    front = adaptive_model.ponding_fronts[0]
+    assert adaptive_model._update_ponding_front(0, front + 1) == False
+
+    s_model = adaptive_model.secondary_models[0]
+    deflection = s_model.get_deflection(length/2)
+    assert adaptive_model._update_ponding_front(0, front - 60) == True
+    assert adaptive_model.ponding_fronts[0] == pytest.approx(front - 60)
+    assert s_model.get_deflection(length/2) == pytest.approx(deflection)
+
+def test_invalid_adaptive_mesh():
+    with pytest.raises(TypeError):
+        RoofBayModel(roof_bay=roof_bay, adaptive_mesh='True')
+
+def test_analyze_roof_bay_float32(roof_bay_model_default):
+    rl = roof_bay_model_default._get_secondary_rl(roof_bay_model_default.initial_impounded_depth)
+    roof_bay_model_default.analyze_roof_bay(rain_load=rl)
+
+    float32_model = RoofBayModel(roof_bay=roof_bay, precision='float32')
+    float32_model.analyze_roof_bay(rain_load=rl)
+    for p_model in float32_model.primary_models:
+        assert p_model.global_displacement.dtype == np.float32
+
+    float32_model.analyze_roof_bay(rain_load=rl, refine=True)
+    for full, refined in zip(roof_bay_model_default.primary_models, float32_model.primary_models):
+        assert refined.global_displacement.dtype == np.float64
+        assert refined.get_support_reactions() == pytest.approx(full.get_support_reactions(), rel=1e-8)
+
+def test_invalid_precision():
+    with pytest.raises(TypeError):
+        RoofBayModel(roof_bay=roof_bay, precision='float16')
+
+def test_influence_deflections_match_analysis(roof_bay_model_default):
+    rl = roof_bay_model_default._get_secondary_rl(roof_bay_model_default.initial_impounded_depth)
+    roof_bay_model_default.analyze_roof_bay(rain_load=rl)
+
+    influence_model = RoofBayModel(roof_bay=roof_bay, influence=True)
+    deflections = influence_model.get_influence_deflections(roof_bay_model_default.initial_impounded_depth)
+    for i_smodel, s_model in enumerate(roof_bay_model_default.secondary_models):
+        s_defl = [s_model.get_deflection(node) for node in s_model.model_nodes]
+        assert deflections['Secondary'][i_smodel] == pytest.approx(s_defl, abs=1e-9)
+
+    s_locations = roof_bay.secondary_spacing*np.arange(len(roof_bay_model_default.secondary_models))
+    for i_pmodel, p_model in enumerate(roof_bay_model_default.primary_models):
+        assert deflections['Primary'][i_pmodel] == pytest.approx(p_model.get_deflection(s_locations), abs=1e-9)
+
+def test_influence_matrices_keep_primary_loads(roof_bay_model_default):
+    rl = roof_bay_model_default._get_secondary_rl(roof_bay_model_default.initial_impounded_depth)
+    roof_bay_model_default.analyze_roof_bay(rain_load=rl)
+    ploads = [np.copy(p_model.beam.ploads) for p_model in roof_bay_model_default.primary_models]
+    reactions = [p_model.get_support_reactions() for p_model in roof_bay_model_default.primary_models]
+
+    roof_bay_model_default._create_influence_matrices()
+    for i_pmodel, p_model in enumerate(roof_bay_model_default.primary_models):
+        assert p_model.analysis_complete
+        assert np.array_equal(p_model.beam.ploads, ploads[i_pmodel])
+        assert p_model.get_support_reactions() == pytest.approx(reactions[i_pmodel])
+
+def test_invalid_influence(roof_bay_model_default):
+    with pytest.raises(TypeError):
+        RoofBayModel(roof_bay=roof_bay, influence='True')
+    with pytest.raises(TypeError):
+        RoofBayModel(roof_bay=roof_bay, adaptive_mesh=True, influence=True)
+    with pytest.raises(AnalysisError):
+        roof_bay_model_default.get_influence_deflections(roof_bay_model_default.initial_impounded_depth)
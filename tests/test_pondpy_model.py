@@ -1,5 +1,7 @@
 import os
+import numpy as np
 import pytest
+import warnings
 from flaky import flaky
 from joistpy import sji
 from steelpy import aisc
@@ -199,8 +201,390 @@ def test_invalid_stop_criterion():
             show_results=True
         )
 
+def test_invalid_low_memory():
+    with pytest.raises(TypeError):
+        PondPyModel(
+            primary_framing=primary_framing,
+            secondary_framing=secondary_framing,
+            loading=loading,
+            low_memory='True'
+        )
+
+def test_invalid_adaptive_mesh():
+    with pytest.raises(TypeError):
+        PondPyModel(
+            primary_framing=primary_framing,
+            secondary_framing=secondary_framing,
+            loading=loading,
+            adaptive_mesh='True'
+        )
+
+def test_invalid_influence():
+    with pytest.raises(TypeError):
+        PondPyModel(
+            primary_framing=primary_framing,
+            secondary_framing=secondary_framing,
+            loading=loading,
+            influence='True'
+        )
+    with pytest.raises(TypeError):
+        PondPyModel(
+            primary_framing=primary_framing,
+            secondary_framing=secondary_framing,
+            loading=loading,
+            adaptive_mesh=True,
+            influence=True
+        )
+
+def test_invalid_accelerator():
+    with pytest.raises(TypeError):
+        PondPyModel(
+            primary_framing=primary_framing,
+            secondary_framing=secondary_framing,
+            loading=loading,
+            accelerator='newton'
+        )
+    with pytest.raises(TypeError):
+        PondPyModel(
+            primary_framing=primary_framing,
+            secondary_framing=secondary_framing,
+            loading=loading,
+            accelerator='relaxation',
+            relaxation_factor=1.5
+        )
+
+def test_invalid_direct_solve():
+    with pytest.raises(TypeError):
+        PondPyModel(
+            primary_framing=primary_framing,
+            secondary_framing=secondary_framing,
+            loading=loading,
+            direct_solve='True'
+        )
+    with pytest.raises(TypeError):
+        PondPyModel(
+            primary_framing=primary_framing,
+            secondary_framing=secondary_framing,
+            loading=loading,
+            adaptive_mesh=True,
+            direct_solve=True
+        )
+
+def test_invalid_convergence_norm():
+    for convergence_norm in ['l3', [], ['weight', 'l1'], 2]:
+        with pytest.raises(TypeError):
+            PondPyModel(
+                primary_framing=primary_framing,
+                secondary_framing=secondary_framing,
+                loading=loading,
+                convergence_norm=convergence_norm
+            )
+
+def test_invalid_detect_divergence():
+    with pytest.raises(TypeError):
+        PondPyModel(
+            primary_framing=primary_framing,
+            secondary_framing=secondary_framing,
+            loading=loading,
+            detect_divergence='True'
+        )
+
 def test_perform_analysis(pondpy_model_default):
+    results = pondpy_model_default.perform_analysis()
+    assert results['Status'] == 'converged'
+    assert pondpy_model_default.analysis_complete
+
+def test_perform_analysis_adaptive_mesh(pondpy_model_default):
+    results = pondpy_model_default.perform_analysis()
+    adaptive_model = PondPyModel(
+        primary_framing=primary_framing,
+        secondary_framing=secondary_framing,
+        loading=loading,
+        show_results=False,
+        adaptive_mesh=True
+    )
+    adaptive_results = adaptive_model.perform_analysis()
+    assert adaptive_results['Weight'][-1] == pytest.approx(results['Weight'][-1], rel=2e-3)
+
+def test_perform_analysis_low_memory(pondpy_model_default):
+    results = pondpy_model_default.perform_analysis()
+    lean_model = PondPyModel(
+        primary_framing=primary_framing,
+        secondary_framing=secondary_framing,
+        loading=loading,
+        show_results=False,
+        low_memory=True
+    )
+    lean_results = lean_model.perform_analysis()
+    assert lean_results['Weight'][-1] == pytest.approx(results['Weight'][-1])
+
+def test_perform_analysis_influence(pondpy_model_default):
+    results = pondpy_model_default.perform_analysis()
+    influence_model = PondPyModel(
+        primary_framing=primary_framing,
+        secondary_framing=secondary_framing,
+        loading=loading,
+        show_results=False,
+        influence=True
+    )
+    influence_results = influence_model.perform_analysis()
+    assert influence_results['Iterations'] == results['Iterations']
+    assert influence_results['Weight'] == pytest.approx(results['Weight'], rel=1e-10)
+    for s_model, influence_s_model in zip(pondpy_model_default.roof_bay_model.secondary_models, influence_model.roof_bay_model.secondary_models):
+        assert influence_s_model.get_support_reactions() == pytest.approx(s_model.get_support_reactions())
+
+@pytest.mark.parametrize('accelerator', ['relaxation', 'aitken', 'anderson'])
+def test_perform_analysis_accelerator(accelerator):
+    results = PondPyModel(
+        primary_framing=primary_framing,
+        secondary_framing=secondary_framing,
+        loading=loading,
+        stop_criterion=1e-6,
+        show_results=False,
+    ).perform_analysis()
+    accelerated_results = PondPyModel(
+        primary_framing=primary_framing,
+        secondary_framing=secondary_framing,
+        loading=loading,
+        stop_criterion=1e-6,
+        show_results=False,
+        accelerator=accelerator
+    ).perform_analysis()
+    assert accelerated_results['Weight'][-1] == pytest.approx(results['Weight'][-1], rel=1e-4)
+
+def test_perform_analysis_direct_solve():
+    # The initial impounded water covers the whole roof bay at this slope
+    wet_framing = SecondaryFraming([s_beam1, s_joist1, s_joist2, s_beam2], slope=0.125)
+    iterative_model = PondPyModel(
+        primary_framing=primary_framing,
+        secondary_framing=wet_framing,
+        loading=loading,
+        stop_criterion=1e-9,
+        show_results=False,
+    )
+    results = iterative_model.perform_analysis()
+    direct_model = PondPyModel(
+        primary_framing=primary_framing,
+        secondary_framing=wet_framing,
+        loading=loading,
+        show_results=False,
+        direct_solve=True
+    )
+    direct_results = direct_model.perform_analysis()
+    assert direct_results['Iterations'] == 1
+    assert direct_results['Weight'][-1] == pytest.approx(results['Weight'][-1], rel=1e-8)
+    for s_model, direct_s_model in zip(iterative_model.roof_bay_model.secondary_models, direct_model.roof_bay_model.secondary_models):
+        assert direct_s_model.get_support_reactions() == pytest.approx(s_model.get_support_reactions(), rel=1e-6)
+
+def test_perform_analysis_direct_solve_new_primary_members():
+    # The primary member meshes have no nodes at the secondary member locations before the first analysis
+    long_support = [[0, (1, 1, 0)], [40*12, (1, 1, 0)]]
+    long_framing = PrimaryFraming([PrimaryMember(40*12, w16x26, long_support), PrimaryMember(40*12, w16x26, long_support)])
+    wet_framing = SecondaryFraming([s_beam1, s_joist1, s_joist2, s_beam2], slope=0.125)
+    direct_results = PondPyModel(
+        primary_framing=long_framing,
+        secondary_framing=wet_framing,
+        loading=loading,
+        show_results=False,
+        direct_solve=True
+    ).perform_analysis()
+    results = PondPyModel(
+        primary_framing=long_framing,
+        secondary_framing=wet_framing,
+        loading=loading,
+        stop_criterion=1e-9,
+        show_results=False,
+        influence=True
+    ).perform_analysis()
+    assert direct_results['Iterations'] == 1
+    assert direct_results['Weight'][-1] == pytest.approx(results['Weight'][-1], rel=1e-8)
+
+def test_perform_analysis_direct_solve_fallback(pondpy_model_default):
+    # The default roof bay has a wet/dry front, so the analysis iterates
+    results = pondpy_model_default.perform_analysis()
+    direct_results = PondPyModel(
+        primary_framing=primary_framing,
+        secondary_framing=secondary_framing,
+        loading=loading,
+        show_results=False,
+        direct_solve=True
+    ).perform_analysis()
+    assert direct_results['Iterations'] == results['Iterations']
+    assert direct_results['Weight'] == pytest.approx(results['Weight'])
+
+def test_perform_analysis_flat_roof():
+    # Water covers the whole flat roof bay, so the iteration converges to the direct solution
+    flat_framing = SecondaryFraming([s_beam1, s_joist1, s_joist2, s_beam2], slope=0.0)
+    with warnings.catch_warnings():
+        warnings.simplefilter('error', RuntimeWarning)
+        results = PondPyModel(
+            primary_framing=primary_framing,
+            secondary_framing=flat_framing,
+            loading=loading,
+            stop_criterion=1e-9,
+            show_results=False
+        ).perform_analysis()
+    direct_results = PondPyModel(
+        primary_framing=primary_framing,
+        secondary_framing=flat_framing,
+        loading=loading,
+        show_results=False,
+        direct_solve=True
+    ).perform_analysis()
+    assert results['Status'] == 'converged'
+    assert direct_results['Iterations'] == 1
+    assert results['Weight'][-1] == pytest.approx(direct_results['Weight'][-1], rel=1e-8)
+
+def test_get_ponding_stability(pondpy_model_default):
+    stability = pondpy_model_default.get_ponding_stability()
+    assert stability['Stable']
+    assert 0 < stability['Eigenvalue'] < 1
+    assert stability['Amplification Factor'] == pytest.approx(1/(1 - stability['Eigenvalue']))
+    assert stability['Margin'] == pytest.approx(1 - stability['Eigenvalue'])
+
+    # The stability check does not change the results of the iterative analysis
+    results = pondpy_model_default.perform_analysis()
+    default_results = PondPyModel(
+        primary_framing=primary_framing,
+        secondary_framing=secondary_framing,
+        loading=loading,
+        show_results=False
+    ).perform_analysis()
+    assert results['Weight'] == pytest.approx(default_results['Weight'])
+
+@pytest.mark.parametrize('accelerator', ['relaxation', 'aitken'])
+def test_accelerate_impounded_depth_before_analysis(accelerator):
+    pondpy_model = PondPyModel(
+        primary_framing=primary_framing,
+        secondary_framing=secondary_framing,
+        loading=loading,
+        show_results=False,
+        accelerator=accelerator,
+        relaxation_factor=0.7
+    )
+    s_models = pondpy_model.roof_bay_model.secondary_models
+
+    def step(impounded_depth):
+        rain_load = pondpy_model.roof_bay_model._get_secondary_rl(impounded_depth)
+        pondpy_model.roof_bay_model.analyze_roof_bay(rain_load=rain_load)
+        nodes = [s_model.model_nodes for s_model in s_models]
+        next_depth = pondpy_model._calculate_next_impounded_depth()
+        depth = pondpy_model._accelerate_impounded_depth(impounded_depth, next_depth, nodes)
+        flatten = lambda d: np.concatenate([d['Secondary'][i_smodel] for i_smodel in range(len(s_models))])
+        return flatten(impounded_depth), flatten(next_depth), depth, flatten(depth)
+
+    # The first step of both accelerators relaxes the update by relaxation_factor
+    x0, g0, depth, x1 = step(pondpy_model.impounded_depth)
+    assert len(depth['Secondary']) == len(s_models)
+    assert x1 == pytest.approx(np.maximum(x0 + 0.7*(g0 - x0), 0))
+    assert np.all(x1 >= 0)
+
+    # The second step adapts the factor from the change in residual (Aitken) or keeps it (relaxation)
+    _, g1, _, x2 = step(depth)
+    factor = 0.7
+    if accelerator == 'aitken':
+        d_residual = (g1 - x1) - (g0 - x0)
+        factor = -0.7*np.dot(g0 - x0, d_residual)/np.dot(d_residual, d_residual)
+    assert x2 == pytest.approx(np.maximum(x1 + factor*(g1 - x1), 0))
+    assert np.all(x2 >= 0)
+
+def test_perform_analysis_relaxation_accuracy():
+    # At the default stop_criterion, relaxation must not stop further from the solution than plain iteration
+    long_support = [[0, (1, 1, 0)], [40*12, (1, 1, 0)]]
+    wet_framing = SecondaryFraming([s_beam1, s_joist1, s_joist2, s_beam2], slope=0.125)
+
+    weights = {}
+    for option in [{'direct_solve':True}, {'accelerator':'none'}, {'accelerator':'relaxation'}]:
+        long_framing = PrimaryFraming([PrimaryMember(40*12, w16x26, long_support, ploads=[]), PrimaryMember(40*12, w16x26, long_support, ploads=[])])
+        results = PondPyModel(
+            primary_framing=long_framing,
+            secondary_framing=wet_framing,
+            loading=loading,
+            show_results=False,
+            **option
+        ).perform_analysis()
+        weights[list(option.values())[0]] = results['Weight'][-1]
+
+    assert abs(weights['relaxation'] - weights[True]) <= abs(weights['none'] - weights[True])
+
+@flaky
+def test_get_ponding_stability_after_analysis(pondpy_model_default):
     pondpy_model_default.perform_analysis()
+    reactions = [p_model.get_support_reactions() for p_model in pondpy_model_default.roof_bay_model.primary_models]
+
+    pondpy_model_default.get_ponding_stability()
+    for i_pmodel, p_model in enumerate(pondpy_model_default.roof_bay_model.primary_models):
+        assert p_model.get_support_reactions() == pytest.approx(reactions[i_pmodel])
+    pondpy_model_default.generate_report(output_folder=output_folder)
+
+def test_get_ponding_stability_unstable():
+    long_support = [[0, (1, 1, 0)], [56*12, (1, 1, 0)]]
+    long_framing = PrimaryFraming([PrimaryMember(56*12, w16x26, long_support), PrimaryMember(56*12, w16x26, long_support)])
+    stability = PondPyModel(
+        primary_framing=long_framing,
+        secondary_framing=secondary_framing,
+        loading=loading,
+        show_results=False
+    ).get_ponding_stability()
+    assert not stability['Stable']
+    assert stability['Eigenvalue'] > 1
+    assert stability['Amplification Factor'] == np.inf
+
+@pytest.mark.parametrize('influence', [False, True])
+@pytest.mark.parametrize('convergence_norm', ['l2', 'linf', 'reactions', ['weight', 'l2', 'linf', 'reactions']])
+def test_perform_analysis_convergence_norm(convergence_norm, influence):
+    results = PondPyModel(
+        primary_framing=primary_framing,
+        secondary_framing=secondary_framing,
+        loading=loading,
+        stop_criterion=1e-6,
+        show_results=False
+    ).perform_analysis()
+    norm_results = PondPyModel(
+        primary_framing=primary_framing,
+        secondary_framing=secondary_framing,
+        loading=loading,
+        stop_criterion=1e-6,
+        show_results=False,
+        influence=influence,
+        convergence_norm=convergence_norm
+    ).perform_analysis()
+    assert norm_results['Status'] == 'converged'
+    assert norm_results['Weight'][-1] == pytest.approx(results['Weight'][-1], rel=1e-5)
+    for residuals in norm_results['Residuals'].values():
+        assert len(residuals) == norm_results['Iterations']
+        assert residuals[-1] <= 1e-6
+
+def test_perform_analysis_divergence():
+    long_support = [[0, (1, 1, 0)], [56*12, (1, 1, 0)]]
+    long_framing = PrimaryFraming([PrimaryMember(56*12, w16x26, long_support), PrimaryMember(56*12, w16x26, long_support)])
+    pondpy_model = PondPyModel(
+        primary_framing=long_framing,
+        secondary_framing=secondary_framing,
+        loading=loading,
+        show_results=False
+    )
+    results = pondpy_model.perform_analysis()
+    assert results['Status'] == 'diverged'
+    assert results['Iterations'] < pondpy_model.max_iter
+    assert not pondpy_model.analysis_complete
+
+    results = PondPyModel(
+        primary_framing=long_framing,
+        secondary_framing=secondary_framing,
+        loading=loading,
+        show_results=False,
+        max_iter=10,
+        detect_divergence=False
+    ).perform_analysis()
+    assert results['Status'] == 'max_iter'
+    assert results['Iterations'] == 10
+
+def test_check_divergence(pondpy_model_default):
+    assert pondpy_model_default._check_divergence([1.0, 2.0, 2.5, 2.75, 2.875, 2.9375]) is None
+    assert pondpy_model_default._check_divergence([1.0, 2.0, 4.0, 8.0, 16.0]) == 'diverged'
+    assert pondpy_model_default._check_divergence([1.0, 2.0, 0.0, 3.0, -1.0, 4.0]) == 'oscillating'
+    assert pondpy_model_default._check_divergence([1.0, float('inf')]) == 'diverged'
 
 @flaky
 def test_valid_generate_report(pondpy_model_default):